@@ -0,0 +1,7 @@
+# coding: utf-8
+"""
+Offline benchmarks for the potentials package written in the asv (airspeed
+velocity) style.  They use the tests/testdb database and synthetic data, so
+no network access is needed.  Run them with asv using the asv.conf.json in
+the repository root, or without asv using python -m benchmarks.
+"""
@@ -0,0 +1,166 @@
+# coding: utf-8
+"""
+Minimal runner for the asv-style benchmarks that does not need asv or network
+access.  The time_ and timeraw_ benchmarks are timed, and the values returned
+by track_ benchmarks are reported in their unit attribute.  Results can be saved and compared with earlier results using the
+regressions_thresholds in asv.conf.json.
+
+Examples
+--------
+Run all benchmarks and save the results::
+
+    python -m benchmarks --save results/baseline.json
+
+Run the paramfile benchmarks and check them against a baseline::
+
+    python -m benchmarks --bench bench_paramfile --compare results/baseline.json
+"""
+# Standard Python libraries
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+from pathlib import Path
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+benchmark_dir = Path(__file__).parent
+asv_conf = Path(benchmark_dir.parent, 'asv.conf.json')
+
+def load_thresholds() -> dict:
+    """Reads the regressions_thresholds from asv.conf.json"""
+    # asv.conf.json allows // comment lines
+    lines = asv_conf.read_text(encoding='UTF-8').splitlines()
+    lines = [line for line in lines if not line.strip().startswith('//')]
+    return json.loads('\n'.join(lines)).get('regressions_thresholds', {})
+
+def threshold(name: str, thresholds: dict) -> float:
+    """Returns the largest threshold whose pattern matches a benchmark name"""
+    matches = [value for pattern, value in thresholds.items()
+               if re.match(pattern, name)]
+    return max(matches, default=0.0)
+
+def iter_benchmarks(pattern: str = ''):
+    """
+    Yields (name, cls, methodname, params) for all benchmarks whose full
+    names match a regex pattern.
+    """
+    for fname in sorted(benchmark_dir.glob('bench_*.py')):
+        module = importlib.import_module(f'benchmarks.{fname.stem}')
+        for clsname, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            params = getattr(cls, 'params', [])
+            if len(params) > 0 and not isinstance(params, tuple):
+                params = (params,)
+            for methodname in sorted(vars(cls)):
+                if not methodname.startswith(('time_', 'timeraw_', 'track_')):
+                    continue
+                name = f'{fname.stem}.{clsname}.{methodname}'
+                if re.search(pattern, name):
+                    yield name, cls, methodname, params
+
+def run(cls, methodname: str, params: tuple, repeat: int, caches: dict) -> dict:
+    """
+    Runs a benchmark for all parameter combinations.  The setup_cache
+    results are stored in caches so that they are shared by all benchmarks
+    of a class.
+    """
+    results = {}
+    instance = cls()
+    cache = []
+    if hasattr(instance, 'setup_cache'):
+        if cls not in caches:
+            caches[cls] = instance.setup_cache()
+        cache = [caches[cls]]
+
+    for combo in itertools.product(*params):
+        args = cache + list(combo)
+        times = []
+        for i in range(repeat):
+            if hasattr(instance, 'setup'):
+                instance.setup(*args)
+            method = getattr(instance, methodname)
+            if methodname.startswith('track_'):
+                start = None
+                times.append(method(*args))
+            elif methodname.startswith('timeraw_'):
+                code = method(*combo)
+                start = time.perf_counter()
+                subprocess.run([sys.executable, '-c', code], check=True)
+            else:
+                start = time.perf_counter()
+                method(*args)
+            if start is not None:
+                times.append(time.perf_counter() - start)
+            if hasattr(instance, 'teardown'):
+                instance.teardown(*args)
+        results[', '.join(repr(p) for p in combo)] = min(times)
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bench', default='',
+                        help='regex for the benchmark names to run')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timed runs; the minimum is reported')
+    parser.add_argument('--save', help='json file to save the results to')
+    parser.add_argument('--compare', help='json file of earlier results')
+    args = parser.parse_args()
+
+    results = {}
+    caches = {}
+    try:
+        for name, cls, methodname, params in iter_benchmarks(args.bench):
+            for combo, seconds in run(cls, methodname, params, args.repeat,
+                                      caches).items():
+                key = f'{name}({combo})' if combo else name
+                results[key] = seconds
+                unit = getattr(getattr(cls, methodname), 'unit', None)
+                if unit is None:
+                    print(f'{key:<80} {seconds:10.4f} s', flush=True)
+                else:
+                    print(f'{key:<80} {seconds:10.4g} {unit}', flush=True)
+    finally:
+        # The setup_cache methods return temporary directories of built data
+        for tmpdir in caches.values():
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    if args.save is not None:
+        try:
+            commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                    text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, 'w', encoding='UTF-8') as f:
+            json.dump({'commit': commit, 'python': platform.python_version(),
+                       'machine': platform.node(), 'results': results}, f, indent=4)
+
+    if args.compare is not None:
+        with open(args.compare, encoding='UTF-8') as f:
+            baseline = json.load(f)['results']
+        thresholds = load_thresholds()
+        regressions = []
+        print()
+        for key, seconds in results.items():
+            if key not in baseline or baseline[key] == 0:
+                continue
+            ratio = seconds / baseline[key]
+            limit = 1 + threshold(key, thresholds)
+            flag = 'REGRESSION' if ratio > limit else ''
+            print(f'{key:<80} {ratio:6.2f}x (limit {limit:.2f}x) {flag}')
+            if ratio > limit:
+                regressions.append(key)
+        if len(regressions) > 0:
+            print(f'\n{len(regressions)} benchmark(s) regressed')
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
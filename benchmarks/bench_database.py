@@ -0,0 +1,105 @@
+# coding: utf-8
+"""
+Benchmarks for Database queries against offline local-style databases.
+Written in the asv style.
+"""
+# Standard Python libraries
+from pathlib import Path
+import shutil
+import tempfile
+
+import potentials
+
+from .common import build_synthetic_library, kim_fullid, synthetic_lammps_records
+
+class TimeGetRecords():
+    """
+    Times get_records merging and sorting a local library with a remote
+    library that shares half of its records.
+    """
+    params = [100, 500]
+    param_names = ['numrecords']
+    timeout = 600
+
+    def setup_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        for numrecords in self.params:
+            local = Path(tmpdir, str(numrecords), 'local')
+            remote = Path(tmpdir, str(numrecords), 'remote')
+            build_synthetic_library(local, numrecords)
+            build_synthetic_library(remote, numrecords + numrecords // 2)
+            for name in sorted(Path(remote, 'Potential').glob('*.json'))[::2]:
+                name.unlink()
+
+            # Build the metadata caches outside of the timed runs
+            db = potentials.Database(localpath=local, remote_style='local',
+                                     remote_host=remote)
+            db.get_records('Potential')
+        return tmpdir
+
+    def setup(self, tmpdir, numrecords):
+        self.db = potentials.Database(
+            localpath=Path(tmpdir, str(numrecords), 'local'),
+            remote_style='local',
+            remote_host=Path(tmpdir, str(numrecords), 'remote'))
+
+    def time_get_records(self, tmpdir, numrecords):
+        self.db.get_records('Potential')
+
+    def time_get_records_df(self, tmpdir, numrecords):
+        self.db.get_records('Potential', return_df=True)
+
+    def time_get_records_lazy(self, tmpdir, numrecords):
+        self.db.get_records('Potential', lazy=True)
+
+class TimeLammpsPotentials():
+    """
+    Times get_lammps_potentials with KIM models expanded into an entry per
+    associated potential.
+    """
+    params = [30, 300]
+    param_names = ['numrecords']
+    timeout = 600
+
+    def setup_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        for numrecords in self.params:
+            db = potentials.Database(localpath=Path(tmpdir, str(numrecords)),
+                                     remote=False)
+            records = synthetic_lammps_records(numrecords)
+            for style in ['potential_LAMMPS', 'potential_LAMMPS_KIM']:
+                db.save_records([r for r in records if r.style == style])
+        return tmpdir
+
+    def setup(self, tmpdir, numrecords):
+        self.db = potentials.Database(localpath=Path(tmpdir, str(numrecords)),
+                                      remote=False)
+        self.kim_models = [kim_fullid(i) for i in range(numrecords // 3)]
+
+    def time_get_lammps_potentials(self, tmpdir, numrecords):
+        self.db.get_lammps_potentials(kim_models=self.kim_models)
+
+    def time_get_kim_lammps_potentials(self, tmpdir, numrecords):
+        self.db.get_kim_lammps_potentials(kim_models=self.kim_models)
+
+    def time_get_lammps_potentials_symbols(self, tmpdir, numrecords):
+        self.db.get_lammps_potentials(kim_models=self.kim_models, symbols='Al')
+
+class TimeRelatedModelsLookup():
+    """Times related model lookups through the Database"""
+
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = potentials.Database(localpath=self.tmpdir, remote=False)
+        Path(self.tmpdir, 'related-interactions.json').write_text('{}')
+        for i in range(5000):
+            interaction = f'int{i % 50}'
+            self.db.add_related_models(f'pot{i}', interaction, f'pot{i // 7}')
+        self.potids = [f'pot{i}' for i in range(0, 5000, 5)]
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def time_get_related_models(self):
+        for potid in self.potids:
+            self.db.get_related_models(potid)
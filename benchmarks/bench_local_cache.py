@@ -0,0 +1,50 @@
+# coding: utf-8
+"""
+Benchmarks for building the metadata cache of large local libraries.  Written
+in the asv style, but can also be run directly with
+python -m benchmarks.bench_local_cache.
+"""
+# Standard Python libraries
+from pathlib import Path
+import shutil
+import tempfile
+import time
+
+import potentials
+
+from .common import build_synthetic_library
+
+class TimeLocalCache():
+    """Times get_records(lazy=True) on an uncached synthetic library"""
+    params = ([500, 5000], [None, 4])
+    param_names = ['numrecords', 'max_workers']
+    timeout = 1200
+
+    def setup_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        for numrecords in self.params[0]:
+            build_synthetic_library(Path(tmpdir, str(numrecords)), numrecords)
+        return tmpdir
+
+    def setup(self, tmpdir, numrecords, max_workers):
+        self.host = Path(tmpdir, str(numrecords))
+        Path(self.host, 'Potential.csv').unlink(missing_ok=True)
+        self.db = potentials.Database(localpath=self.host, remote=False)
+
+    def time_get_records(self, tmpdir, numrecords, max_workers):
+        self.db.get_records('Potential', lazy=True, max_workers=max_workers)
+
+if __name__ == '__main__':
+    import sys
+    numrecords = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    tmpdir = Path(tempfile.mkdtemp())
+    try:
+        build_synthetic_library(tmpdir, numrecords)
+        for max_workers in [None, 2, 4, 8]:
+            Path(tmpdir, 'Potential.csv').unlink(missing_ok=True)
+            db = potentials.Database(localpath=tmpdir, remote=False)
+            start = time.perf_counter()
+            db.get_records('Potential', lazy=True, max_workers=max_workers)
+            print(f'max_workers={max_workers}: {time.perf_counter() - start:.2f} s')
+    finally:
+        shutil.rmtree(tmpdir)
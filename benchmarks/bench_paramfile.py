@@ -0,0 +1,173 @@
+# coding: utf-8
+"""
+Benchmarks for reading, writing and evaluating parameter files.  Written in
+the asv style.
+"""
+# Standard Python libraries
+import io
+from pathlib import Path
+import shutil
+import tempfile
+import tracemalloc
+
+# https://numpy.org/
+import numpy as np
+
+# https://matplotlib.org/
+import matplotlib.pyplot as plt
+
+import potentials
+
+from .common import synthetic_abop, synthetic_eam_alloy, synthetic_tersoff
+
+class TimeEAMAlloy():
+    """Times loading and building eam/alloy setfl files of various sizes"""
+    params = ([1000, 10000, 100000], [1, 3])
+    param_names = ['numtable', 'numsymbols']
+    timeout = 600
+
+    def setup(self, numtable, numsymbols):
+        self.eam = synthetic_eam_alloy(numsymbols, numr=numtable, numrho=numtable)
+        self.text = self.eam.build()
+
+    def time_build(self, numtable, numsymbols):
+        self.eam.build()
+
+    def time_load(self, numtable, numsymbols):
+        potentials.paramfile.EAMAlloy(io.StringIO(self.text))
+
+    def time_load_eam(self, numtable, numsymbols):
+        # The funcfl style is attempted and rejected before eam/alloy
+        potentials.paramfile.load_eam(io.StringIO(self.text))
+
+    def time_rphi_r_spline(self, numtable, numsymbols):
+        symbol = self.eam.symbols[-1]
+        self.eam.rphi_r([symbol, symbol], r=self.eam.r[1:-1] + 1e-4)
+
+    def time_rphi_r_derivative(self, numtable, numsymbols):
+        for symbol in self.eam.symbols:
+            self.eam.rphi_r(symbol, derivative=2)
+
+    def time_numderivative(self, numtable, numsymbols):
+        potentials.tools.numderivative(self.eam.r, self.eam.rphi_r(self.eam.symbols[0]), n=3)
+
+    def peakmem_load(self, numtable, numsymbols):
+        potentials.paramfile.EAMAlloy(io.StringIO(self.text))
+
+class TimeEAMFS():
+    """Times loading eam/fs setfl files whose cross-density tables repeat for all partners"""
+    params = ([10000, 100000], [3, 6])
+    param_names = ['numtable', 'numsymbols']
+    timeout = 600
+
+    def setup(self, numtable, numsymbols):
+        eam = synthetic_eam_alloy(numsymbols, numr=numtable, numrho=numtable)
+        self.text = potentials.paramfile.eam_alloy_to_eam_fs(eam).build()
+
+    def time_load(self, numtable, numsymbols):
+        potentials.paramfile.EAMFS(io.StringIO(self.text))
+
+    def peakmem_load(self, numtable, numsymbols):
+        potentials.paramfile.EAMFS(io.StringIO(self.text))
+
+class TrackEAMFSDtype():
+    """Tracks the memory and accuracy of eam/fs tables stored as float64 and float32"""
+    params = ([10000, 100000], [3], ['float64', 'float32'])
+    param_names = ['numtable', 'numsymbols', 'dtype']
+    timeout = 600
+
+    def setup(self, numtable, numsymbols, dtype):
+        eam = synthetic_eam_alloy(numsymbols, numr=numtable, numrho=numtable)
+        self.text = potentials.paramfile.eam_alloy_to_eam_fs(eam).build()
+        self.reference = potentials.paramfile.EAMFS(io.StringIO(self.text))
+
+    def time_load(self, numtable, numsymbols, dtype):
+        potentials.paramfile.EAMFS(io.StringIO(self.text), dtype=dtype)
+
+    def track_retained_bytes(self, numtable, numsymbols, dtype):
+        tracemalloc.start()
+        try:
+            fs = potentials.paramfile.EAMFS(io.StringIO(self.text), dtype=dtype)
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+    track_retained_bytes.unit = 'bytes'
+
+    def track_max_relative_error(self, numtable, numsymbols, dtype):
+        fs = potentials.paramfile.EAMFS(io.StringIO(self.text), dtype=dtype)
+        r = self.reference.r[1:-1] + self.reference.deltar / 3
+        error = 0.0
+        for s1 in fs.symbols:
+            for s2 in fs.symbols:
+                ref = self.reference.rphi_r([s1, s2], r=r)
+                value = fs.rphi_r([s1, s2], r=r)
+                scale = np.maximum(np.abs(ref), 1e-300)
+                error = max(error, np.max(np.abs(value - ref) / scale))
+        return error
+    track_max_relative_error.unit = 'relative'
+
+class TimeEAMFSPlot():
+    """Times drawing all rho(r) curves of eam/fs tables with and without decimation"""
+    params = ([10000, 100000], [3], [None, 10000])
+    param_names = ['numtable', 'numsymbols', 'max_points']
+    timeout = 600
+
+    def setup(self, numtable, numsymbols, max_points):
+        plt.switch_backend('Agg')
+        eam = synthetic_eam_alloy(numsymbols, numr=numtable, numrho=numtable)
+        self.eam = potentials.paramfile.eam_alloy_to_eam_fs(eam)
+
+    def teardown(self, numtable, numsymbols, max_points):
+        plt.close('all')
+
+    def time_plot_rho_r(self, numtable, numsymbols, max_points):
+        symbols = [[s1, s2] for s1 in self.eam.symbols for s2 in self.eam.symbols]
+        fig = self.eam.plot_rho_r(symbols, n=1, max_points=max_points)
+        fig.canvas.draw()
+
+class TimeTersoff():
+    """Times generating Tersoff parameter file contents"""
+    params = ([2, 4, 6, 8, 10], ['tersoff', 'tersoff/zbl'])
+    param_names = ['numsymbols', 'pair_style']
+    timeout = 600
+
+    def setup(self, numsymbols, pair_style):
+        self.tersoff = synthetic_tersoff(numsymbols, pair_style)
+
+    def time_text(self, numsymbols, pair_style):
+        self.tersoff.text()
+
+
+class TimeTersoffABOP():
+    """Times converting ABOP parameter files to Tersoff parameters"""
+    params = ([2, 4, 6, 8, 10], [False, True])
+    param_names = ['numsymbols', 'zbl']
+    timeout = 600
+
+    def setup(self, numsymbols, zbl):
+        self.tmpdir = tempfile.mkdtemp()
+        self.fname = Path(self.tmpdir, 'params.abop')
+        synthetic_abop(self.fname, numsymbols, zbl=zbl, nummods=numsymbols)
+
+    def teardown(self, numsymbols, zbl):
+        shutil.rmtree(self.tmpdir)
+
+    def time_abop(self, numsymbols, zbl):
+        potentials.paramfile.Tersoff.abop(self.fname)
+
+class TimeTersoffLoad():
+    """Times reading Tersoff parameter files and round trips through text"""
+    params = ([4, 10, 20], ['tersoff', 'tersoff/zbl'])
+    param_names = ['numsymbols', 'pair_style']
+    timeout = 600
+
+    def setup(self, numsymbols, pair_style):
+        self.tersoff = synthetic_tersoff(numsymbols, pair_style)
+        self.text = self.tersoff.text()
+
+    def time_load(self, numsymbols, pair_style):
+        potentials.paramfile.Tersoff.load(io.StringIO(self.text))
+
+    def time_round_trip(self, numsymbols, pair_style):
+        text = self.tersoff.text()
+        potentials.paramfile.Tersoff.load(io.StringIO(text), pair_style=pair_style).text()
@@ -0,0 +1,59 @@
+# coding: utf-8
+"""
+Benchmarks for generating LAMMPS input lines from records and for importing
+the package.  Written in the asv style.
+"""
+# Standard Python libraries
+import json
+import random
+
+import potentials
+
+from .common import synthetic_lammps_records
+from .synthetic import citation_model
+
+class TimePairInfo():
+    """Times PotentialLAMMPS.pair_info for different numbers of symbols"""
+    params = [1, 2, 3]
+    param_names = ['numsymbols']
+
+    def setup(self, numsymbols):
+        records = synthetic_lammps_records(3)
+        self.record = records[numsymbols - 1]
+        self.kimrecord = records[-1]
+        self.kimrecord.select_potential(potid=self.kimrecord.potentials[0].id)
+
+    def time_pair_info(self, numsymbols):
+        self.record.pair_info()
+
+    def time_pair_info_kim(self, numsymbols):
+        self.kimrecord.pair_info(self.kimrecord.symbols[:numsymbols])
+
+    def time_load_model(self, numsymbols):
+        potentials.load_record('potential_LAMMPS', model=self.record.model)
+
+class TimeLoadCitations():
+    """
+    Times loading many Citation records with and without accessing the
+    bibtex that is generated from their fields.
+    """
+    params = [1000, 5000]
+    param_names = ['numcitations']
+
+    def setup(self, numcitations):
+        rng = random.Random(0)
+        self.models = [json.dumps(citation_model(rng, i)) for i in range(numcitations)]
+
+    def time_load(self, numcitations):
+        for model in self.models:
+            potentials.load_record('Citation', model=model)
+
+    def time_load_bibtex(self, numcitations):
+        for model in self.models:
+            potentials.load_record('Citation', model=model).bibtex
+
+class TimeImport():
+    """Times importing the package in a fresh interpreter"""
+
+    def timeraw_import_potentials(self):
+        return 'import potentials'
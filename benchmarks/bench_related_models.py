@@ -0,0 +1,62 @@
+# coding: utf-8
+"""
+Benchmarks for building and querying the related models.  Written in the asv
+style, but can also be run directly as a script.
+"""
+# Standard Python libraries
+import random
+import time
+
+from potentials.Database import RelatedModels
+
+def random_relations(numrelations: int,
+                     numinteractions: int = 50,
+                     seed: int = 12345) -> list:
+    """Generates random (interaction, potid, relid) relations"""
+    rng = random.Random(seed)
+    numpotids = numrelations // 2 + 1
+    relations = []
+    for i in range(numrelations):
+        interaction = f'int{rng.randrange(numinteractions)}'
+        potid = f'pot{rng.randrange(numpotids)}'
+        if rng.random() < 0.2:
+            relid = None
+        else:
+            relid = f'pot{rng.randrange(numpotids)}'
+        relations.append((interaction, potid, relid))
+    return relations
+
+def build(relations: list) -> RelatedModels:
+    """Bulk adds relations to a new RelatedModels object"""
+    related_models = RelatedModels()
+    for interaction, potid, relid in relations:
+        related_models.add(interaction, potid, relid)
+    return related_models
+
+class TimeRelatedModels():
+    """Times bulk adding, looking up and serializing related models"""
+    params = [1000, 10000, 100000]
+    param_names = ['numrelations']
+
+    def setup(self, numrelations):
+        self.relations = random_relations(numrelations)
+        self.related_models = build(self.relations)
+
+    def time_add(self, numrelations):
+        build(self.relations)
+
+    def time_related(self, numrelations):
+        for _, potid, _ in self.relations[:1000]:
+            self.related_models.related(potid)
+
+    def time_asdict(self, numrelations):
+        self.related_models.asdict()
+
+if __name__ == '__main__':
+    for numrelations in TimeRelatedModels.params:
+        relations = random_relations(numrelations)
+        start = time.perf_counter()
+        build(relations)
+        duration = time.perf_counter() - start
+        print(f'{numrelations:>7} relations: {duration:.3f} s '
+              f'({1e6 * duration / numrelations:.2f} us per relation)')
@@ -0,0 +1,350 @@
+# coding: utf-8
+"""
+Local HTTP stand-in for the remote CDCS database.  It serves the records of a
+local-style database, such as one made by benchmarks.synthetic, using the
+subset of the CDCS REST API that the cdcs package uses for template lookups,
+paged mongo and keyword queries and query counts.  Artifact files saved in
+record folders are served at the urls given in the records.
+
+Example::
+
+    with CDCSStandIn('/tmp/synthdb') as server:
+        db = potentials.Database(localpath='/tmp/mirror',
+                                 remote_host=server.url,
+                                 remote_style='cdcs',
+                                 remote_terms={'username': ''})
+        db.download_all()
+
+It can also be run as ``python -m benchmarks.cdcs_standin HOST --port 8000``.
+"""
+# Standard Python libraries
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse, unquote
+
+# https://github.com/usnistgov/DataModelDict
+from DataModelDict import DataModelDict as DM
+
+from .synthetic import synthetic_url
+
+record_date = '2020-01-01T00:00:00.000000Z'
+
+def field_values(content: Any, path: list) -> list:
+    """
+    Returns all values found at a dotted path, where lists at any level are
+    searched element-wise as done by mongo.
+    """
+    if isinstance(content, list):
+        values = []
+        for item in content:
+            values.extend(field_values(item, path))
+        return values
+    if len(path) == 0:
+        return [content]
+    if isinstance(content, dict) and path[0] in content:
+        return field_values(content[path[0]], path[1:])
+    return []
+
+def compare(value: Any, op: str, target: Any) -> bool:
+    """Evaluates a mongo comparison operator for a single value"""
+    if op == '$in':
+        return any(compare(value, '$eq', t) for t in target)
+    if op == '$eq':
+        return value == target or str(value) == str(target)
+    if op == '$regex':
+        return re.search(target, str(value)) is not None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return False
+    if op == '$gte':
+        return value >= target
+    if op == '$lte':
+        return value <= target
+    if op == '$gt':
+        return value > target
+    if op == '$lt':
+        return value < target
+    raise ValueError(f'unsupported query operator {op}')
+
+def mongo_match(content: dict, query: dict) -> bool:
+    """
+    Checks if record content matches the subset of mongo find queries built
+    by the record classes: $and, $or, $in, $regex, $exists, ranges and
+    equality.
+    """
+    for key, condition in query.items():
+        if key == '$and':
+            if not all(mongo_match(content, q) for q in condition):
+                return False
+        elif key == '$or':
+            if not any(mongo_match(content, q) for q in condition):
+                return False
+        else:
+            values = field_values(content, key.split('.'))
+            if isinstance(condition, dict) and all(k.startswith('$') for k in condition):
+                for op, target in condition.items():
+                    if op == '$exists':
+                        if (len(values) > 0) != bool(target):
+                            return False
+                    elif op == '$options':
+                        continue
+                    elif not any(compare(v, op, target) for v in values):
+                        return False
+            elif not any(compare(v, '$eq', condition) for v in values):
+                return False
+    return True
+
+class CDCSStandIn():
+    """
+    Threaded HTTP server that answers CDCS REST queries from the records of a
+    local-style database.
+    """
+    def __init__(self,
+                 host: Path,
+                 address: str = '127.0.0.1',
+                 port: int = 0,
+                 page_size: int = 10,
+                 latency: float = 0.0):
+        """
+        Class initializer.  The server is not started until start() is
+        called.
+
+        Parameters
+        ----------
+        host : path-like object
+            The local-style database directory containing the records.
+        address : str, optional
+            The address to bind to.  Default value is '127.0.0.1'.
+        port : int, optional
+            The port to bind to.  Default value of 0 selects a free port.
+        page_size : int, optional
+            The number of records per page of query results.  Default value
+            is 10, which matches CDCS.
+        latency : float, optional
+            Seconds to wait before answering each request, for simulating the
+            network.  Default value is 0.0.
+        """
+        self.__host = Path(host)
+        self.page_size = page_size
+        self.latency = latency
+        self.__records = {}
+        self.__lock = threading.Lock()
+        self.requests = 0
+
+        standin = self
+        class Handler(RequestHandler):
+            server_standin = standin
+        self.__server = ThreadingHTTPServer((address, port), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = None
+
+    def __enter__(self) -> 'CDCSStandIn':
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def host(self) -> Path:
+        """pathlib.Path : The local-style database directory being served"""
+        return self.__host
+
+    @property
+    def url(self) -> str:
+        """str : The base url of the server"""
+        address, port = self.__server.server_address[:2]
+        return f'http://{address}:{port}'
+
+    def start(self):
+        """Starts serving in a background thread"""
+        self.__thread = threading.Thread(target=self.__server.serve_forever,
+                                         daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stops the server"""
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def styles(self) -> list:
+        """Returns the record styles, i.e. template titles, being served"""
+        return sorted(path.name for path in self.host.iterdir()
+                      if path.is_dir() and Path(self.host, f'{path.name}.csv').is_file())
+
+    def records(self, style: str) -> list:
+        """
+        Returns the (name, content, xml) entries of a record style.  The
+        records are read once and kept in memory.
+        """
+        with self.__lock:
+            if style not in self.__records:
+                entries = []
+                for fname in sorted(Path(self.host, style).glob('*.json')):
+                    text = fname.read_text(encoding='UTF-8')
+                    content = json.loads(text)
+                    xml = DM(text).xml().replace(synthetic_url, self.url)
+                    entries.append((fname.stem, content, xml))
+                self.__records[style] = entries
+            return self.__records[style]
+
+    def query(self,
+              templates: list,
+              title: Optional[str] = None,
+              mongoquery: Optional[dict] = None,
+              keyword: Optional[str] = None) -> list:
+        """Returns the result entries of all records matching a query"""
+        results = []
+        for style in templates:
+            for name, content, xml in self.records(style):
+                if title is not None and name != title:
+                    continue
+                if mongoquery is not None and not mongo_match(content, mongoquery):
+                    continue
+                if keyword is not None and keyword not in xml:
+                    continue
+                results.append({
+                    'id': f'{style}/{name}', 'template': style,
+                    'workspace': None, 'user_id': '1', 'title': name,
+                    'xml_content': xml, 'creation_date': record_date,
+                    'last_modification_date': record_date,
+                    'last_change_date': record_date})
+        return results
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Handles the CDCS REST calls for a CDCSStandIn"""
+    server_standin = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, content: Any, status: int = 200):
+        body = json.dumps(content).encode('UTF-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_not_found(self):
+        self.send_json({'message': 'Not found'}, status=404)
+
+    def prepare(self) -> tuple:
+        """Applies latency and counts the request, then splits the url"""
+        standin = self.server_standin
+        standin.requests += 1
+        if standin.latency > 0:
+            time.sleep(standin.latency)
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        return standin, url.path, params
+
+    def do_GET(self):
+        standin, path, params = self.prepare()
+
+        if path == '/rest/template-version-manager/global/':
+            title = params.get('title', None)
+            managers = []
+            for style in standin.styles():
+                if title is None or title == style:
+                    managers.append({
+                        'id': f'{style}-manager', 'versions': [style],
+                        'current': style, 'disabled_versions': [],
+                        'title': style, 'user': None, 'is_disabled': False,
+                        '_cls': 'VersionManager.TemplateVersionManager',
+                        'creation_date': record_date, 'display_rank': 1})
+            self.send_json(managers)
+
+        elif path.startswith('/rest/template/'):
+            style = path.split('/')[3]
+            if style not in standin.styles():
+                return self.send_not_found()
+            self.send_json({'id': style, 'user': None, 'filename': f'{style}.xsd',
+                            'checksum': None, 'content': '', 'hash': '',
+                            'dependencies': [], '_display_name': style})
+
+        elif path in ('/rest/data/', '/rest/blob/'):
+            # Record and blob listings are only used for existence checks
+            self.send_json([])
+
+        elif path.startswith('/files/'):
+            fname = Path(standin.host, *unquote(path[len('/files/'):]).split('/'))
+            if '..' in fname.parts or not fname.is_file():
+                return self.send_not_found()
+            body = fname.read_bytes()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        else:
+            # Includes /rest/core-settings/, which identifies this as CDCS 2
+            self.send_not_found()
+
+    def do_POST(self):
+        standin, path, params = self.prepare()
+        length = int(self.headers.get('Content-Length', 0))
+        data = {k: v[-1] for k, v in
+                parse_qs(self.rfile.read(length).decode('UTF-8')).items()}
+
+        if path not in ('/rest/data/query/', '/rest/data/query/keyword/'):
+            return self.send_not_found()
+
+        if 'templates' in data:
+            templates = [t['id'] for t in json.loads(data['templates'])]
+        else:
+            templates = standin.styles()
+        if path == '/rest/data/query/':
+            mongoquery = json.loads(data.get('query', '{}'))
+            keyword = None
+        else:
+            mongoquery = None
+            keyword = data.get('query', None)
+        results = standin.query(templates, title=data.get('title', None),
+                                mongoquery=mongoquery, keyword=keyword)
+
+        # Paginate the results
+        page = int(params.get('page', 1))
+        size = standin.page_size
+        start = (page - 1) * size
+        if page > 1 and start >= len(results):
+            return self.send_not_found()
+        if start + size < len(results):
+            next_url = f'{standin.url}{path}?page={page + 1}'
+        else:
+            next_url = None
+        self.send_json({'count': len(results), 'next': next_url,
+                        'previous': None if page == 1 else f'{standin.url}{path}?page={page - 1}',
+                        'results': results[start:start + size]})
+
+def main():
+    parser = argparse.ArgumentParser(description='Serves a local-style database as a CDCS stand-in')
+    parser.add_argument('host', help='the local-style database directory to serve')
+    parser.add_argument('--address', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds to wait before answering each request')
+    args = parser.parse_args()
+
+    server = CDCSStandIn(args.host, address=args.address, port=args.port,
+                         latency=args.latency)
+    print(f'Serving {args.host} at {server.url}')
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
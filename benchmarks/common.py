@@ -0,0 +1,150 @@
+# coding: utf-8
+"""
+Shared offline data for the benchmarks: the test database and synthetic
+parameter files and LAMMPS potential records.
+"""
+# Standard Python libraries
+import json
+from pathlib import Path
+import uuid
+
+import numpy as np
+
+import potentials
+from potentials.record.Artifact import Artifact
+
+testdb_host = Path(Path(__file__).parent.parent, 'tests', 'testdb')
+
+def build_synthetic_library(host: Path, numrecords: int):
+    """Builds a local library of Potential records copied from the testdb"""
+    src = sorted(Path(testdb_host, 'Potential').glob('*.json'))
+    models = [json.loads(fname.read_text(encoding='UTF-8')) for fname in src]
+    dest = Path(host, 'Potential')
+    dest.mkdir(parents=True, exist_ok=True)
+    for i in range(numrecords):
+        model = models[i % len(models)]
+        pid = model['interatomic-potential']['id']
+        model['interatomic-potential']['id'] = f'{pid}-{i}'
+        with open(Path(dest, f'potential.{pid}-{i}.json'), 'w', encoding='UTF-8') as f:
+            json.dump(model, f)
+        model['interatomic-potential']['id'] = pid
+
+elements = ['Al', 'Ni', 'Cu', 'Fe', 'Ti', 'Zr', 'Mg', 'Si', 'Ag', 'Au',
+            'Pd', 'Pt', 'Co', 'Cr', 'Mo', 'W', 'Ta', 'Nb', 'V', 'Zn']
+
+def synthetic_eam_alloy(numsymbols: int = 2,
+                        numr: int = 10000,
+                        numrho: int = 10000) -> potentials.paramfile.EAMAlloy:
+    """Builds an EAMAlloy with smooth tabulated functions of the given sizes"""
+    symbols = elements[:numsymbols]
+    eam = potentials.paramfile.EAMAlloy(
+        header='Synthetic benchmark potential', symbol=symbols,
+        number=list(range(1, numsymbols + 1)), mass=[1.0] * numsymbols,
+        alat=[4.0] * numsymbols, lattice=['fcc'] * numsymbols,
+        numr=numr, cutoffr=6.0, numrho=numrho, cutoffrho=50.0)
+    r = eam.r
+    rho = eam.rho
+    for i, symbol in enumerate(symbols):
+        scale = 1.0 + 0.1 * i
+        eam.set_F_rho(symbol, table=-scale * np.sqrt(rho))
+        eam.set_rho_r(symbol, table=scale * np.exp(-r))
+        for symbol2 in symbols[:i + 1]:
+            eam.set_rphi_r([symbol, symbol2],
+                           table=r * (np.exp(-2 * (r - 2.5)) - 2 * np.exp(-(r - 2.5))))
+    return eam
+
+def synthetic_tersoff(numsymbols: int = 3,
+                      pair_style: str = 'tersoff') -> potentials.paramfile.Tersoff:
+    """Builds a Tersoff object with varied parameter values"""
+    tersoff = potentials.paramfile.Tersoff(elements[:numsymbols], pair_style=pair_style)
+    params = tersoff.params
+    for i, key in enumerate(params.keys()[3:]):
+        if params[key].dtype.kind == 'f':
+            params[key] = np.linspace(0.1, 10.0 * (i + 1), len(params))
+    return tersoff
+
+def synthetic_abop(fname: Path,
+                   numsymbols: int = 3,
+                   zbl: bool = False,
+                   nummods: int = 0):
+    """
+    Writes an ABOP parameter file with a parameter set for each pair of the
+    first numsymbols elements and nummods 3-body modifications.
+    """
+    rng = np.random.default_rng(numsymbols)
+    symbols = elements[:numsymbols]
+    pairs = [(el1, el2) for i, el1 in enumerate(symbols) for el2 in symbols[i:]]
+    num = len(pairs)
+    table = {
+        'el1': [pair[0] for pair in pairs],
+        'el2': [pair[1] for pair in pairs],
+        'D0': rng.uniform(1.0, 5.0, num),
+        'r0': rng.uniform(2.0, 3.0, num),
+        'β': rng.uniform(1.0, 2.0, num),
+        'S': rng.uniform(1.2, 3.0, num),
+        'γ': rng.uniform(0.001, 1.0, num),
+        'c': rng.uniform(0.1, 5.0, num),
+        'd': rng.uniform(0.1, 5.0, num),
+        'h': rng.uniform(-1.0, 1.0, num),
+        'R': rng.uniform(3.0, 4.0, num),
+        'D': rng.uniform(0.1, 0.3, num),
+        'α': rng.uniform(0.0, 2.0, num),
+        'ω': rng.uniform(0.5, 2.0, num),
+    }
+    if zbl:
+        table['bf'] = rng.uniform(5.0, 15.0, num)
+        table['rf'] = rng.uniform(0.5, 1.5, num)
+
+    lines = [' '.join([key] + [str(v) for v in values]) for key, values in table.items()]
+    if nummods > 0:
+        lines.append('3 body mods')
+        for i in range(nummods):
+            key = 'αω'[i % 2]
+            e1, e2, e3 = rng.choice(symbols, 3)
+            lines.append(f'{key} {e1} {e2} {e3} {rng.uniform(0.5, 2.0)}')
+    Path(fname).write_text('\n'.join(lines) + '\n', encoding='UTF-8')
+
+def kim_fullid(i: int) -> str:
+    """Returns the full KIM id for the ith synthetic KIM model"""
+    return f'EAM_Dynamo_Synthetic_2000_AlNi__MO_{i:012d}_005'
+
+def synthetic_lammps_records(numrecords: int) -> list:
+    """
+    Builds potential_LAMMPS records along with potential_LAMMPS_KIM records
+    for one third as many KIM models, each associated with two potentials.
+    """
+    records = []
+    for i in range(numrecords):
+        symbols = elements[:1 + i % 3]
+        potid = f'2000--Synthetic-{i}--{"-".join(symbols)}'
+        record = potentials.load_record(
+            'potential_LAMMPS', id=f'{potid}--LAMMPS--ipr1',
+            key=str(uuid.UUID(int=2 * i)), potid=potid,
+            potkey=str(uuid.UUID(int=2 * i + 1)), pair_style='eam/alloy',
+            elements=symbols, artifacts=[
+                Artifact(filename=f'{potid}.eam.alloy',
+                         url=f'https://example.com/{potid}.eam.alloy')])
+        record.pair_coeff_paramfile(f'{potid}.eam.alloy')
+
+        # Reload from the model so that the records match database contents
+        records.append(potentials.load_record(
+            'potential_LAMMPS', model=record.build_model().json()))
+
+    for i in range(max(numrecords // 3, 1)):
+        model = {'potential-LAMMPS-KIM': {
+            'key': str(uuid.UUID(int=10**9 + 3 * i)),
+            'id': kim_fullid(i)[:-4],
+            'potential': [
+                {'key': str(uuid.UUID(int=10**9 + 3 * i + 1)),
+                 'id': f'2000--Synthetic-KIM-{i}--Al-Ni',
+                 'atom': [{'symbol': 'Al', 'element': 'Al'},
+                          {'symbol': 'Ni', 'element': 'Ni'}]},
+                {'key': str(uuid.UUID(int=10**9 + 3 * i + 2)),
+                 'id': f'2000--Synthetic-KIM-{i}--Al',
+                 'atom': {'symbol': 'Al', 'element': 'Al'}}],
+            'full-kim-id': kim_fullid(i)}}
+        records.append(potentials.load_record(
+            'potential_LAMMPS_KIM', model=json.dumps(model),
+            name=f'MO_{i:012d}'))
+
+    return records
@@ -0,0 +1,249 @@
+# coding: utf-8
+"""
+Generator of large synthetic repositories for scale testing.  Realistic
+Citation, Potential, potential_LAMMPS (with artifact files) and
+potential_LAMMPS_KIM records are written to a local-style database, which can
+then be used directly as a local or remote, or served over HTTP with
+benchmarks.cdcs_standin.
+
+Example::
+
+    python -m benchmarks.synthetic /tmp/synthdb --potentials 10000 --citations 50000 --kim 2000
+"""
+# Standard Python libraries
+import argparse
+import json
+from pathlib import Path
+import random
+import time
+import uuid
+
+import potentials
+from potentials.record.Artifact import Artifact
+
+# Placeholder base url of the artifact links.  The HTTP stand-in replaces it
+# with its own address.
+synthetic_url = 'https://synthetic.potentials.invalid'
+
+surnames = ['Adams', 'Baskes', 'Chen', 'Daw', 'Erhart', 'Foiles', 'Garcia',
+            'Hale', 'Ivanov', 'Jelinek', 'Kim', 'Lee', 'Mendelev', 'Nguyen',
+            'Oh', 'Purja Pun', 'Quinn', 'Rossi', 'Sato', 'Tersoff', 'Ullah',
+            'Vasquez', 'Wang', 'Xu', 'Yamada', 'Zhou']
+journals = ['Physical Review B', 'Physical Review Materials',
+            'Acta Materialia', 'Philosophical Magazine',
+            'Modelling and Simulation in Materials Science and Engineering',
+            'Journal of Applied Physics', 'Computational Materials Science']
+elements = ['Ag', 'Al', 'Au', 'Co', 'Cr', 'Cu', 'Fe', 'Ga', 'Ge', 'Hf', 'In',
+            'Mg', 'Mn', 'Mo', 'Nb', 'Ni', 'Pb', 'Pd', 'Pt', 'Si', 'Sn', 'Ta',
+            'Ti', 'V', 'W', 'Zn', 'Zr', 'C', 'H', 'O', 'N']
+pair_styles = ['eam', 'eam/alloy', 'eam/fs', 'meam', 'tersoff']
+extensions = {'eam': 'eam', 'eam/alloy': 'eam.alloy', 'eam/fs': 'eam.fs',
+              'meam': 'meam', 'tersoff': 'tersoff'}
+
+def random_uuid(rng: random.Random) -> str:
+    """Returns a reproducible UUID4 string"""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+def citation_model(rng: random.Random, i: int) -> dict:
+    """Builds the data model of the ith synthetic citation"""
+    authors = [{'given-name': f'{rng.choice("ABCDEFGHJKLMNPRSTW")}.',
+                'surname': rng.choice(surnames)}
+               for j in range(rng.randint(1, 5))]
+    year = rng.randint(1980, 2024)
+    journal = rng.choice(journals)
+    volume = rng.randint(1, 120)
+    page = rng.randint(1, 9000)
+    pages = f'{page}-{page + rng.randint(2, 30)}'
+    title = f'Interatomic potential study number {i} of {rng.choice(elements)} alloys'
+    doi = f'10.99999/synthetic.{i}'
+    bibauthors = ' and '.join(f'{a["given-name"]} {a["surname"]}' for a in authors)
+    key = authors[0]['surname'].replace(' ', '_')
+    bibtex = (f'@article{{{key}_{year}_{i},\n author = {{{bibauthors}}},\n'
+              f' doi = {{{doi}}},\n journal = {{{journal}}},\n'
+              f' pages = {{{pages.replace("-", "--")}}},\n title = {{{title}}},\n'
+              f' volume = {{{volume}}},\n year = {{{year}}}\n}}\n\n')
+    return {'citation': {
+        'document-type': 'journal', 'title': title, 'author': authors,
+        'publication-name': journal, 'publication-date': {'year': year},
+        'volume': volume, 'pages': pages, 'DOI': doi, 'bibtex': bibtex}}
+
+def potential_id(citation: dict, symbols: list) -> str:
+    """Builds a potential id in the repository's year--authors--elements style"""
+    content = citation['citation']
+    authors = '-'.join(f'{a["surname"].replace(" ", "-")}-{a["given-name"].strip(".")}'
+                       for a in content['author'][:3])
+    return f'{content["publication-date"]["year"]}--{authors}--{"-".join(symbols)}'
+
+def artifact_content(rng: random.Random, size: int) -> bytes:
+    """Generates tabulated-looking artifact file content of a given size"""
+    line = ' '.join(f'{rng.uniform(-10, 10):24.16e}' for i in range(5)) + '\n'
+    content = ('synthetic parameter file\n' + line * (size // len(line) + 1))
+    return content[:size].encode('UTF-8')
+
+def generate_repository(host: Path,
+                        numpotentials: int = 10000,
+                        numcitations: int = 50000,
+                        numkim: int = 2000,
+                        artifact_size: int = 100000,
+                        seed: int = 12345,
+                        verbose: bool = False) -> list:
+    """
+    Generates a synthetic repository in a local-style database.  Each
+    potential has a unique citation and one potential_LAMMPS implementation
+    with artifact files, while the KIM models are each associated with one or
+    two of the potentials.  The remaining citations are not referenced by any
+    potential.
+
+    Parameters
+    ----------
+    host : path-like object
+        The local-style database directory to create or add to.
+    numpotentials : int, optional
+        The number of Potential and potential_LAMMPS records.  Default value
+        is 10000.
+    numcitations : int, optional
+        The number of Citation records.  Values less than numpotentials are
+        raised to numpotentials.  Default value is 50000.
+    numkim : int, optional
+        The number of potential_LAMMPS_KIM records.  Default value is 2000.
+    artifact_size : int, optional
+        The size in bytes of each artifact file.  Default value is 100000.
+    seed : int, optional
+        The random seed, which makes the generated content reproducible.
+    verbose : bool, optional
+        If True, progress messages are printed.  Default value is False.
+
+    Returns
+    -------
+    list
+        The full KIM ids of the generated KIM models, which are also saved to
+        kim_models.txt in host.
+    """
+    rng = random.Random(seed)
+    host = Path(host)
+    host.mkdir(parents=True, exist_ok=True)
+    db = potentials.Database(localpath=host, remote=False)
+    numcitations = max(numcitations, numpotentials)
+
+    def save(style, records):
+        start = time.perf_counter()
+        report = db.save_records(records, overwrite=True)
+        if verbose:
+            print(f'{len(report["added"]) + len(report["updated"])} {style} records '
+                  f'saved in {time.perf_counter() - start:.1f} s')
+
+    # Citations
+    citations = [citation_model(rng, i) for i in range(numcitations)]
+    save('Citation', [potentials.load_record('Citation', model=json.dumps(model))
+                      for model in citations])
+
+    # Potentials and their LAMMPS implementations
+    pots = []
+    lammps_records = []
+    potids = set()
+    for i in range(numpotentials):
+        symbols = sorted(rng.sample(elements, rng.choice([1, 1, 2, 2, 3, 4])))
+        potid = potential_id(citations[i], symbols)
+        if potid in potids:
+            potid = f'{potid}-{i}'
+        potids.add(potid)
+        potkey = random_uuid(rng)
+        pair_style = rng.choice(pair_styles)
+        lammpsid = f'{potid}--LAMMPS--ipr1'
+        lammpskey = random_uuid(rng)
+        if pair_style == 'eam':
+            filenames = [f'{symbol}.eam' for symbol in symbols]
+        elif pair_style == 'meam':
+            filenames = ['library.meam', f'{"".join(symbols)}.meam']
+        else:
+            filenames = [f'{"".join(symbols)}.{extensions[pair_style]}']
+        urls = [f'{synthetic_url}/files/potential_LAMMPS/{lammpsid}/{filename}'
+                for filename in filenames]
+
+        citation = citations[i]['citation']
+        pots.append({'interatomic-potential': {
+            'key': potkey, 'id': potid, 'record-version': '2020-01-01',
+            'description': {'citation': citation},
+            'implementation': {
+                'key': lammpskey, 'id': lammpsid, 'status': 'active',
+                'date': '2020-01-01', 'type': f'LAMMPS pair_style {pair_style}',
+                'artifact': [{'web-link': {'URL': url, 'link-text': filename}}
+                             for url, filename in zip(urls, filenames)]},
+            'element': symbols}})
+
+        record = potentials.load_record(
+            'potential_LAMMPS', id=lammpsid, key=lammpskey, potid=potid,
+            potkey=potkey, dois=citation['DOI'], pair_style=pair_style,
+            elements=symbols, artifacts=[Artifact(filename=filename, url=url)
+                                         for url, filename in zip(urls, filenames)])
+        if pair_style == 'eam':
+            record.pair_coeff_eam(filenames)
+        elif pair_style == 'meam':
+            record.pair_coeff_meam(*filenames)
+        else:
+            record.pair_coeff_paramfile(filenames[0])
+        lammps_records.append(potentials.load_record(
+            'potential_LAMMPS', model=record.build_model().json()))
+
+        # Write the artifacts to the record's folder
+        folder = Path(host, 'potential_LAMMPS', lammpsid)
+        folder.mkdir(parents=True, exist_ok=True)
+        for filename in filenames:
+            Path(folder, filename).write_bytes(artifact_content(rng, artifact_size))
+
+    save('Potential', [potentials.load_record('Potential', model=json.dumps(model))
+                       for model in pots])
+    save('potential_LAMMPS', lammps_records)
+
+    # KIM models
+    kim_models = []
+    kim_records = []
+    for i in range(numkim):
+        shortcode = f'MO_{rng.randrange(10**12):012d}'
+        while shortcode in kim_models:
+            shortcode = f'MO_{rng.randrange(10**12):012d}'
+        indices = rng.sample(range(numpotentials), min(numpotentials, rng.choice([1, 1, 2])))
+        potinfos = []
+        for j in indices:
+            content = pots[j]['interatomic-potential']
+            potinfos.append({
+                'key': content['key'], 'id': content['id'],
+                'doi': content['description']['citation']['DOI'],
+                'atom': [{'symbol': s, 'element': s} for s in content['element']]})
+        surname = citations[indices[0]]['citation']['author'][0]['surname']
+        year = citations[indices[0]]['citation']['publication-date']['year']
+        symbols = ''.join(potinfos[0]['atom'][k]['symbol']
+                          for k in range(len(potinfos[0]['atom'])))
+        base = f'EAM_Dynamo_{surname.replace(" ", "")}_{year}_{symbols}__{shortcode}'
+        fullids = [f'{base}_{v:03d}' for v in range(rng.randint(0, 2) + 1)]
+        kim_models.append(shortcode)
+        kim_records.append(potentials.load_record(
+            'potential_LAMMPS_KIM', name=shortcode, model=json.dumps(
+                {'potential-LAMMPS-KIM': {
+                    'key': random_uuid(rng), 'id': base, 'potential': potinfos,
+                    'full-kim-id': fullids}})))
+    save('potential_LAMMPS_KIM', kim_records)
+
+    # List the newest version of each KIM model as installed
+    fullids = [record.fullkimids[-1] for record in kim_records]
+    Path(host, 'kim_models.txt').write_text('\n'.join(fullids), encoding='UTF-8')
+    return fullids
+
+def main():
+    parser = argparse.ArgumentParser(description='Generates a synthetic potentials repository')
+    parser.add_argument('host', help='the local-style database directory to create')
+    parser.add_argument('--potentials', type=int, default=10000)
+    parser.add_argument('--citations', type=int, default=50000)
+    parser.add_argument('--kim', type=int, default=2000)
+    parser.add_argument('--artifact-size', type=int, default=100000,
+                        help='size of each artifact file in bytes')
+    parser.add_argument('--seed', type=int, default=12345)
+    args = parser.parse_args()
+
+    generate_repository(args.host, numpotentials=args.potentials,
+                        numcitations=args.citations, numkim=args.kim,
+                        artifact_size=args.artifact_size, seed=args.seed,
+                        verbose=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+# coding: utf-8
+# Standard Python libraries
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import inspect
+from typing import Any, Callable, Optional
+
+# Local imports
+from . import Database
+
+# Methods that always access the remote database or other web resources
+network_prefixes = ('download_', 'upload_', 'fetch_', 'remote_query')
+
+# Database methods given asynchronous versions
+async_methods = (
+    'get_records', 'get_record', 'retrieve_record', 'download_records',
+    'remote_query', 'upload_record', 'delete_record', 'save_record',
+    'save_records',
+    'get_citations', 'get_citation', 'retrieve_citation', 'fetch_citation',
+    'fetch_citations', 'download_citations', 'upload_citation', 'save_citation', 'delete_citation',
+    'get_potentials', 'get_potential', 'retrieve_potential', 'download_potentials',
+    'upload_potential', 'save_potential', 'delete_potential',
+    'get_actions', 'get_action', 'retrieve_action', 'download_actions',
+    'upload_action', 'save_action', 'delete_action',
+    'get_requests', 'get_request', 'retrieve_request', 'download_requests',
+    'upload_request', 'save_request', 'delete_request',
+    'get_faqs', 'get_faq', 'retrieve_faq', 'download_faqs',
+    'upload_faq', 'save_faq', 'delete_faq',
+    'load_related_models', 'get_related_models', 'save_related_models',
+    'get_kim_lammps_potentials',
+    'get_lammps_potentials', 'get_lammps_potential',
+    'download_lammps_potentials', 'get_lammps_potential_files',
+    'retrieve_lammps_potential', 'upload_lammps_potential',
+    'save_lammps_potential', 'delete_lammps_potential',
+    'download_all', 'render_html', 'validate_records',
+)
+
+class AsyncDatabase():
+    """
+    Asyncio facade for a Database.  Each Database method listed in
+    async_methods has a coroutine version here that runs the blocking method
+    in a thread pool executor so that multiple remote queries, downloads and
+    citation fetches can run concurrently on an event loop.  Calls that
+    access the remote database or the web are limited to max_connections at
+    a time, while local-only calls only go through the executor.  The
+    returned values are the same as for the Database methods, except that
+    methods with a prompt parameter never prompt for input: prompt=False is
+    used and prompt=True is rejected.  Note that calls that write records of
+    the same style to the local database should not be run concurrently.
+    """
+    def __init__(self,
+                 database: Optional[Database] = None,
+                 max_connections: int = 8,
+                 max_workers: Optional[int] = None,
+                 **kwargs):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        database : Database, optional
+            The Database to wrap.  If not given, a new Database is initialized
+            using kwargs.
+        max_connections : int, optional
+            The maximum number of calls that access the remote database or
+            the web that can run at the same time.  Default value is 8.
+        max_workers : int, optional
+            The number of executor threads.  Default value is max_connections
+            plus 4 so that local calls are not blocked by remote calls.
+        **kwargs : any, optional
+            Parameters for initializing a new Database.  Cannot be given with
+            database.
+        """
+        if database is None:
+            database = Database(**kwargs)
+        elif len(kwargs) > 0:
+            raise ValueError('Database kwargs cannot be given with database')
+        if max_connections < 1:
+            raise ValueError('max_connections must be >= 1')
+        if max_workers is None:
+            max_workers = max_connections + 4
+
+        self.__database = database
+        self.__max_connections = max_connections
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.__semaphores = {}
+
+    async def __aenter__(self) -> 'AsyncDatabase':
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    @property
+    def database(self) -> Database:
+        """Database : The wrapped synchronous Database"""
+        return self.__database
+
+    @property
+    def max_connections(self) -> int:
+        """int : The maximum number of concurrent remote calls"""
+        return self.__max_connections
+
+    def close(self):
+        """Shuts down the executor after the running calls finish"""
+        self.__executor.shutdown(wait=True)
+
+    def __semaphore(self) -> asyncio.Semaphore:
+        """Gets the connection limiting semaphore for the running loop"""
+        loop = asyncio.get_running_loop()
+        try:
+            return self.__semaphores[loop]
+        except KeyError:
+            semaphore = asyncio.Semaphore(self.__max_connections)
+            self.__semaphores = {loop: semaphore}
+            return semaphore
+
+    def uses_network(self, name: str, kwargs: dict) -> bool:
+        """
+        Determines if a call to a Database method accesses the remote
+        database or the web.
+
+        Parameters
+        ----------
+        name : str
+            The Database method name.
+        kwargs : dict
+            The arguments of the call by parameter name, such as the
+            arguments of a BoundArguments object.
+
+        Returns
+        -------
+        bool
+            True if the call is limited by max_connections.
+        """
+        if name.startswith(network_prefixes):
+            return True
+        remote = kwargs.get('remote', None)
+        if remote is None:
+            remote = self.database.remote
+        return bool(remote)
+
+    async def run(self,
+                  fxn: Callable,
+                  *args,
+                  network: bool = True,
+                  **kwargs) -> Any:
+        """
+        Runs a blocking function in the executor.
+
+        Parameters
+        ----------
+        fxn : callable
+            The function to run.
+        *args : any
+            Positional arguments for fxn.
+        network : bool, optional
+            If True (default), then the call counts against max_connections.
+        **kwargs : any
+            Keyword arguments for fxn.
+
+        Returns
+        -------
+        any
+            The function's return value.
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(fxn, *args, **kwargs)
+        if network:
+            async with self.__semaphore():
+                return await loop.run_in_executor(self.__executor, call)
+        else:
+            return await loop.run_in_executor(self.__executor, call)
+
+def async_method(name: str) -> Callable:
+    """Builds the coroutine version of a Database method"""
+    method = getattr(Database, name)
+    signature = inspect.signature(method)
+    prompts = 'prompt' in signature.parameters
+
+    async def wrapper(self, *args, **kwargs):
+        # Bind the call so that positional local/remote values are found
+        bound = signature.bind(self.database, *args, **kwargs)
+        if prompts:
+            if bound.arguments.get('prompt', False) is not False:
+                raise ValueError(f'AsyncDatabase.{name} does not support prompt=True')
+            bound.arguments['prompt'] = False
+        return await self.run(getattr(self.database, name), *bound.args[1:],
+                              network=self.uses_network(name, bound.arguments),
+                              **bound.kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f'AsyncDatabase.{name}'
+    wrapper.__doc__ = f'Asynchronous version of Database.{name}.\n{method.__doc__ or ""}'
+    return wrapper
+
+for name in async_methods:
+    setattr(AsyncDatabase, name, async_method(name))
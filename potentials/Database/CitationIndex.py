@@ -0,0 +1,93 @@
+# coding: utf-8
+# Standard Python libraries
+from typing import Hashable, Optional
+
+# https://numpy.org/
+import numpy.typing as npt
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# https://github.com/usnistgov/yabadaba
+from yabadaba.record import Record
+
+# Local imports
+from .LazyRecord import LazyRecord
+
+def lower_doi(doi):
+    """
+    Utility function to transform any doi values to lowercase.
+    """
+    if doi is None:
+        return None
+    elif isinstance(doi, str):
+        return doi.lower()
+    elif hasattr(doi, '__iter__'):
+        return [d.lower() for d in doi]
+    else:
+        raise(TypeError, 'doi must be None, str, or a list of str')
+
+class CitationIndex():
+    """
+    In-memory lookup tables of Citation records by lowercased DOI and by
+    record name, which let fetch_citation resolve citations without searching
+    the databases.
+    """
+    def __init__(self,
+                 citations: npt.ArrayLike,
+                 citations_df: pd.DataFrame,
+                 signature: Hashable = None):
+        """
+        Class initializer.  The lookup tables are built once here.
+
+        Parameters
+        ----------
+        citations : array-like object
+            The Citation records, or LazyRecord proxies of them, to index.
+        citations_df : pandas.DataFrame
+            The metadata Dataframe corresponding to the citations records.
+        signature : hashable, optional
+            A value identifying the state of the local library that the index
+            was built from.
+        """
+        self.__signature = signature
+        self.__dois = {}
+        self.__names = {}
+        if len(citations_df) == 0:
+            return
+
+        dois = citations_df.doi.values if 'doi' in citations_df else [None] * len(citations_df)
+        for citation, name, doi in zip(citations, citations_df.name.values, dois):
+            if isinstance(doi, str):
+                self.__dois.setdefault(lower_doi(doi), citation)
+            self.__names.setdefault(name.lower(), citation)
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    @property
+    def signature(self) -> Hashable:
+        """hashable: Identifies the state of the local library that was indexed"""
+        return self.__signature
+
+    def find(self, doi: str) -> Optional[Record]:
+        """
+        Finds an indexed citation by DOI, then by record name.
+
+        Parameters
+        ----------
+        doi : str
+            The citation's DOI or record name.  Matching ignores case.
+
+        Returns
+        -------
+        Citation or None
+            The matching record, or None if no match is indexed.
+        """
+        key = lower_doi(doi)
+        citation = self.__dois.get(key, None)
+        if citation is None:
+            citation = self.__names.get(key, None)
+        if isinstance(citation, LazyRecord):
+            citation = citation.record
+        return citation
@@ -0,0 +1,234 @@
+# coding: utf-8
+# Standard Python libraries
+from collections import OrderedDict
+from pathlib import Path
+from threading import RLock
+from typing import Any, Optional
+
+# https://github.com/usnistgov/yabadaba
+import yabadaba
+from yabadaba.record import Record
+from yabadaba import load_record
+
+class RecordPool():
+    """
+    Least-recently-used pool of fully loaded Record objects.  Allows for
+    LazyRecord proxies generated by different queries to reuse records that
+    were recently loaded rather than parsing the record files again.  The
+    pool is thread-safe so that it can be shared by concurrent downloads.
+    """
+    def __init__(self, maxsize: int = 128):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of loaded records to retain.  Default value is
+            128.
+        """
+        self.__records = OrderedDict()
+        self.__lock = RLock()
+        self.maxsize = maxsize
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self.__records
+
+    @property
+    def maxsize(self) -> int:
+        """int: The maximum number of loaded records to retain"""
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        value = int(value)
+        if value < 0:
+            raise ValueError('maxsize must be >= 0')
+        with self.__lock:
+            self.__maxsize = value
+            self.__trim()
+
+    def __trim(self):
+        """Removes the least recently used records until maxsize is satisfied"""
+        while len(self.__records) > self.maxsize:
+            self.__records.popitem(last=False)
+
+    def get(self, key: tuple) -> Optional[Record]:
+        """
+        Retrieves a record from the pool, if it is there.
+
+        Parameters
+        ----------
+        key : tuple
+            The (database, style, name) key of the record.
+
+        Returns
+        -------
+        Record or None
+            The pooled record, or None if it is not in the pool.
+        """
+        with self.__lock:
+            try:
+                record = self.__records[key]
+            except KeyError:
+                return None
+            self.__records.move_to_end(key)
+            return record
+
+    def put(self, key: tuple, record: Record):
+        """
+        Adds a loaded record to the pool.
+
+        Parameters
+        ----------
+        key : tuple
+            The (database, style, name) key of the record.
+        record : Record
+            The loaded record.
+        """
+        with self.__lock:
+            self.__records[key] = record
+            self.__records.move_to_end(key)
+            self.__trim()
+
+    def discard(self,
+                style: Optional[str] = None,
+                name: Optional[str] = None):
+        """
+        Removes records from the pool.  Used to keep the pool consistent with
+        the databases when records are changed.
+
+        Parameters
+        ----------
+        style : str, optional
+            Only records of this style will be removed.  If not given, all
+            styles are removed.
+        name : str, optional
+            Only records with this name will be removed.  If not given, all
+            names are removed.
+        """
+        with self.__lock:
+            for key in list(self.__records.keys()):
+                if style is not None and key[1] != style:
+                    continue
+                if name is not None and key[2] != name:
+                    continue
+                del self.__records[key]
+
+    def clear(self):
+        """Removes all records from the pool"""
+        with self.__lock:
+            self.__records.clear()
+
+class LazyRecord():
+    """
+    Lightweight proxy for a record stored in a local-style database.  The
+    proxy is built from the record's metadata and only loads the full record
+    (i.e. reads and parses the record file) the first time an attribute that
+    is not in the metadata is accessed.  Note that as a proxy, LazyRecord
+    objects are not instances of the record classes.
+    """
+    def __init__(self,
+                 style: str,
+                 metadata: dict,
+                 database: yabadaba.database.Database,
+                 pool: Optional[RecordPool] = None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        style : str
+            The record style.
+        metadata : dict
+            The record's metadata, i.e. the record's row of the metadata
+            DataFrame.  Must contain the record's name.
+        database : yabadaba.database.Database
+            The local-style database where the record is located.
+        pool : RecordPool, optional
+            A pool of loaded records to check before, and update after,
+            loading the record.
+        """
+        self.__style = style
+        self.__metadata = metadata
+        self.__database = database
+        self.__pool = pool
+        self.__record = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Loads the full record for any non-proxy attributes"""
+        # Avoid loading for special attribute checks, e.g. by numpy and copy
+        if name.startswith('__') or name.startswith('_LazyRecord__'):
+            raise AttributeError(name)
+        return getattr(self.record, name)
+
+    def __setattr__(self, name: str, value: Any):
+        """Sets non-proxy attributes to the full record"""
+        if name.startswith('_LazyRecord__'):
+            super().__setattr__(name, value)
+        else:
+            setattr(self.record, name, value)
+
+    def __str__(self) -> str:
+        """str: The string representation of the record"""
+        return f'{self.style} record named {self.name}'
+
+    def __repr__(self) -> str:
+        if self.loaded:
+            state = 'loaded'
+        else:
+            state = 'not loaded'
+        return f'<LazyRecord: {self} ({state})>'
+
+    @property
+    def style(self) -> str:
+        """str: The record style"""
+        return self.__style
+
+    @property
+    def name(self) -> str:
+        """str: The record's name"""
+        return self.__metadata['name']
+
+    @property
+    def database(self) -> yabadaba.database.Database:
+        """yabadaba.database.Database: The database where the record is located"""
+        return self.__database
+
+    @property
+    def key(self) -> tuple:
+        """tuple: The key used to identify the record in a RecordPool"""
+        return (str(self.database.host), self.style, self.name)
+
+    @property
+    def loaded(self) -> bool:
+        """bool: Indicates if the full record has been loaded"""
+        return self.__record is not None
+
+    def metadata(self) -> dict:
+        """
+        Returns the record's metadata without loading the full record.
+        """
+        return dict(self.__metadata)
+
+    @property
+    def record(self) -> Record:
+        """Record: The full record, which is loaded if needed"""
+        if self.__record is None:
+
+            # Check the pool for a previously loaded copy
+            if self.__pool is not None:
+                self.__record = self.__pool.get(self.key)
+
+            # Load the record from its file
+            if self.__record is None:
+                database = self.database
+                fname = Path(database.host, self.style, f'{self.name}.{database.format}')
+                self.__record = load_record(self.style, model=fname, database=database)
+                if self.__pool is not None:
+                    self.__pool.put(self.key, self.__record)
+
+        return self.__record
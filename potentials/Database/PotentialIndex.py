@@ -0,0 +1,170 @@
+# coding: utf-8
+# Standard Python libraries
+import threading
+from typing import Optional, Union
+
+# https://numpy.org/
+import numpy as np
+import numpy.typing as npt
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# Local imports
+from ..tools import aslist
+
+class PotentialIndex():
+    """
+    Inverted indexes of Potential metadata for answering repeated searches
+    by elements, year and author with set intersections.  Searches give the
+    same matches as the Potential record's pandasfilter for the elements,
+    fictionalelements, year and author parameters.
+    """
+    def __init__(self,
+                 potentials: npt.ArrayLike,
+                 potentials_df: pd.DataFrame):
+        """
+        Class initializer.  The indexes are built once here.
+
+        Parameters
+        ----------
+        potentials : array-like object
+            The Potential records to index.
+        potentials_df : pandas.DataFrame
+            The metadata Dataframe corresponding to the potentials records.
+        """
+        self.__potentials = np.asarray(potentials)
+        self.__ids = potentials_df.id.tolist()
+        self.__rows = {potid: i for i, potid in enumerate(self.__ids)}
+        self.__html = {}
+        self.__lock = threading.Lock()
+
+        self.__elements = build_index(potentials_df, 'elements')
+        self.__fictionalelements = build_index(potentials_df, 'fictionalelements')
+        self.__surnames = build_index(potentials_df, 'surnames')
+
+        # Years are indexed across all citations of each potential
+        self.__years = {}
+        if 'citations' in potentials_df:
+            for i, citations in enumerate(potentials_df.citations.values):
+                if not isinstance(citations, list):
+                    continue
+                for citation in citations:
+                    year = citation.get('year', None)
+                    if year is not None and pd.notna(year):
+                        self.__years.setdefault(int(year), set()).add(i)
+
+    def __len__(self) -> int:
+        return len(self.__ids)
+
+    @property
+    def ids(self) -> list:
+        """list: The potential ids in the order of the indexed rows"""
+        return list(self.__ids)
+
+    @property
+    def elements(self) -> list:
+        """list: The sorted unique elements and fictional elements"""
+        return sorted(set(self.__elements) | set(self.__fictionalelements))
+
+    @property
+    def years(self) -> list:
+        """list: The sorted unique citation years"""
+        return sorted(self.__years)
+
+    @property
+    def surnames(self) -> list:
+        """list: The sorted unique citation author surnames"""
+        return sorted(self.__surnames)
+
+    def search(self,
+               elements: Union[str, list, None] = None,
+               year: Optional[int] = None,
+               author: Optional[str] = None) -> list:
+        """
+        Finds the potentials that match all given search terms.
+
+        Parameters
+        ----------
+        elements : str or list, optional
+            Potentials must include all of these elements, or all of these
+            fictional elements.
+        year : int, optional
+            Potentials must have a citation from this year.
+        author : str, optional
+            Potentials must have a citation with an author of this surname.
+
+        Returns
+        -------
+        list
+            The ids of the matching potentials in their indexed order.
+        """
+        rows = None
+
+        if elements is not None and len(aslist(elements)) > 0:
+            elements = aslist(elements)
+            rows = (intersect(self.__elements, elements)
+                    | intersect(self.__fictionalelements, elements))
+        if year is not None:
+            rows = restrict(rows, self.__years.get(int(year), set()))
+        if author is not None:
+            rows = restrict(rows, self.__surnames.get(author, set()))
+
+        if rows is None:
+            return self.ids
+        return [self.__ids[i] for i in sorted(rows)]
+
+    def record(self, id: str):
+        """
+        Returns the Potential record with a given id, or None if not indexed.
+        """
+        i = self.__rows.get(id, None)
+        if i is None:
+            return None
+        return self.__potentials[i]
+
+    def html(self, id: str) -> Optional[str]:
+        """
+        Returns the HTML representation of the Potential record with a given
+        id, or None if not indexed.  The HTML is rendered once per id.
+        """
+        with self.__lock:
+            if id in self.__html:
+                return self.__html[id]
+        record = self.record(id)
+        if record is None:
+            return None
+        content = record.html()
+        with self.__lock:
+            self.__html[id] = content
+        return content
+
+def build_index(df: pd.DataFrame,
+                column: str) -> dict:
+    """
+    Maps each value found in a list-valued metadata column to the set of row
+    positions whose lists contain it.
+    """
+    index = {}
+    if column not in df:
+        return index
+    for i, values in enumerate(df[column].values):
+        if isinstance(values, list):
+            for value in values:
+                index.setdefault(value, set()).add(i)
+    return index
+
+def intersect(index: dict,
+              values: list) -> set:
+    """Returns the rows that contain all of the values in an index"""
+    rows = None
+    for value in values:
+        rows = restrict(rows, index.get(value, set()))
+    return rows
+
+def restrict(rows: Optional[set],
+             matches: set) -> set:
+    """Intersects rows with matches, where rows of None is all rows"""
+    if rows is None:
+        return set(matches)
+    return rows & matches
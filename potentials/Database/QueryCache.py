@@ -0,0 +1,244 @@
+# coding: utf-8
+# Standard Python libraries
+from collections import OrderedDict
+from functools import wraps
+import inspect
+from pathlib import PurePath
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional, Union
+
+# https://numpy.org/
+import numpy as np
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+class QueryCache():
+    """
+    In-memory least-recently-used cache of Database query results.  Entries
+    are tagged with the record styles that they depend on so that they can be
+    invalidated when records of those styles change.
+    """
+    def __init__(self,
+                 maxsize: int = 128,
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of query results to retain.  Default value is
+            128.
+        ttl : float, optional
+            The number of seconds after which cached results expire.  If None
+            (default), results do not expire.
+        clock : function, optional
+            Returns the current time in seconds for checking expiration.
+            Default value is time.monotonic.
+        """
+        if maxsize < 0:
+            raise ValueError('maxsize must be >= 0')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be > 0')
+        self.__maxsize = int(maxsize)
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__entries = OrderedDict()
+        self.__lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def maxsize(self) -> int:
+        """int: The maximum number of query results to retain"""
+        return self.__maxsize
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """float or None: The number of seconds before results expire"""
+        return self.__ttl
+
+    def get(self, key: Hashable) -> tuple:
+        """
+        Retrieves a cached query result and updates the hit/miss counters.
+
+        Parameters
+        ----------
+        key : hashable
+            The query's key.
+
+        Returns
+        -------
+        found : bool
+            Indicates if an unexpired result was found.
+        value : any
+            The cached result, or None if not found.
+        """
+        with self.__lock:
+            try:
+                styles, created, value = self.__entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            if self.__ttl is not None and self.__clock() - created > self.__ttl:
+                del self.__entries[key]
+                self.misses += 1
+                return False, None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self,
+            key: Hashable,
+            styles: Union[str, list],
+            value: Any):
+        """
+        Adds a query result to the cache.
+
+        Parameters
+        ----------
+        key : hashable
+            The query's key.
+        styles : str or list
+            The record style(s) that the result depends on.
+        value : any
+            The query result.
+        """
+        if isinstance(styles, str):
+            styles = [styles]
+        with self.__lock:
+            self.__entries[key] = (frozenset(styles), self.__clock(), value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, style: Optional[str] = None):
+        """
+        Removes cached results.
+
+        Parameters
+        ----------
+        style : str, optional
+            Only results that depend on this record style are removed.  If not
+            given, all results are removed.
+        """
+        with self.__lock:
+            if style is None:
+                self.__entries.clear()
+            else:
+                for key in list(self.__entries.keys()):
+                    if style in self.__entries[key][0]:
+                        del self.__entries[key]
+
+    def clear(self):
+        """Removes all results and resets the hit/miss counters"""
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+def normalize(value: Any) -> Hashable:
+    """
+    Converts a query parameter value into a hashable form where equivalent
+    values, such as a str and a list containing only that str, are equal.
+    """
+    if isinstance(value, (list, tuple, set, np.ndarray, pd.Series)):
+        values = [normalize(v) for v in value]
+        if len(values) == 1:
+            return values[0]
+        return ('__list__', tuple(sorted(values, key=repr)))
+    elif isinstance(value, dict):
+        return ('__dict__', tuple(sorted((k, normalize(v)) for k, v in value.items())))
+    elif isinstance(value, PurePath):
+        return str(value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+def copy_result(value: Any) -> Any:
+    """
+    Copies the containers of a query result so that callers cannot change
+    the cached result.  The records themselves are shared.
+    """
+    if isinstance(value, tuple):
+        return tuple(copy_result(v) for v in value)
+    elif isinstance(value, (np.ndarray, pd.DataFrame)):
+        return value.copy()
+    return value
+
+# Tracks if a thread is inside a cached query so nested queries are not cached
+_active = threading.local()
+
+# Parameters that only change how query results are found, not the results
+ignored_params = ('verbose', 'max_workers')
+
+def cached_query(styles: Union[str, list, None] = None) -> Callable:
+    """
+    Decorator that uses the Database's query cache for a query method.  Query
+    methods called by a cached query method are not cached themselves, so
+    records shared with the outer result cannot be changed by other queries.
+    Calls with prompt=True are not cached so that interactive selections are
+    never replayed.
+
+    Parameters
+    ----------
+    styles : str or list, optional
+        The record style(s) that the method's results depend on.  If not
+        given, the style is taken from the method's style parameter.
+    """
+    def decorator(fxn: Callable) -> Callable:
+        signature = inspect.signature(fxn)
+
+        @wraps(fxn)
+        def wrapper(self, *args, **kwargs):
+            cache = self.query_cache
+            if cache is None or getattr(_active, 'depth', 0) > 0:
+                return fxn(self, *args, **kwargs)
+
+            # Build the key from the method name and normalized parameters
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            del params['self']
+            params.update(params.pop('kwargs', {}))
+            for param in ('local', 'remote'):
+                if param in params and params[param] is None:
+                    params[param] = getattr(self, param)
+            if 'kim_models' in params and params['kim_models'] is None:
+                params['kim_models'] = self.kim_models
+            if params.get('prompt', False) is True:
+                return fxn(self, *args, **kwargs)
+            key = (fxn.__name__,) + tuple(sorted(
+                (param, normalize(value)) for param, value in params.items()
+                if param not in ignored_params))
+
+            # Return the cached result unless the metadata cache is refreshed
+            if not params.get('refresh_cache', False):
+                found, value = cache.get(key)
+                if found:
+                    return copy_result(value)
+
+            _active.depth = getattr(_active, 'depth', 0) + 1
+            try:
+                value = fxn(self, *args, **kwargs)
+            finally:
+                _active.depth -= 1
+
+            if styles is None:
+                keystyles = params['style']
+            else:
+                keystyles = styles
+            if keystyles is not None:
+                cache.put(key, keystyles, value)
+            return copy_result(value)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,327 @@
+# coding: utf-8
+# Standard Python libraries
+from typing import Iterator, Optional
+
+class DisjointSets():
+    """
+    Union-find structure holding the sets of related potential ids for a
+    single interaction.  Each id maps to a parent id, with the root of a tree
+    identifying the set, and the member ids of each set are kept by root.
+    """
+    def __init__(self):
+        """
+        Class initializer.
+        """
+        self.__parent = {}
+        self.__members = {}
+
+    def __contains__(self, potid: str) -> bool:
+        return potid in self.__parent
+
+    def __len__(self) -> int:
+        return len(self.__members)
+
+    def find(self, potid: str) -> str:
+        """
+        Finds the root id of the set containing a potential id.
+
+        Parameters
+        ----------
+        potid : str
+            The potential id to search for.
+
+        Returns
+        -------
+        str
+            The root id of the set.
+
+        Raises
+        ------
+        KeyError
+            If potid is not in any set.
+        """
+        parent = self.__parent
+        while parent[potid] != potid:
+            # Path halving
+            parent[potid] = parent[parent[potid]]
+            potid = parent[potid]
+        return potid
+
+    def members(self, potid: str) -> list:
+        """
+        Returns the list of ids in the set containing a potential id.
+
+        Parameters
+        ----------
+        potid : str
+            The potential id to search for.
+
+        Returns
+        -------
+        list
+            All ids in the set, including potid.
+        """
+        return self.__members[self.find(potid)]
+
+    def newset(self, potids: list):
+        """
+        Adds a new set of ids that are not in any of the existing sets.
+
+        Parameters
+        ----------
+        potids : list
+            The potential ids in the new set.
+
+        Raises
+        ------
+        ValueError
+            If any id is already in a set.
+        """
+        root = potids[0]
+        for potid in potids:
+            if potid in self.__parent:
+                raise ValueError(f'{potid} found in multiple sets')
+            self.__parent[potid] = root
+        self.__members[root] = list(potids)
+
+    def union(self, potid: str, relid: str) -> str:
+        """
+        Joins the sets containing two ids.  The members of the set containing
+        relid are listed after the members of the set containing potid, while
+        the smaller tree is attached to the root of the larger one.
+
+        Parameters
+        ----------
+        potid : str
+            A potential id in the first set.
+        relid : str
+            A potential id in the second set.
+
+        Returns
+        -------
+        str
+            The root id of the joined set.
+        """
+        root1 = self.find(potid)
+        root2 = self.find(relid)
+        if root1 == root2:
+            return root1
+
+        members1 = self.__members.pop(root1)
+        members2 = self.__members.pop(root2)
+        if len(members1) < len(members2):
+            root1, root2 = root2, root1
+        self.__parent[root2] = root1
+        members1.extend(members2)
+
+        # Joined sets are listed after the existing sets
+        self.__members[root1] = members1
+        return root1
+
+    def add(self,
+            potid: str,
+            relid: Optional[str] = None) -> str:
+        """
+        Adds a potential id and relates it to another id.
+
+        Parameters
+        ----------
+        potid : str
+            The potential id to add.
+        relid : str, optional
+            A related potential id.  If not given, potid is added to a new set
+            if it is not already in one.
+
+        Returns
+        -------
+        str
+            Message describing the change made.
+        """
+        haspot = potid in self.__parent
+        hasrel = relid in self.__parent
+
+        if not haspot and not hasrel:
+            if relid is None or relid == potid:
+                self.newset([potid])
+            else:
+                self.newset([potid, relid])
+            return 'New set added'
+
+        elif not haspot:
+            self.__parent[potid] = self.find(relid)
+            self.members(relid).append(potid)
+            return 'potid added to existing set'
+
+        elif not hasrel:
+            if relid is None:
+                return 'potid already in set'
+            self.__parent[relid] = self.find(potid)
+            self.members(potid).append(relid)
+            return 'related id added to existing set containing potid'
+
+        elif self.find(potid) != self.find(relid):
+            self.union(potid, relid)
+            return 'existing sets now joined'
+
+        else:
+            return 'potid and related id already in the same set'
+
+    def sets(self) -> list:
+        """
+        Returns copies of all sets as lists of ids.
+        """
+        return [list(members) for members in self.__members.values()]
+
+    def sort(self):
+        """
+        Sorts the ids in each set and the sets by their first ids.
+        """
+        for members in self.__members.values():
+            members.sort()
+        roots = sorted(self.__members, key=lambda root: self.__members[root][0])
+        self.__members = {root: self.__members[root] for root in roots}
+
+class RelatedModels():
+    """
+    Stores the sets of related interatomic potentials by interaction using
+    union-find structures so that adding and joining relations is near
+    constant time.  The asdict method builds the related-interactions.json
+    layout, i.e. interaction -> list of lists of potential ids, and caches
+    it until the relations are next changed.
+    """
+    def __init__(self, data: Optional[dict] = None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        data : dict, optional
+            Related models in the related-interactions.json layout.
+
+        Raises
+        ------
+        ValueError
+            If an id is listed in multiple sets for an interaction.
+        """
+        self.__interactions = {}
+        self.__potids = {}
+        self.__asdict = None
+        if data is not None:
+            for interaction, potidsets in data.items():
+                for potids in potidsets:
+                    try:
+                        self.__sets(interaction).newset(potids)
+                    except ValueError as e:
+                        raise ValueError(f'{e} for {interaction}') from e
+                    for potid in potids:
+                        self.__index(potid, interaction)
+
+    def __sets(self, interaction: str) -> DisjointSets:
+        """Gets or creates the DisjointSets for an interaction"""
+        try:
+            return self.__interactions[interaction]
+        except KeyError:
+            self.__interactions[interaction] = sets = DisjointSets()
+            return sets
+
+    def __index(self, potid: Optional[str], interaction: str):
+        """Records that an id is listed for an interaction"""
+        if potid is not None:
+            self.__potids.setdefault(potid, {})[interaction] = None
+
+    def __getitem__(self, interaction: str) -> list:
+        return self.__interactions[interaction].sets()
+
+    def __contains__(self, interaction: str) -> bool:
+        return interaction in self.__interactions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__interactions)
+
+    def __len__(self) -> int:
+        return len(self.__interactions)
+
+    def keys(self):
+        """The interactions"""
+        return self.__interactions.keys()
+
+    def asdict(self) -> dict:
+        """
+        Returns the related models in the related-interactions.json layout.
+        The dict is built once and shared by all calls until add or sort is
+        called.
+        """
+        if self.__asdict is None:
+            self.__asdict = {interaction: sets.sets()
+                             for interaction, sets in self.__interactions.items()}
+        return self.__asdict
+
+    def add(self,
+            interaction: str,
+            potid: str,
+            relid: Optional[str] = None) -> str:
+        """
+        Adds a potential id to an interaction and relates it to another id.
+
+        Parameters
+        ----------
+        interaction : str
+            The interaction.
+        potid : str
+            The potential id to add.
+        relid : str, optional
+            A related potential id.  If not given, potid is added to a new set
+            if it is not already in one.
+
+        Returns
+        -------
+        str
+            Message describing the change made.
+        """
+        self.__asdict = None
+        isnew = interaction not in self.__interactions
+        message = self.__sets(interaction).add(potid, relid)
+        self.__index(potid, interaction)
+        self.__index(relid, interaction)
+        if isnew:
+            return 'Set added to new interaction'
+        return message
+
+    def related(self, potid: str) -> dict:
+        """
+        Finds all related potential ids for a potential id.
+
+        Parameters
+        ----------
+        potid : str
+            The potential id to search for.
+
+        Returns
+        -------
+        dict
+            The other potential ids in the same sets by interaction.
+
+        Raises
+        ------
+        ValueError
+            If potid is not found.
+        """
+        if potid not in self.__potids:
+            raise ValueError(f'{potid} not found in related models')
+
+        related = {}
+        for interaction in self.__potids[potid]:
+            members = self.__interactions[interaction].members(potid)
+            related[interaction] = [potid2 for potid2 in members if potid2 != potid]
+        return related
+
+    def sort(self):
+        """
+        Sorts the interactions, the sets by their first ids and the ids in
+        each set.
+        """
+        self.__asdict = None
+        self.__interactions = {interaction: self.__interactions[interaction]
+                               for interaction in sorted(self.__interactions)}
+        for sets in self.__interactions.values():
+            sets.sort()
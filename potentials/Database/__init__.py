@@ -1,13 +1,21 @@
 # coding: utf-8
 # Standard libraries
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, Union
+import io
+import time
+from typing import Callable, Optional, Union
 
 import yabadaba
 
 # Local imports
 from .. import settings
 from .load_database import load_database
+from .CitationIndex import CitationIndex
+from .LazyRecord import LazyRecord, RecordPool
+from .RelatedModels import RelatedModels
+from .QueryCache import QueryCache
 
 class Database():
     """
@@ -15,10 +23,14 @@ class Database():
     """
     # Class imports
     from ._record import (get_records, get_record, retrieve_record, download_records,
-                          remote_query, upload_record, delete_record, save_record)
+                          remote_query, iter_records, upload_record, delete_record, save_record,
+                          save_records)
+
+    from ._local_cache import update_local_cache
 
     from ._citation import (get_citations, get_citation, retrieve_citation, fetch_citation,
-                            download_citations, upload_citation, save_citation, delete_citation)
+                            fetch_citations, citation_index, download_citations, upload_citation, save_citation,
+                            delete_citation)
 
     from ._potential import (get_potentials, get_potential, retrieve_potential, download_potentials,
                              upload_potential, save_potential, delete_potential)
@@ -47,6 +59,10 @@ class Database():
 
     from ._widgets import (widget_search_potentials, widget_lammps_potential)
 
+    from ._render import render_html
+
+    from ._validate import validate_records
+
     def __init__(self,
                  local: Optional[bool] = None,
                  remote: Optional[bool] = None,
@@ -133,6 +149,15 @@ class Database():
         self.__local = local
         self.__remote = remote
 
+        # Query results are only cached if enabled
+        self.__query_cache = None
+
+        # Hashes of records that passed validate_records
+        self.__validation_cache = {}
+
+        # Citation lookup indexes keyed by the (local, remote) searched
+        self.__citation_indexes = {}
+
         # set database interactions
         if remote:
             if remote_terms is None:
@@ -156,6 +181,9 @@ class Database():
         self.init_kim_models(kim_models=kim_models, kim_models_file=kim_models_file,
                              kim_api_directory=kim_api_directory)
 
+        # Initialize pool of records loaded by LazyRecord proxies
+        self.__record_pool = RecordPool()
+
     @property
     def remote_database(self) -> yabadaba.database.Database:
         """yabadaba.database.Database : Interfaces with the remote database"""
@@ -166,6 +194,61 @@ class Database():
         """yabadaba.database.Database : Interfaces with the local database"""
         return self.__local_database
 
+    @property
+    def record_pool(self) -> RecordPool:
+        """RecordPool : The recently loaded records reused by lazy get_records"""
+        return self.__record_pool
+
+    @property
+    def query_cache(self) -> Optional[QueryCache]:
+        """QueryCache or None : The cache of query results, if enabled"""
+        return self.__query_cache
+
+    @property
+    def validation_cache(self) -> dict:
+        """dict : The hashes of records that passed validate_records, keyed by 'style/name'"""
+        return self.__validation_cache
+
+    @property
+    def citation_indexes(self) -> dict:
+        """dict : The CitationIndex of the local location used by fetch_citation"""
+        return self.__citation_indexes
+
+    def enable_query_cache(self,
+                           maxsize: int = 128,
+                           ttl: Optional[float] = None,
+                           clock: Optional[Callable[[], float]] = None):
+        """
+        Enables caching the results of the get_* query methods in memory so
+        that repeated calls with the same parameters do not search the local
+        and remote locations again.  Cached results are invalidated when
+        records of the same style are saved, uploaded, deleted or downloaded
+        using this Database object, but not when the databases are changed
+        by other means.  Cached records are shared between calls, so changes
+        to them are seen by later calls.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of query results to retain.  Default value is
+            128.
+        ttl : float, optional
+            The number of seconds after which cached results expire.  If None
+            (default), results do not expire.
+        clock : function, optional
+            Returns the current time in seconds for checking expiration.  If
+            None (default), time.monotonic is used.
+        """
+        if clock is None:
+            clock = time.monotonic
+        self.__query_cache = QueryCache(maxsize=maxsize, ttl=ttl, clock=clock)
+
+    def disable_query_cache(self):
+        """
+        Disables and removes the cache of query results.
+        """
+        self.__query_cache = None
+
     @property
     def local(self) -> bool:
         """bool : Indicates if load operations will check localpath"""
@@ -217,6 +300,10 @@ class Database():
         else:
             self.__remote_database = load_database(name=name, style=style, host=host, **kwargs)
 
+        self.citation_indexes.clear()
+        if self.query_cache is not None:
+            self.query_cache.invalidate()
+
     def set_local_database(self,
                            localpath: Optional[str] = None,
                            name: Optional[str] = None,
@@ -250,6 +337,8 @@ class Database():
             Allowed keywords are database style-specific.
         """
 
+        self.citation_indexes.clear()
+
         if database is not None:
             assert name is None and style is None and host is None and localpath is None
             self.__local_database = database
@@ -273,14 +362,22 @@ class Database():
         else:
             self.__local_database = load_database(name=name, style=style, host=host, **kwargs)
 
+        if self.query_cache is not None:
+            self.query_cache.invalidate()
+
     def download_all(self,
                      status: Union[str, list, None] = None,
                      downloadfiles: bool = True,
                      overwrite: bool = False,
+                     incremental: bool = False,
+                     prune: bool = False,
+                     max_workers: int = 4,
                      verbose: bool = False):
         """
         Downloads all potential-related records from the remote location to the
-        local location.
+        local location.  The record styles are independent of each other so
+        they are downloaded as concurrent stages, and the parameter files are
+        downloaded concurrently with the stages for the other record styles.
 
         Parameters
         ----------
@@ -295,14 +392,90 @@ class Database():
             Flag indicating if any existing local records with names matching
             remote records are updated (True) or left unchanged (False).  Default
             value is False.
+        incremental : bool, optional
+            If True, only new and changed records, as identified by comparing
+            content hashes, are written to the local.  Repeated downloads
+            then only write what changed in the remote.  Default value is
+            False.
+        prune : bool, optional
+            If True and incremental is True, local records that are not in
+            the remote are deleted.  Default value is False.
+        max_workers : int, optional
+            The number of threads to use for running the stages and for
+            downloading parameter files.  Default value is 4.  A value of 1
+            downloads everything serially.
         verbose : bool, optional
-            If True, info messages will be printed during operations.  Default
-            value is False.
+            If True, info messages and a per-stage timing breakdown will be
+            printed.  The messages of concurrent stages are collected and
+            printed together in stage order.  Default value is False.
 
         """
-        self.download_citations(overwrite=overwrite, verbose=verbose)
-
-        self.download_potentials(overwrite=overwrite, verbose=verbose)
-
-        self.download_lammps_potentials(status=status, downloadfiles=downloadfiles,
-                                        overwrite=overwrite, verbose=verbose)
\ No newline at end of file
+        # Concurrent stages write their messages to separate buffers
+        concurrent = max_workers is None or max_workers > 1
+        outputs = {}
+        def output(stage):
+            if verbose and concurrent:
+                outputs[stage] = io.StringIO()
+            return outputs.get(stage, None)
+
+        sync = dict(overwrite=overwrite, incremental=incremental, prune=prune)
+        stages = {
+            'Citation': partial(
+                self.download_citations, verbose=verbose,
+                output=output('Citation'), **sync),
+            'Potential': partial(
+                self.download_potentials, verbose=verbose,
+                output=output('Potential'), **sync),
+            'potential_LAMMPS': partial(
+                self.download_lammps_potentials, status=status, include_kim=False,
+                downloadfiles=downloadfiles, max_workers=max_workers,
+                verbose=verbose, output=output('potential_LAMMPS'), **sync),
+            'potential_LAMMPS_KIM': partial(
+                self.download_records, style='potential_LAMMPS_KIM',
+                status=status, verbose=verbose,
+                output=output('potential_LAMMPS_KIM'), **sync),
+        }
+
+        def runstage(stage):
+            start = time.perf_counter()
+            stages[stage]()
+            return time.perf_counter() - start
+
+        # Run the stages and collect their timings
+        start = time.perf_counter()
+        timings = {}
+        errors = {}
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {stage: executor.submit(runstage, stage) for stage in stages}
+                for stage, future in futures.items():
+                    try:
+                        timings[stage] = future.result()
+                    except Exception as e:
+                        errors[stage] = e
+
+            # Print the messages of each stage together in stage order
+            for stage, buffer in outputs.items():
+                if buffer.getvalue() != '':
+                    print(f'{stage}:')
+                    print(buffer.getvalue(), end='')
+        else:
+            for stage in stages:
+                timings[stage] = runstage(stage)
+        total = time.perf_counter() - start
+
+        if verbose:
+            print('Stage timing breakdown:')
+            for stage, duration in timings.items():
+                print(f' {stage:<22} {duration:9.2f} s')
+            print(f' {"total (wall time)":<22} {total:9.2f} s')
+
+        if len(errors) == 1:
+            raise next(iter(errors.values()))
+        elif len(errors) > 1:
+            failed = ', '.join(f'{stage} ({type(e).__name__}: {e})'
+                               for stage, e in errors.items())
+            raise RuntimeError(f'download_all stages failed: {failed}') from next(iter(errors.values()))
+
+# Imported after Database is defined
+from .AsyncDatabase import AsyncDatabase
@@ -13,6 +13,11 @@ from yabadaba.record import Record
 # https://pandas.pydata.org/
 import pandas as pd
 
+# Local imports
+from .QueryCache import cached_query
+from ..tools.instrumentation import traced
+
+@cached_query('Action')
 def get_actions(self,
                 name: Union[str, list, None] = None,
                 date: Union[str, list, None] = None,
@@ -94,6 +99,7 @@ def get_actions(self,
         fictionalelements=fictionalelements, othername=othername,
         comment=comment)
 
+@cached_query('Action')
 def get_action(self,
                name: Union[str, list, None] = None,
                date: Union[str, list, None] = None,
@@ -261,6 +267,7 @@ def retrieve_action(self,
         date=date, type=type, potential_id=potential_id,
         potential_key=potential_key, elements=elements, comment=comment)
 
+@traced('Database.download_actions')
 def download_actions(self, 
                      name: Union[str, list, None] = None,
                      date: Union[str, list, None] = None,
@@ -274,6 +281,9 @@ def download_actions(self,
                      comment: Union[str, list, None] = None,
                      overwrite: bool = False,
                      return_records: bool = False,
+                     incremental: bool = False,
+                     prune: bool = False,
+                     page_size: int = 100,
                      verbose: bool = False) -> Optional[np.ndarray]:
     """
     Downloads actions from the remote to the local.
@@ -311,12 +321,23 @@ def download_actions(self,
     return_records : bool, optional
         If True, the retrieved record objects are also returned.  Default
         value is False.
+    incremental : bool, optional
+        If True, only new and changed records, as identified by comparing
+        content hashes, are written to the local and changed records are
+        always updated.  Default value is False.
+    prune : bool, optional
+        If True and incremental is True, matching local records that are not
+        in the remote are deleted.  Default value is False.
+    page_size : int, optional
+        The records are retrieved from the remote and saved to the local in
+        pages of this many records.  Default value is 100.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
     """
     return self.download_records(
         style='Action', name=name, overwrite=overwrite,
+        incremental=incremental, prune=prune, page_size=page_size,
         return_records=return_records, verbose=verbose,
         date=date, type=type, potential_id=potential_id,
         potential_key=potential_key, elements=elements, comment=comment)
@@ -1,7 +1,8 @@
 # coding: utf-8
 # Standard libraries
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Optional, TextIO, Tuple, Union
+from urllib.parse import quote
 
 # https://numpy.org/
 import numpy as np
@@ -16,8 +17,14 @@ from habanero import cn
 from yabadaba.record import Record
 
 # Local imports
-from .. import load_record
-
+from .QueryCache import cached_query
+from ..tools.instrumentation import span, traced
+from .. import load_record, settings
+from ._concurrent import RateLimiter, map_concurrent
+from ._local_cache import atomic_write
+from .CitationIndex import CitationIndex, lower_doi
+
+@cached_query('Citation')
 def get_citations(self, 
                   name: Union[str, list, None] = None,
                   doctype: Union[str, list, None] = None,
@@ -40,6 +47,7 @@ def get_citations(self,
                   remote: Optional[bool] = None,
                   refresh_cache: bool = False,
                   return_df: bool = False,
+                  max_workers: Optional[int] = None,
                   verbose: bool = False
                   ) -> Union[np.ndarray, Tuple[np.ndarray, pd.DataFrame]]:
     """
@@ -79,6 +87,11 @@ def get_citations(self,
     return_df : bool, optional
         If True, then the corresponding pandas.Dataframe of metadata
         will also be returned.
+    max_workers : int, optional
+        If given, the local record files that need to be parsed to update the
+        metadata cache are handled by this many worker processes.  Only
+        applies if the local database is of style "local".  Default value is
+        None, which parses the files serially.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
@@ -94,12 +107,14 @@ def get_citations(self,
 
     return self.get_records(
         style='Citation', name=name, local=local, remote=remote, 
-        refresh_cache=refresh_cache, return_df=return_df, verbose=verbose,
+        refresh_cache=refresh_cache, return_df=return_df,
+        max_workers=max_workers, verbose=verbose,
         doctype=doctype, title=title, givenname=givenname, surname=surname,
         suffix=suffix, publication=publication, year=year, month=month,
         volume=volume, issue=issue, abstract=abstract, pages=pages, doi=doi,
         url=url, bibtex=bibtex, author=author)
 
+@cached_query('Citation')
 def get_citation(self, 
                  name: Union[str, list, None] = None,
                  doctype: Union[str, list, None] = None,
@@ -320,11 +335,15 @@ def fetch_citation(self,
                    doi: str,
                    local: Optional[str] = None,
                    remote: Optional[str] = None,
+                   cache_dir: Union[str, Path, None] = None,
+                   crossref_url: Optional[str] = None,
                    verbose: bool = False):
     """
-    Retrieves a single citation based on its DOI.  First, the database is checked
-    for matches with the DOI, then with the record name.  If no matches are found
-    in the database, then the corresponding citation is downloaded from CrossRef.
+    Retrieves a single citation based on its DOI.  First, the local citation
+    index and then the remote are checked for matches with the DOI, then with
+    the record name.  If no matches are found in the database, then the
+    corresponding citation is downloaded from CrossRef.  Records found in the
+    local index are shared by all calls until the index is refreshed.
 
     Parameters
     ----------
@@ -337,33 +356,278 @@ def fetch_citation(self,
     remote : bool, optional
         Indicates if the remote location is to be searched.  Default value
         matches the value set when the database was initialized.
+    cache_dir : path-like object, optional
+        The directory where bibtex responses from CrossRef are cached.
+        Default value is the doi_cache directory in the settings directory.
+    crossref_url : str, optional
+        The base URL for the CrossRef content negotiation requests.  Default
+        value is https://doi.org.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
     """
-    if local is not False or remote is not False:
-        # Try fetching based on doi
-        try:
-            return self.get_citation(doi=doi, local=local, remote=remote, verbose=verbose)
-        except ValueError:
-            pass
-
-        # Try fetching based on name
-        try:
-            return self.get_citation(name=doi, local=local, remote=remote, verbose=True)
-        except ValueError:
-            pass
+    if local is None:
+        local = self.local
+    if remote is None:
+        remote = self.remote
+
+    # Try fetching based on doi, then name
+    record = None
+    if local:
+        record = self.citation_index(verbose=verbose).find(doi)
+    if record is None and remote:
+        record = remote_citation(self, doi, verbose=verbose)
+    if record is not None:
+        if verbose:
+            print('Citation found in the database')
+        return record
     
     # Fetch from CrossRef if database search failed/skipped
-    bibtex = cn.content_negotiation(ids=doi, format="bibtex")
+    bibtex, cached = crossref_bibtex(doi, cache_dir=cache_dir, url=crossref_url)
     if verbose:
-        print('Citation retrieved from CrossRef')
+        if cached:
+            print('Citation retrieved from DOI cache')
+        else:
+            print('Citation retrieved from CrossRef')
     record = load_record('Citation')
     record.load_bibtex(bibtex)
     record.build_model()
     
     return record
 
+@traced('Database.fetch_citations')
+def fetch_citations(self,
+                    dois: list,
+                    local: Optional[str] = None,
+                    remote: Optional[str] = None,
+                    max_workers: Optional[int] = None,
+                    rate_limit: Optional[float] = 10.0,
+                    cache_dir: Union[str, Path, None] = None,
+                    crossref_url: Optional[str] = None,
+                    verbose: bool = False) -> list:
+    """
+    Retrieves multiple citations based on their DOIs.  The DOIs are looked up
+    in the local citation index, then the remote is searched for all of the
+    misses at once, first by DOI and then by record name.  The remaining
+    citations are downloaded from CrossRef concurrently, with the bibtex
+    responses being cached so that they are only downloaded once.
+
+    Parameters
+    ----------
+    dois : list of str
+        The citations' DOIs.  For citations with no DOI, the citation's record
+        name should be given instead.
+    local : bool, optional
+        Indicates if the local location is to be searched.  Default value
+        matches the value set when the database was initialized.
+    remote : bool, optional
+        Indicates if the remote location is to be searched.  Default value
+        matches the value set when the database was initialized.
+    max_workers : int, optional
+        The number of threads to download from CrossRef with.  If None
+        (default) or 1, the citations are downloaded serially.
+    rate_limit : float or None, optional
+        The maximum number of CrossRef requests to start per second.  Default
+        value is 10.  If None, the requests are not limited.
+    cache_dir : path-like object, optional
+        The directory where bibtex responses from CrossRef are cached.
+        Default value is the doi_cache directory in the settings directory.
+    crossref_url : str, optional
+        The base URL for the CrossRef content negotiation requests.  Default
+        value is https://doi.org.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+
+    Returns
+    -------
+    list of Citation
+        The citations in the same order as dois.
+    """
+    if isinstance(dois, str):
+        dois = [dois]
+    keys = lower_doi(dois)
+    found = {}
+
+    if local is None:
+        local = self.local
+    if remote is None:
+        remote = self.remote
+
+    if len(keys) > 0 and local:
+        index = self.citation_index(verbose=verbose)
+        for key in keys:
+            if key not in found:
+                record = index.find(key)
+                if record is not None:
+                    found[key] = record
+    if remote:
+        # Find remote matches for the misses based on doi
+        misses = sorted({key for key in keys if key not in found})
+        if len(misses) > 0:
+            with span('remote doi', count=len(misses)):
+                records = self.get_citations(doi=misses, local=False,
+                                             remote=True, verbose=verbose)
+                for record in records:
+                    if record.doi is not None:
+                        found.setdefault(record.doi.lower(), record)
+
+        # Find remote matches for the remaining misses based on name
+        misses = sorted({doi for key, doi in zip(keys, dois) if key not in found})
+        if len(misses) > 0:
+            with span('remote name', count=len(misses)):
+                records = self.get_citations(name=misses, local=False,
+                                             remote=True, verbose=verbose)
+                for record in records:
+                    found.setdefault(record.name.lower(), record)
+
+    # Fetch from CrossRef if database search failed/skipped
+    misses = {}
+    for key, doi in zip(keys, dois):
+        if key not in found:
+            misses.setdefault(key, doi)
+    if len(misses) > 0:
+        limiter = RateLimiter(rate_limit)
+        def fetch(doi):
+            return crossref_bibtex(doi, cache_dir=cache_dir, url=crossref_url,
+                                   limiter=limiter)
+
+        with span('crossref', count=len(misses)):
+            results = list(map_concurrent(fetch, misses.values(), max_workers))
+        numcached = 0
+        for key, (bibtex, cached) in zip(misses, results):
+            record = load_record('Citation')
+            record.load_bibtex(bibtex)
+            record.build_model()
+            found[key] = record
+            numcached += cached
+
+        if verbose:
+            print(f'{len(misses) - numcached} citations retrieved from CrossRef')
+            print(f'{numcached} citations retrieved from DOI cache')
+
+    if verbose:
+        print(f'{len(keys) - len(misses)} citations found in the database')
+
+    return [found[key] for key in keys]
+
+def citation_index(self,
+                   refresh: bool = False,
+                   verbose: bool = False) -> CitationIndex:
+    """
+    Returns the index of local citations by DOI and record name that is used
+    by fetch_citation.  The index is built from a single search of the local
+    metadata and is rebuilt after citations are saved, deleted or downloaded
+    with this Database object, or if files are added to or removed from a
+    local-style library.  Citations missing from the index are searched for
+    in the remote separately.
+
+    Parameters
+    ----------
+    refresh : bool, optional
+        If True, the index is rebuilt even if it is current.  Default value
+        is False.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+
+    Returns
+    -------
+    CitationIndex
+        The citation index for the local location.
+    """
+    index = self.citation_indexes.get('local', None)
+    if refresh or index is None or index.signature != local_signature(self):
+        with span('build citation index'):
+            records, df = self.get_records(style='Citation', local=True,
+                                           remote=False, return_df=True,
+                                           lazy=True, verbose=verbose)
+            index = CitationIndex(records, df, local_signature(self))
+        self.citation_indexes['local'] = index
+        if verbose:
+            print(f'Citation index built with {len(index)} citations')
+
+    return index
+
+def remote_citation(self,
+                    doi: str,
+                    verbose: bool = False) -> Optional[Record]:
+    """
+    Searches the remote for a single citation by DOI, then by record name.
+    Returns None if no unique match is found.
+    """
+    try:
+        return self.get_citation(doi=doi, local=False, remote=True,
+                                 prompt=False, verbose=verbose)
+    except ValueError:
+        pass
+    try:
+        return self.get_citation(name=doi, local=False, remote=True,
+                                 prompt=False, verbose=verbose)
+    except ValueError:
+        return None
+
+def local_signature(self) -> Optional[int]:
+    """
+    Returns the modification time of a local-style library's Citation
+    directory, which changes when citation files are added or removed.
+    Returns None for other database styles.
+    """
+    database = self.local_database
+    if database is None or database.style != 'local':
+        return None
+    try:
+        return Path(database.host, 'Citation').stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def crossref_bibtex(doi: str,
+                    cache_dir: Union[str, Path, None] = None,
+                    url: Optional[str] = None,
+                    limiter: Optional[RateLimiter] = None) -> Tuple[str, bool]:
+    """
+    Gets the bibtex for a DOI from CrossRef, using a cached response if one
+    exists and caching new responses.
+
+    Parameters
+    ----------
+    doi : str
+        The DOI to get the bibtex for.
+    cache_dir : path-like object, optional
+        The directory where the responses are cached.  Default value is the
+        doi_cache directory in the settings directory.
+    url : str, optional
+        The base URL for the content negotiation request.  Default value is
+        https://doi.org.
+    limiter : RateLimiter, optional
+        If given, the request waits for the limiter before starting.
+
+    Returns
+    -------
+    bibtex : str
+        The bibtex response.
+    cached : bool
+        True if the bibtex was found in the cache.
+    """
+    if cache_dir is None:
+        cache_dir = settings.doi_cache_directory
+    fname = Path(cache_dir, f'{quote(doi.lower(), safe="")}.bib')
+    if fname.is_file():
+        return fname.read_text(encoding='UTF-8'), True
+
+    if limiter is not None:
+        limiter.wait()
+    kwargs = {}
+    if url is not None:
+        kwargs['url'] = url
+    with span('crossref request', doi=doi):
+        bibtex = cn.content_negotiation(ids=doi, format='bibtex', **kwargs)
+
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    atomic_write(fname, lambda f: f.write(bibtex))
+    return bibtex, False
+
+@traced('Database.download_citations')
 def download_citations(self,
                        name: Union[str, list, None] = None,
                        doctype: Union[str, list, None] = None,
@@ -384,7 +648,11 @@ def download_citations(self,
                        author: Union[str, list, None] = None,
                        overwrite: bool = False,
                        return_records: bool = False,
-                       verbose: bool = False) -> Optional[np.ndarray]:
+                       incremental: bool = False,
+                       prune: bool = False,
+                       page_size: int = 100,
+                       verbose: bool = False,
+                       output: Optional[TextIO] = None) -> Optional[np.ndarray]:
     """
     Downloads citations from the remote to the local.
 
@@ -413,15 +681,29 @@ def download_citations(self,
     return_records : bool, optional
         If True, the retrieved record objects are also returned.  Default
         value is False.
+    incremental : bool, optional
+        If True, only new and changed records, as identified by comparing
+        content hashes, are written to the local and changed records are
+        always updated.  Default value is False.
+    prune : bool, optional
+        If True and incremental is True, matching local records that are not
+        in the remote are deleted.  Default value is False.
+    page_size : int, optional
+        The records are retrieved from the remote and saved to the local in
+        pages of this many records.  Default value is 100.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
+    output : file-like object, optional
+        The stream that info messages are written to if verbose is True.
+        Default value is sys.stdout.
     """
     doi = lower_doi(doi)
 
     return self.download_records(
         style='Citation', name=name, overwrite=overwrite,
-        return_records=return_records, verbose=verbose,
+        incremental=incremental, prune=prune, page_size=page_size,
+        return_records=return_records, verbose=verbose, output=output,
         doctype=doctype, title=title, givenname=givenname, surname=surname,
         suffix=suffix, publication=publication, year=year, month=month,
         volume=volume, issue=issue, abstract=abstract, pages=pages, doi=doi,
@@ -508,16 +790,3 @@ def delete_citation(self,
     """
     self.delete_record(record=citation, local=local, remote=remote,
                        verbose=verbose)
-    
-def lower_doi(doi):
-    """
-    Utility function to transform any doi values to lowercase.
-    """
-    if doi is None:
-        return None
-    elif isinstance(doi, str):
-        return doi.lower()
-    elif hasattr(doi, '__iter__'):
-        return [d.lower() for d in doi]
-    else:
-        raise(TypeError, 'doi must be None, str, or a list of str')
\ No newline at end of file
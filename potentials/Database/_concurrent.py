@@ -0,0 +1,133 @@
+# coding: utf-8
+# Standard Python libraries
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+# Local imports
+from ..tools.instrumentation import propagate
+
+def map_concurrent(fxn: Callable,
+                   items: Iterable,
+                   max_workers: Optional[int] = None) -> Iterator:
+    """
+    Maps a function over items using a pool of threads, yielding the results
+    in the same order as the items.  Intended for I/O bound tasks such as
+    downloads.
+
+    Parameters
+    ----------
+    fxn : callable
+        The function to call on each item.
+    items : iterable
+        The items to call the function on.
+    max_workers : int, optional
+        The number of threads to use.  If None (default) or 1, the function is
+        called on the items serially in the calling thread.
+
+    Yields
+    ------
+    any
+        The function's return values.
+    """
+    if max_workers is None or max_workers <= 1:
+        for item in items:
+            yield fxn(item)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for result in executor.map(propagate(fxn), items):
+                yield result
+
+class RateLimiter():
+    """
+    Spaces out calls made from any number of threads so that no more than a
+    given number start per second.
+    """
+    def __init__(self, rate: Optional[float] = None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        rate : float, optional
+            The maximum number of calls per second.  If None (default), calls
+            are not limited.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be a positive number')
+        self.__interval = 0.0 if rate is None else 1.0 / rate
+        self.__next = 0.0
+        self.__lock = threading.Lock()
+
+    def wait(self):
+        """Blocks the calling thread until its call is allowed to start"""
+        if self.__interval == 0.0:
+            return
+        with self.__lock:
+            now = time.monotonic()
+            start = max(now, self.__next)
+            self.__next = start + self.__interval
+        if start > now:
+            time.sleep(start - now)
+
+def prefetch(items: Iterable,
+             size: int = 1) -> Iterator:
+    """
+    Iterates over items while a background thread retrieves the next items
+    ahead of the consumer.  Useful for overlapping the retrieval of pages of
+    results with processing the current page.
+
+    Parameters
+    ----------
+    items : iterable
+        The items to iterate over.  The iteration is done in the background
+        thread.
+    size : int, optional
+        The maximum number of items to retrieve ahead of the consumer.
+        Default value is 1.
+
+    Yields
+    ------
+    any
+        The items in order.  Any exception raised while retrieving the items
+        is raised by the consumer when it is reached.
+    """
+    end = object()
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        """Puts an item in the buffer unless the consumer stopped"""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            put((end, e))
+        else:
+            put((end, None))
+
+    thread = threading.Thread(target=propagate(produce), daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        stop.set()
+        thread.join()
@@ -12,6 +12,11 @@ import pandas as pd
 # https://github.com/usnistgov/yabadaba
 from yabadaba.record import Record
 
+# Local imports
+from .QueryCache import cached_query
+from ..tools.instrumentation import traced
+
+@cached_query('FAQ')
 def get_faqs(self, 
              name: Union[str, list, None] = None,
              question: Union[str, list, None] = None,
@@ -65,6 +70,7 @@ def get_faqs(self,
         refresh_cache=refresh_cache, return_df=return_df, verbose=verbose,
         question=question, answer=answer)
 
+@cached_query('FAQ')
 def get_faq(self, 
             name: Union[str, list, None] = None,
             question: Union[str, list, None] = None,
@@ -180,12 +186,16 @@ def retrieve_faq(self,
         refresh_cache=refresh_cache, verbose=verbose,
         question=question, answer=answer)
 
+@traced('Database.download_faqs')
 def download_faqs(self, 
                   name: Union[str, list, None] = None,
                   question: Union[str, list, None] = None,
                   answer: Union[str, list, None] = None,
                   overwrite: bool = False,
                   return_records: bool = False,
+                  incremental: bool = False,
+                  prune: bool = False,
+                  page_size: int = 100,
                   verbose: bool = False) -> Optional[np.ndarray]:
     """
     Downloads FAQs from the remote to the local.
@@ -205,12 +215,23 @@ def download_faqs(self,
     return_records : bool, optional
         If True, the retrieved record objects are also returned.  Default
         value is False.
+    incremental : bool, optional
+        If True, only new and changed records, as identified by comparing
+        content hashes, are written to the local and changed records are
+        always updated.  Default value is False.
+    prune : bool, optional
+        If True and incremental is True, matching local records that are not
+        in the remote are deleted.  Default value is False.
+    page_size : int, optional
+        The records are retrieved from the remote and saved to the local in
+        pages of this many records.  Default value is 100.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
     """
     return self.download_records(
         style='FAQ', name=name, overwrite=overwrite,
+        incremental=incremental, prune=prune, page_size=page_size,
         return_records=return_records, verbose=verbose,
         question=question, answer=answer)
 
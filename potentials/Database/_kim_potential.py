@@ -15,7 +15,9 @@ import pandas as pd
 from yabadaba import load_query
 
 # Local imports
+from .QueryCache import cached_query
 from ..tools import aslist
+from ..tools.instrumentation import span, traced
 from .. import settings, load_record
 
 @property
@@ -23,6 +25,8 @@ def kim_models(self) -> list:
     """list: The full KIM ids of the installed KIM models"""
     return self.__kim_models
 
+@traced('Database.get_kim_lammps_potentials')
+@cached_query('potential_LAMMPS_KIM')
 def get_kim_lammps_potentials(self, 
                               name: Union[str, list, None] = None,
                               key: Union[str, list, None] = None,
@@ -142,68 +146,70 @@ def get_kim_lammps_potentials(self,
         atom_style=atom_style, pair_style=pair_style, status=status,
         symbols=symbols, elements=elements)
     
-    # Build list of records based on kim_models and expand potentials
-    records2 = []
-    df2 = []
-    if len(records1) > 0:
-        for fullid in kim_models:
-            if '__MO_' in fullid:
-                shortcode = '_'.join(fullid.split('_')[-3:-1])
-
-                matches = df1[df1.name == shortcode]
-                if len(matches) == 1:
-                    dbrecord = records1[matches.index.tolist()[0]]
-                    record = load_record('potential_LAMMPS_KIM', model=dbrecord.model, id=fullid)
-
-                    # Capture records as is if associated with one potential
-                    if len(record.potentials) == 1:
-                        records2.append(record)
-                        df2.append(record.metadata())
-
-                    else:
-                        # Loop over potential keys
-                        for potential in record.potentials:
-                            record.select_potential(potkey=potential.key)
-
-                            # Limit based on search parameters
-                            if potkey is not None and record.potkey not in aslist(potkey):
-                                continue
-                            if potid is not None and record.potid not in aslist(potid):
-                                continue
-                            if symbols is not None:
-                                nomatch = False
-                                for symbol in aslist(symbols):
-                                    if symbol not in record.symbols:
-                                        nomatch = True
-                                        break
-                                if nomatch:
-                                    continue
-                            if elements is not None:
-                                nomatch = False
-                                record_elements = record.elements()
-                                for element in aslist(elements):
-                                    if element not in record_elements:
-                                        nomatch = True
-                                        break
-                                if nomatch:
-                                    continue
-
-                            # Capture copy of the record
-                            records2.append(deepcopy(record))
+    with span('expand KIM models', models=len(kim_models)) as phase:
+        # Build list of records based on kim_models and expand potentials
+        records2 = []
+        df2 = []
+        if len(records1) > 0:
+            for fullid in kim_models:
+                if '__MO_' in fullid:
+                    shortcode = '_'.join(fullid.split('_')[-3:-1])
+
+                    matches = df1[df1.name == shortcode]
+                    if len(matches) == 1:
+                        dbrecord = records1[matches.index.tolist()[0]]
+                        record = load_record('potential_LAMMPS_KIM', model=dbrecord.model, id=fullid)
+
+                        # Capture records as is if associated with one potential
+                        if len(record.potentials) == 1:
+                            records2.append(record)
                             df2.append(record.metadata())
 
-    records2 = np.array(records2)
-    df2 = pd.DataFrame(df2)
-
-    # Filter by key and id if needed
-    if len(records2) > 0:
-        matches = (
-            load_query('str_match', name='key').pandas(df2, key)
-            &load_query('str_match', name='id').pandas(df2, id)
-        )
-        df2 = df2[matches]
-        records2 = records2[matches]
-        df2.reset_index(drop=True)
+                        else:
+                            # Loop over potential keys
+                            for potential in record.potentials:
+                                record.select_potential(potkey=potential.key)
+
+                                # Limit based on search parameters
+                                if potkey is not None and record.potkey not in aslist(potkey):
+                                    continue
+                                if potid is not None and record.potid not in aslist(potid):
+                                    continue
+                                if symbols is not None:
+                                    nomatch = False
+                                    for symbol in aslist(symbols):
+                                        if symbol not in record.symbols:
+                                            nomatch = True
+                                            break
+                                    if nomatch:
+                                        continue
+                                if elements is not None:
+                                    nomatch = False
+                                    record_elements = record.elements()
+                                    for element in aslist(elements):
+                                        if element not in record_elements:
+                                            nomatch = True
+                                            break
+                                    if nomatch:
+                                        continue
+
+                                # Capture copy of the record
+                                records2.append(deepcopy(record))
+                                df2.append(record.metadata())
+
+        records2 = np.array(records2)
+        df2 = pd.DataFrame(df2)
+
+        # Filter by key and id if needed
+        if len(records2) > 0:
+            matches = (
+                load_query('str_match', name='key').pandas(df2, key)
+                &load_query('str_match', name='id').pandas(df2, id)
+            )
+            df2 = df2[matches]
+            records2 = records2[matches]
+            df2.reset_index(drop=True)
+        phase.set(count=len(records2))
 
     if verbose:
         print(f'Built {len(records2)} lammps potentials for KIM models')
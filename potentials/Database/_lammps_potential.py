@@ -3,7 +3,7 @@
 from pathlib import Path
 import shutil
 import tempfile
-from typing import Optional, Tuple, Union
+from typing import Optional, TextIO, Tuple, Union
 
 # https://numpy.org/
 import numpy as np
@@ -15,8 +15,12 @@ import pandas as pd
 from yabadaba.record import Record
 
 # Local imports
+from .QueryCache import cached_query
 from .. import settings
+from ..tools.instrumentation import span, traced
+from ._concurrent import map_concurrent
 
+@cached_query(['potential_LAMMPS', 'potential_LAMMPS_KIM'])
 def get_lammps_potentials(self,
                           name: Union[str, list, None] = None,
                           key: Union[str, list, None] = None,
@@ -37,6 +41,7 @@ def get_lammps_potentials(self,
                           remote: Optional[bool] = None,
                           refresh_cache: bool = False,
                           return_df: bool = False,
+                          max_workers: Optional[int] = None,
                           verbose: bool = False
                           ) -> Union[np.ndarray, Tuple[np.ndarray, pd.DataFrame]]:
     """
@@ -104,6 +109,11 @@ def get_lammps_potentials(self,
     return_df : bool, optional
         If True, then the corresponding pandas.Dataframe of metadata
         will also be returned.
+    max_workers : int, optional
+        If given, the local record files that need to be parsed to update the
+        metadata cache are handled by this many worker processes.  Only
+        applies if the local database is of style "local".  Default value is
+        None, which parses the files serially.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
@@ -127,7 +137,8 @@ def get_lammps_potentials(self,
     # Get native LAMMPS potentials
     records, df = self.get_records(
         style='potential_LAMMPS', name=name, local=local, remote=remote,
-        refresh_cache=refresh_cache, return_df=True, verbose=verbose,
+        refresh_cache=refresh_cache, return_df=True,
+        max_workers=max_workers, verbose=verbose,
         key=key, id=id, potid=potid, potkey=potkey, units=units,
         atom_style=atom_style, pair_style=pair_style, status=status,
         symbols=symbols, elements=elements)
@@ -179,6 +190,7 @@ def promptfxn(df):
 
     return js[i]
 
+@cached_query(['potential_LAMMPS', 'potential_LAMMPS_KIM'])
 def get_lammps_potential(self,
                          name: Union[str, list, None] = None,
                          key: Union[str, list, None] = None,
@@ -473,6 +485,7 @@ def retrieve_lammps_potential(self,
         self.get_lammps_potential_files(lmppot, local=local, remote=remote,
                                         pot_dir=pot_dir, verbose=verbose)
     
+@traced('Database.download_lammps_potentials')
 def download_lammps_potentials(self,
                                name: Union[str, list, None] = None,
                                key: Union[str, list, None] = None,
@@ -488,8 +501,13 @@ def download_lammps_potentials(self,
                                include_kim: bool = True,
                                overwrite: bool = False,
                                return_records: bool = False,
+                               incremental: bool = False,
+                               prune: bool = False,
+                               page_size: int = 100,
                                downloadfiles: bool = False,
-                               verbose: bool = False) -> Optional[np.ndarray]:
+                               max_workers: Optional[int] = None,
+                               verbose: bool = False,
+                               output: Optional[TextIO] = None) -> Optional[np.ndarray]:
     """
     Downloads PotentialLAMMPS and PotentialLAMMPSKIM records and any associated
     parameter files from the database.
@@ -534,18 +552,36 @@ def download_lammps_potentials(self,
     return_records : bool, optional
         If True, the retrieved record objects are also returned.  Default
         value is False.
+    incremental : bool, optional
+        If True, only new and changed records, as identified by comparing
+        content hashes, are written to the local and changed records are
+        always updated.  Default value is False.
+    prune : bool, optional
+        If True and incremental is True, matching local records that are not
+        in the remote are deleted.  Default value is False.
+    page_size : int, optional
+        The records are retrieved from the remote and saved to the local in
+        pages of this many records.  Default value is 100.
     downloadfiles : bool, optional
         If True, then any parameter files associated with the potentials will
         also be downloaded.  Default value is False.
+    max_workers : int, optional
+        The number of threads to use for downloading parameter files
+        concurrently.  Default value is None, which downloads the files
+        serially.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
+    output : file-like object, optional
+        The stream that info messages are written to if verbose is True.
+        Default value is sys.stdout.
     """
 
     # Download and get matching potential_LAMMPS records
     records = self.download_records(
         style='potential_LAMMPS', name=name, overwrite=overwrite,
-        return_records=True, verbose=verbose, 
+        incremental=incremental, prune=prune, page_size=page_size,
+        return_records=True, verbose=verbose, output=output,
         key=key, id=id, potid=potid, potkey=potkey, units=units,
         atom_style=atom_style, pair_style=pair_style, status=status,
         symbols=symbols, elements=elements)
@@ -557,45 +593,52 @@ def download_lammps_potentials(self,
 
         if self.local_database.style == 'local':
             # Download directly to local style database
-            for lammps_potential in records:
+            def download(lammps_potential):
                 pot_dir = Path(self.local_database.host, 'potential_LAMMPS', lammps_potential.id)
-                nd, ns = lammps_potential.download_files(pot_dir=pot_dir, overwrite=overwrite)
+                with span('download files', id=lammps_potential.id):
+                    return lammps_potential.download_files(pot_dir=pot_dir, overwrite=overwrite)
+
+            for nd, ns in map_concurrent(download, records, max_workers):
                 num_downloaded += nd
                 num_skipped += ns
             if verbose:
                 if num_downloaded > 0:
-                    print(f'{num_downloaded} parameter files downloaded')
+                    print(f'{num_downloaded} parameter files downloaded', file=output)
                 if num_skipped > 0:
-                    print(f'{num_skipped} existing parameter files skipped')
+                    print(f'{num_skipped} existing parameter files skipped', file=output)
         
         else:
             # Download and then archive to other database styles
             with tempfile.TemporaryDirectory() as tmpdirname:
-                for lammps_potential in records:
-                    pot_id = lammps_potential.id
-                    pot_dir = Path(tmpdirname, pot_id)
-                    #tar_name = Path(tmpdirname, f'{pot_id}.tar.gz')
-                    lammps_potential.download_files(pot_dir=pot_dir)
-                    try:
-                        self.local_database.add_tar(record=lammps_potential, root_dir=tmpdirname)
-                        num_downloaded += 1
-                    except:
-                        if overwrite is True:
-                            self.local_database.update_tar(record=lammps_potential, root_dir=tmpdirname)
+                def download(lammps_potential):
+                    pot_dir = Path(tmpdirname, lammps_potential.id)
+                    with span('download files', id=lammps_potential.id):
+                        return lammps_potential.download_files(pot_dir=pot_dir)
+
+                # Archive each potential's files as soon as they are downloaded
+                for lammps_potential, _ in zip(records, map_concurrent(download, records, max_workers)):
+                    with span('archive files', id=lammps_potential.id):
+                        try:
+                            self.local_database.add_tar(record=lammps_potential, root_dir=tmpdirname)
                             num_downloaded += 1
-                        else:
-                            num_skipped += 1
+                        except:
+                            if overwrite is True:
+                                self.local_database.update_tar(record=lammps_potential, root_dir=tmpdirname)
+                                num_downloaded += 1
+                            else:
+                                num_skipped += 1
             if verbose:
                 if num_downloaded > 0:
-                    print(f'{num_downloaded} potentials had parameter files added')
+                    print(f'{num_downloaded} potentials had parameter files added', file=output)
                 if num_skipped > 0:
-                    print(f'{num_skipped} potentials were skipped for already having parameter files')
+                    print(f'{num_skipped} potentials were skipped for already having parameter files', file=output)
 
     # Download matching potential_LAMMPS_KIM records 
     if include_kim:
         kimrecords = self.download_records(
             style='potential_LAMMPS_KIM', name=name, overwrite=overwrite,
-            return_records=return_records, verbose=verbose,
+            incremental=incremental, prune=prune, page_size=page_size,
+            return_records=return_records, verbose=verbose, output=output,
             key=key, id=id, potid=potid, potkey=potkey, units=units,
             atom_style=atom_style, pair_style=pair_style,
             status=status, symbols=symbols, elements=elements)
@@ -606,6 +649,7 @@ def download_lammps_potentials(self,
     elif return_records:
         return records
 
+@traced('Database.get_lammps_potential_files')
 def get_lammps_potential_files(self,
                                lammps_potential: Record,
                                local: Optional[bool] = None,
@@ -670,23 +714,25 @@ def get_lammps_potential_files(self,
         
         # Check if local has folder or tar for the potential
         if local is True:
-            try:
-                dirpath = self.local_database.get_folder(record=lammps_potential)
-            except:
+            with span('find local files', id=lammps_potential.id):
                 try:
-                    tar = self.local_database.get_tar(record=lammps_potential)
+                    dirpath = self.local_database.get_folder(record=lammps_potential)
                 except:
-                    pass
+                    try:
+                        tar = self.local_database.get_tar(record=lammps_potential)
+                    except:
+                        pass
 
         # Check if remote has folder or tar for the potential
         if remote is True and dirpath is None and tar is None:
-            try:
-                dirpath = self.remote_database.get_folder(record=lammps_potential)
-            except:
+            with span('find remote files', id=lammps_potential.id):
                 try:
-                    tar = self.remote_database.get_tar(record=lammps_potential)
+                    dirpath = self.remote_database.get_folder(record=lammps_potential)
                 except:
-                    pass
+                    try:
+                        tar = self.remote_database.get_tar(record=lammps_potential)
+                    except:
+                        pass
 
         # Loop over listed artifacts
         for artifact in artifacts:
@@ -702,7 +748,8 @@ def get_lammps_potential_files(self,
                     # Copy from the local if it exists there
                     source_name = Path(dirpath, artifact.filename)
                     if source_name.is_file():
-                        shutil.copy2(source_name, dest_name)
+                        with span('copy file', filename=artifact.filename):
+                            shutil.copy2(source_name, dest_name)
                         copied = True
                         if verbose:
                             print(f'{artifact.filename} copied to {pot_dir}')
@@ -718,9 +765,10 @@ def get_lammps_potential_files(self,
                         if verbose:
                             print(f'{artifact.filename} missing from database archive')
                     else:
-                        with open(dest_name, 'wb') as fw:
-                            fw.write(fr.read())
-                        fr.close()
+                        with span('extract file', filename=artifact.filename):
+                            with open(dest_name, 'wb') as fw:
+                                fw.write(fr.read())
+                            fr.close()
                         copied = True
                         if verbose:
                             print(f'{artifact.filename} copied to {pot_dir}')    
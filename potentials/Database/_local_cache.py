@@ -0,0 +1,245 @@
+# coding: utf-8
+# Standard Python libraries
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+import tempfile
+from typing import Callable, Optional
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# https://github.com/usnistgov/yabadaba
+import yabadaba
+from yabadaba import load_record
+
+# Local imports
+from ..tools.instrumentation import traced
+
+def _load_metadata(style: str,
+                   host: str,
+                   format: str,
+                   names: list) -> list:
+    """
+    Worker function that parses a chunk of record files and returns their
+    metadata.  Metadata dicts rather than Record objects are returned as the
+    records cannot be pickled.
+    """
+    metadata = []
+    for name in names:
+        fname = Path(host, style, f'{name}.{format}')
+        record = load_record(style, model=fname, name=name)
+        metadata.append(record.metadata())
+    return metadata
+
+@traced('Database.update_local_cache', params=('style',))
+def update_local_cache(self,
+                       style: str,
+                       refresh: bool = False,
+                       max_workers: Optional[int] = None,
+                       verbose: bool = False) -> pd.DataFrame:
+    """
+    Updates the metadata cache csv file of a local-style local database by
+    parsing the new (or all if refresh is True) record files of a given style
+    in parallel.  The record files are split into chunks of names that are
+    handled by a pool of worker processes, and the resulting metadata is
+    ordered by record name so that the cache matches a serial build.
+
+    Parameters
+    ----------
+    style : str
+        The record style to update the metadata cache for.
+    refresh : bool, optional
+        If True, then the metadata for all records will be regenerated,
+        which is needed to update the metadata for modified records.  If False
+        (default), only the metadata for new records will be generated.
+    max_workers : int, optional
+        The number of worker processes to use.  If not given, the number of
+        processors on the machine is used.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The updated contents of the cache csv file.
+
+    Raises
+    ------
+    ValueError
+        If the local database is not set or is not of style local.
+    """
+    if self.local_database is None:
+        raise ValueError('local database info not set: initialize with local=True or call set_local_database')
+    if self.local_database.style != 'local':
+        raise ValueError('local database must be of style local to update its cache')
+
+    database = self.local_database
+    host = str(database.host)
+    cachefile = Path(host, f'{style}.csv')
+
+    # Load the existing cache without parsing any record files
+    if refresh:
+        cache = pd.DataFrame(columns=load_record(style).metadatakeys)
+    else:
+        cache = database.cache(style, addnew=False)
+
+    # Compare names in the cache to file names in the directory
+    cachenames = set(cache.name)
+    filenames = set([fname.stem for fname in Path(host, style).glob(f'*.{database.format}')])
+    newnames = sorted(filenames.difference(cachenames))
+    deletednames = cachenames.difference(filenames)
+    changed = refresh
+
+    # Split the new names into contiguous chunks and parse in parallel
+    if len(newnames) > 0:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        numchunks = min(len(newnames), max_workers * 4)
+        chunksize = -(-len(newnames) // numchunks)
+        chunks = [newnames[i:i + chunksize]
+                  for i in range(0, len(newnames), chunksize)]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            metadata = []
+            for chunkmetadata in executor.map(_load_metadata,
+                                              [style] * len(chunks),
+                                              [host] * len(chunks),
+                                              [database.format] * len(chunks),
+                                              chunks):
+                metadata.extend(chunkmetadata)
+
+        newrecords = pd.DataFrame(metadata)
+        if not cache.empty:
+            cache = pd.concat([cache, newrecords], sort=False)
+        else:
+            cache = newrecords
+        changed = True
+        if verbose:
+            print(f'Parsed metadata for {len(newnames)} {style} records')
+
+    # Delete missing entries
+    if len(deletednames) > 0:
+        cache = cache[~cache.name.isin(deletednames)]
+        changed = True
+
+    # Save cache ordered by name
+    if changed:
+        cache = cache.sort_values('name')
+        cache.to_csv(cachefile, index=False)
+
+    return cache.reset_index(drop=True)
+
+def atomic_write(fname: Path,
+                 write: Callable):
+    """
+    Writes a file by first writing to a temporary file in the same directory
+    and then swapping it into place.  This ensures that an interrupted write
+    cannot leave a partially written file behind.
+
+    Parameters
+    ----------
+    fname : path-like object
+        The path of the file to write.
+    write : callable
+        Function that writes the content to the open text file object that is
+        passed to it.
+    """
+    fname = Path(fname)
+    fd, tmpname = tempfile.mkstemp(dir=fname.parent, prefix=f'.{fname.name}.',
+                                   suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='UTF-8', newline='') as f:
+            write(f)
+        os.replace(tmpname, fname)
+    except BaseException:
+        Path(tmpname).unlink(missing_ok=True)
+        raise
+
+def write_local_records(database: yabadaba.database.Database,
+                        style: str,
+                        records: list,
+                        overwrite: bool = False) -> dict:
+    """
+    Saves multiple records of one style to a local-style database, writing
+    the metadata cache csv file once rather than relying on it being updated
+    for each record.  All files are written with atomic swaps and the cached
+    metadata of records being replaced is removed before the records are
+    written, so an interrupted batch leaves a cache that is regenerated
+    correctly.
+
+    Parameters
+    ----------
+    database : yabadaba.database.Database
+        The local-style database to save the records to.
+    style : str
+        The style of the records.
+    records : list of Record subclasses
+        The records to save.  If multiple records share a name, then the last
+        one is saved.
+    overwrite : bool, optional
+        If True, existing records with matching names are updated.  If False
+        (default), existing records are skipped.
+
+    Returns
+    -------
+    dict
+        The names of the 'added', 'updated' and 'skipped' records.
+    """
+    host = Path(database.host)
+    style_dir = Path(host, style)
+    style_dir.mkdir(exist_ok=True)
+    cachefile = Path(host, f'{style}.csv')
+
+    def savecache(cache):
+        atomic_write(cachefile, lambda f: cache.to_csv(f, index=False))
+
+    # Sort the records based on if they already exist
+    existing = set([fname.stem for fname in style_dir.glob(f'*.{database.format}')])
+    records = {record.name: record for record in records}
+    report = {'added': [], 'updated': [], 'skipped': []}
+    for name in records:
+        if name not in existing:
+            report['added'].append(name)
+        elif overwrite:
+            report['updated'].append(name)
+        else:
+            report['skipped'].append(name)
+    written = report['added'] + report['updated']
+    if len(written) == 0:
+        return report
+
+    # Remove outdated metadata before replacing any record files
+    cache = database.cache(style, addnew=False)
+    if len(report['updated']) > 0:
+        cache = cache[~cache.name.isin(report['updated'])]
+        savecache(cache)
+
+    # Write the record files
+    metadata = []
+    for name in written:
+        record = records[name]
+        try:
+            model = record.model
+            assert model is not None
+        except:
+            model = record.build_model()
+
+        if database.format == 'json':
+            write = lambda f: model.json(fp=f, indent=database.indent, ensure_ascii=False)
+        else:
+            write = lambda f: model.xml(fp=f, indent=database.indent)
+        atomic_write(Path(style_dir, f'{name}.{database.format}'), write)
+        metadata.append(record.metadata())
+
+    # Write the updated cache once
+    cache = cache[~cache.name.isin(written)]
+    newcache = pd.DataFrame(metadata)
+    if not cache.empty:
+        cache = pd.concat([cache, newcache], sort=False)
+    else:
+        cache = newcache
+    savecache(cache.sort_values('name'))
+
+    return report
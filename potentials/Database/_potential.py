@@ -1,7 +1,7 @@
 # coding: utf-8
 # Standard libraries
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Optional, TextIO, Tuple, Union
 
 # https://numpy.org/
 import numpy as np
@@ -12,6 +12,11 @@ import pandas as pd
 # https://github.com/usnistgov/yabadaba
 from yabadaba.record import Record
 
+# Local imports
+from .QueryCache import cached_query
+from ..tools.instrumentation import traced
+
+@cached_query('Potential')
 def get_potentials(self, 
                    name: Union[str, list, None] = None,
                    key: Union[str, list, None] = None,
@@ -28,6 +33,7 @@ def get_potentials(self,
                    remote: Optional[bool] = None,
                    refresh_cache: bool = False,
                    return_df: bool = False,
+                   max_workers: Optional[int] = None,
                    verbose: bool = False
                    ) -> Union[np.ndarray, Tuple[np.ndarray, pd.DataFrame]]:
     """
@@ -74,6 +80,11 @@ def get_potentials(self,
     return_df : bool, optional
         If True, then the corresponding pandas.Dataframe of metadata
         will also be returned.
+    max_workers : int, optional
+        If given, the local record files that need to be parsed to update the
+        metadata cache are handled by this many worker processes.  Only
+        applies if the local database is of style "local".  Default value is
+        None, which parses the files serially.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
@@ -88,11 +99,13 @@ def get_potentials(self,
     
     return self.get_records(
             style='Potential', name=name, local=local, remote=remote,
-            refresh_cache=refresh_cache, return_df=return_df, verbose=verbose,
+            refresh_cache=refresh_cache, return_df=return_df,
+            max_workers=max_workers, verbose=verbose,
             key=key, id=id, notes=notes, fictionalelements=fictionalelements, elements=elements,
             othername=othername, year=year, author=author,
             abstract=abstract, recorddate=recorddate)
 
+@cached_query('Potential')
 def get_potential(self, 
                   name: Union[str, list, None] = None,
                   key: Union[str, list, None] = None,
@@ -261,6 +274,7 @@ def retrieve_potential(self,
         othername=othername, year=year, author=author,
         abstract=abstract, recorddate=recorddate)
 
+@traced('Database.download_potentials')
 def download_potentials(self, 
                         name: Union[str, list, None] = None,
                         key: Union[str, list, None] = None,
@@ -275,7 +289,11 @@ def download_potentials(self,
                         recorddate: Union[str, list, None] = None,
                         overwrite: bool = False,
                         return_records: bool = False,
-                        verbose: bool = False) -> Optional[np.ndarray]:
+                        incremental: bool = False,
+                        prune: bool = False,
+                        page_size: int = 100,
+                        verbose: bool = False,
+                        output: Optional[TextIO] = None) -> Optional[np.ndarray]:
     """
     Downloads potentials from the remote to the local.
 
@@ -311,14 +329,28 @@ def download_potentials(self,
     return_records : bool, optional
         If True, the retrieved record objects are also returned.  Default
         value is False.
+    incremental : bool, optional
+        If True, only new and changed records, as identified by comparing
+        content hashes, are written to the local and changed records are
+        always updated.  Default value is False.
+    prune : bool, optional
+        If True and incremental is True, matching local records that are not
+        in the remote are deleted.  Default value is False.
+    page_size : int, optional
+        The records are retrieved from the remote and saved to the local in
+        pages of this many records.  Default value is 100.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
+    output : file-like object, optional
+        The stream that info messages are written to if verbose is True.
+        Default value is sys.stdout.
 
     """
     return self.download_records(
         style='Potential', name=name, overwrite=overwrite,
-        return_records=return_records, verbose=verbose,
+        incremental=incremental, prune=prune, page_size=page_size,
+        return_records=return_records, verbose=verbose, output=output,
         key=key, id=id, notes=notes, fictionalelements=fictionalelements, elements=elements,
         othername=othername, year=year, author=author,
         abstract=abstract, recorddate=recorddate)
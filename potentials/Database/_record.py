@@ -1,8 +1,9 @@
 # coding: utf-8
 # Standard Python libraries
+import hashlib
 import io
 from pathlib import Path
-from typing import Callable, Optional, Tuple, Union
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Tuple, Union
 
 # https://numpy.org/
 import numpy as np
@@ -14,9 +15,20 @@ import pandas as pd
 from DataModelDict import DataModelDict as DM
 
 # https://github.com/usnistgov/yabadaba
+import yabadaba
 from yabadaba.record import Record
 from yabadaba import load_record
 
+# Local imports
+from .QueryCache import cached_query
+from ..tools import iaslist
+from ..tools.instrumentation import span, traced
+from .LazyRecord import LazyRecord
+from ._concurrent import prefetch
+from ._local_cache import write_local_records
+
+@traced('Database.get_records', params=('style',))
+@cached_query()
 def get_records(self,
                 style: Optional[str] = None,
                 name: Union[str, list, None] = None,
@@ -24,6 +36,8 @@ def get_records(self,
                 remote: Optional[bool] = None,
                 refresh_cache: bool = False,
                 return_df: bool = False,
+                lazy: bool = False,
+                max_workers: Optional[int] = None,
                 verbose: bool = False,
                 **kwargs
                 ) -> Union[np.ndarray, Tuple[np.ndarray, pd.DataFrame]]:
@@ -54,6 +68,20 @@ def get_records(self,
     return_df : bool, optional
         If True, then the corresponding pandas.Dataframe of metadata
         will also be returned.
+    lazy : bool, optional
+        If True and the local database is of style "local", then the local
+        records are returned as LazyRecord proxies built from the metadata
+        cache.  The full record is only loaded when a non-metadata attribute
+        is accessed, and loaded records are kept in record_pool for reuse.
+        Remote records are always fully loaded as their metadata requires
+        parsing them.  Default value is False.
+    max_workers : int, optional
+        If given and the local database is of style "local", then the record
+        files that need to be parsed to build or refresh the metadata cache
+        are handled by a pool of this many worker processes.  This is opt-in
+        as it only pays off for large libraries, and combines well with
+        lazy=True as the cache build is then the dominant cost.  Default
+        value is None, which parses the files serially.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
@@ -92,7 +120,20 @@ def get_records(self,
                 raise ValueError('local database must be of style local to refresh cache')
             else:
                 kwargs['refresh_cache'] = refresh_cache
-        l_recs, l_df = self.local_database.get_records(style, name=name, return_df=True, **kwargs)
+        if max_workers is not None and self.local_database.style == 'local':
+            self.update_local_cache(style, refresh=refresh_cache,
+                                    max_workers=max_workers, verbose=verbose)
+            kwargs.pop('refresh_cache', None)
+        with span('local query', style=style, lazy=lazy) as phase:
+            if lazy and self.local_database.style == 'local':
+                l_df = self.local_database.get_records_df(style, name=name, **kwargs)
+                l_recs = np.empty(len(l_df), dtype=object)
+                for i, meta in enumerate(l_df.to_dict(orient='records')):
+                    l_recs[i] = LazyRecord(style, meta, self.local_database,
+                                           pool=self.record_pool)
+            else:
+                l_recs, l_df = self.local_database.get_records(style, name=name, return_df=True, **kwargs)
+            phase.set(count=len(l_recs))
         if len(l_recs) == 0:
             l_df = pd.DataFrame({'name':[]})
         if verbose:
@@ -103,41 +144,44 @@ def get_records(self,
     
     # Get remote records
     if remote:
-        try:
-            r_recs, r_df = self.remote_database.get_records(style, name=name,
-                                                            return_df=True, **kwargs)
-        except Exception as e:
-            r_recs = np.array([])
-            r_df = pd.DataFrame({'name':[]})
-            if verbose:
-                print(f'Remote access failed: {e}')
+        with span('remote query', style=style) as phase:
+            try:
+                r_recs, r_df = self.remote_database.get_records(style, name=name,
+                                                                return_df=True, **kwargs)
+            except Exception as e:
+                r_recs = np.array([])
+                r_df = pd.DataFrame({'name':[]})
+                if verbose:
+                    print(f'Remote access failed: {e}')
+            phase.set(count=len(r_recs))
         if verbose:
             print(f'Found {len(r_recs)} matching {style} records in remote library')
     else:
         r_recs = np.array([])
         r_df = pd.DataFrame({'name':[]})
 
-    # Combine results
-    if len(r_recs) == 0:
-        records = l_recs
-        df = l_df
-    elif len(l_recs) == 0:
-        records = r_recs
-        df = r_df
-    else:
-        # Identify missing remotes
-        newr_df = r_df[~r_df.name.isin(l_df.name)]
-        newr_recs = r_recs[newr_df.index.tolist()]
-        if verbose:
-            print(f' - {len(newr_recs)} remote records are new')
-        
-        # Combine local and new remote
-        records = np.hstack([l_recs, newr_recs])
-        df = pd.concat([l_df, newr_df], ignore_index=True, sort=False)
+    with span('merge', style=style):
+        # Combine results
+        if len(r_recs) == 0:
+            records = l_recs
+            df = l_df
+        elif len(l_recs) == 0:
+            records = r_recs
+            df = r_df
+        else:
+            # Identify missing remotes
+            newr_df = r_df[~r_df.name.isin(l_df.name)]
+            newr_recs = r_recs[newr_df.index.tolist()]
+            if verbose:
+                print(f' - {len(newr_recs)} remote records are new')
+            
+            # Combine local and new remote
+            records = np.hstack([l_recs, newr_recs])
+            df = pd.concat([l_df, newr_df], ignore_index=True, sort=False)
 
-    # Sort by name
-    df = df.sort_values('name')
-    records = records[df.index.tolist()]
+        # Sort by name
+        df = df.sort_values('name')
+        records = records[df.index.tolist()]
 
     # Return records (and df)
     if return_df:
@@ -145,6 +189,7 @@ def get_records(self,
     else:
         return records
     
+@cached_query()
 def get_record(self, 
                style: Optional[str] = None,
                name: Union[str, list, None] = None,
@@ -405,16 +450,136 @@ def remote_query(self,
     return self.remote_database.get_records(style=style, return_df=return_df,
                                             query=query, keyword=keyword, name=name)
 
+def iter_records(self,
+                 style: Optional[str] = None,
+                 name: Union[str, list, None] = None,
+                 page_size: int = 100,
+                 batches: bool = False,
+                 prefetch_pages: int = 1,
+                 **kwargs) -> Iterator:
+    """
+    Iterates over all matching records in the remote location.  The records
+    are retrieved in pages, and the records of each page are available as
+    soon as the page arrives while the next page is retrieved in the
+    background.  Unlike get_records, the records are not sorted by name and
+    only one page is held at a time.
+
+    Parameters
+    ----------
+    style : str, optional
+        The record style to search. If not given, a prompt will ask for it.
+    name : str or list, optional
+        The name(s) of records to limit the search by.
+    page_size : int, optional
+        The number of records to retrieve in each page.  For CDCS remotes,
+        this is rounded up to a multiple of the server's page size of 10.
+        Default value is 100.
+    batches : bool, optional
+        If True, each page of records is yielded as a list.  If False
+        (default), the records are yielded one at a time.
+    prefetch_pages : int, optional
+        The number of pages to retrieve ahead of the consumer.  Setting to 0
+        retrieves each page only when it is needed.  Default value is 1.
+    **kwargs : any, optional
+        Any extra keyword arguments supported by the record style.
+
+    Yields
+    ------
+    Record subclass or list
+        The retrieved records, or lists of records if batches is True.
+    
+    Raises
+    ------
+    ValueError
+        If the remote database interaction has not been set.
+    """
+    if self.remote_database is None:
+        raise ValueError('remote database info not set: initialize with remote=True or call set_remote_database')
+    if page_size < 1:
+        raise ValueError('page_size must be >= 1')
+    if style is None:
+        style = self.remote_database.select_record_style()
+
+    if self.remote_database.style == 'cdcs':
+        pages = iter_cdcs_pages(self.remote_database, style, name=name,
+                                page_size=page_size, **kwargs)
+    else:
+        pages = iter_pages(self.remote_database, style, name=name,
+                           page_size=page_size, **kwargs)
+    if prefetch_pages > 0:
+        pages = prefetch(pages, size=prefetch_pages)
+    
+    for records in pages:
+        if batches:
+            yield records
+        else:
+            yield from records
+
+def iter_pages(database: yabadaba.database.Database,
+               style: str,
+               name: Union[str, list, None] = None,
+               page_size: int = 100,
+               **kwargs) -> Iterator[list]:
+    """
+    Retrieves pages of matching records from a database by first finding the
+    names of all matching records from the metadata.
+    """
+    df = database.get_records_df(style, name=name, **kwargs)
+    if len(df) == 0:
+        return
+    names = df.name.tolist()
+    for i in range(0, len(names), page_size):
+        with span('remote page', style=style) as phase:
+            records = list(database.get_records(style, name=names[i:i + page_size]))
+            phase.set(count=len(records))
+        yield records
+
+def iter_cdcs_pages(database: yabadaba.database.Database,
+                    style: str,
+                    name: Union[str, list, None] = None,
+                    page_size: int = 100,
+                    **kwargs) -> Iterator[list]:
+    """
+    Retrieves pages of matching records from a CDCS database by requesting the
+    server's pages of 10 records one at a time.
+    """
+    cdcs = database.cdcs
+    query = load_record(style).cdcsquery(**kwargs)
+    serverpages = -(-page_size // 10)
+
+    for n in iaslist(name):
+        count = cdcs.query_count(template=style, title=n, mongoquery=query)
+        numpages = -(-count // 10)
+        for firstpage in range(1, numpages + 1, serverpages):
+            records = []
+            with span('remote page', style=style, page=firstpage) as phase:
+                for page in range(firstpage, min(firstpage + serverpages, numpages + 1)):
+                    data = cdcs.query(template=style, title=n, mongoquery=query,
+                                      page=page, progress_bar=False)
+                    for i in data.index:
+                        records.append(load_record(data.template_title[i],
+                                                   model=data.xml_content[i],
+                                                   name=data.title[i],
+                                                   database=database))
+                phase.set(count=len(records))
+            yield records
+
+@traced('Database.download_records', params=('style',))
 def download_records(self,
                      style: Optional[str] = None,
                      name: Union[str, list, None] = None,
                      overwrite: bool = False,
                      return_records: bool = False,
+                     incremental: bool = False,
+                     prune: bool = False,
+                     page_size: int = 100,
                      verbose: bool = False,
+                     output: Optional[TextIO] = None,
                      **kwargs) -> Optional[np.ndarray]:
     """
     Retrieves all matching records from the remote location and saves them to
-    the local location.
+    the local location.  The records are streamed page by page using
+    iter_records.
 
     Parameters
     ----------
@@ -429,9 +594,26 @@ def download_records(self,
     return_records : bool, optional
         If True, the retrieved record objects are also returned.  Default
         value is False.
+    incremental : bool, optional
+        If True, the content hash of each remote record is compared to the
+        matching local record, and only new and changed records are written
+        to the local location.  Changed records are always updated, i.e.
+        overwrite is ignored.  The numbers of added, updated, unchanged and
+        deleted records are reported if verbose is True.  Default value is
+        False.
+    prune : bool, optional
+        If True and incremental is True, then matching local records that are
+        not found in the remote location are deleted.  If False (default),
+        such records are only counted.
+    page_size : int, optional
+        The records are retrieved from the remote and saved to the local in
+        pages of this many records.  Default value is 100.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
+    output : file-like object, optional
+        The stream that info messages are written to if verbose is True.
+        Default value is sys.stdout.
     **kwargs : any, optional
         Any extra keyword arguments supported by the record style.
 
@@ -452,34 +634,54 @@ def download_records(self,
     if self.remote_database is None:
         raise ValueError('remote database info not set: initialize with remote=True or call set_remote_database')
     
-    # Get matching remote records
-    records = self.remote_database.get_records(style, name=name, **kwargs)
-    if verbose:
-        print(f'Found {len(records)} matching {style} records in remote library')
-    
-    num_added = 0
-    num_changed = 0
-    num_skipped = 0
-    for record in records:
-        try:
-            self.local_database.add_record(record=record)
-            num_added += 1
-        except:
-            if overwrite:
-                self.local_database.update_record(record=record)
-                num_changed += 1
-            else:
-                num_skipped += 1
+    # Stream pages of matching remote records into the local
+    retrieved = []
+    numfound = 0
+    def collect(pages):
+        nonlocal numfound
+        for records in pages:
+            numfound += len(records)
+            if return_records is True:
+                retrieved.extend(records)
+            yield records
+    pages = collect(self.iter_records(style, name=name, page_size=page_size,
+                                      batches=True, **kwargs))
+
+    try:
+        if incremental:
+            report = sync_records(self.local_database, style, pages, name=name,
+                                  prune=prune, **kwargs)
+        else:
+            report = {'added': 0, 'updated': 0, 'skipped': 0}
+            for records in pages:
+                with span('write local', style=style, count=len(records)):
+                    written = write_records(self.local_database, style, records,
+                                            overwrite=overwrite)
+                for key in report:
+                    report[key] += len(written[key])
+    finally:
+        # Invalidate after writing so results cached meanwhile are dropped
+        records_changed(self, style=style)
     
     if verbose:
-        print(num_added, 'new records added to local')
-        if num_changed > 0:
-            print(num_changed, 'existing records changed in local')
-        if num_skipped > 0:
-            print(num_skipped, 'existing records skipped')
+        print(f'Found {numfound} matching {style} records in remote library', file=output)
+        if incremental:
+            print(report['added'], 'new records added to local', file=output)
+            print(report['updated'], 'changed records updated in local', file=output)
+            print(report['unchanged'], 'unchanged records skipped', file=output)
+            if prune:
+                print(report['deleted'], 'records missing from remote deleted from local', file=output)
+            elif report['deleted'] > 0:
+                print(report['deleted'], 'local records missing from remote', file=output)
+        else:
+            print(report['added'], 'new records added to local', file=output)
+            if report['updated'] > 0:
+                print(report['updated'], 'existing records changed in local', file=output)
+            if report['skipped'] > 0:
+                print(report['skipped'], 'existing records skipped', file=output)
     
     if return_records is True:
-        return records
+        return np.array(retrieved)
 
 def save_record(self,
                 record: Optional[Record] = None,
@@ -522,6 +724,58 @@ def save_record(self,
                                               verbose=verbose)
         else:
             raise ValueError('Matching record already exists: use overwrite=True to change it') from e
+    finally:
+        records_changed(self, style=record.style, name=record.name)
+
+def save_records(self,
+                 records: list,
+                 overwrite: bool = False,
+                 verbose: bool = False) -> dict:
+    """
+    Saves multiple records to the local database.  For local-style databases,
+    the record files are written in bulk and the metadata cache is updated
+    once at the end, with all files written using atomic temp-file swaps.
+
+    Parameters
+    ----------
+    records : list of Record subclasses
+        The records to save.  Can be of different styles.
+    overwrite : bool, optional
+        Indicates what to do when a matching record is found in the local
+        location.  If False (default), then the record is skipped.  If True,
+        then the record is updated.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+
+    Returns
+    -------
+    dict
+        The names of the 'added', 'updated' and 'skipped' records.
+    """
+    # Group the records by style
+    styles = {}
+    for record in records:
+        styles.setdefault(record.style, []).append(record)
+    
+    report = {'added': [], 'updated': [], 'skipped': []}
+    for style, srecords in styles.items():
+        try:
+            sreport = write_records(self.local_database, style, srecords,
+                                    overwrite=overwrite)
+        finally:
+            records_changed(self, style=style)
+        for key in report:
+            report[key].extend(sreport[key])
+
+    if verbose:
+        print(len(report['added']), 'new records added to local')
+        if len(report['updated']) > 0:
+            print(len(report['updated']), 'existing records changed in local')
+        if len(report['skipped']) > 0:
+            print(len(report['skipped']), 'existing records skipped')
+
+    return report
 
 def upload_record(self,
                   record: Optional[Record] = None,
@@ -580,6 +834,8 @@ def upload_record(self,
                                                verbose=verbose)
         else:
             raise ValueError('Matching record already exists: use overwrite=True to change it') from e
+    finally:
+        records_changed(self, style=record.style, name=record.name)
 
 def delete_record(self,
                   record: Optional[Record] = None,
@@ -615,9 +871,185 @@ def delete_record(self,
         print('local and remote both False: no records deleted')
         return None
     
-    if local:
-        self.local_database.delete_record(record=record, name=name, style=style,
-                                          verbose=verbose)
-    if remote:
-        self.remote_database.delete_record(record=record, name=name, style=style,
-                                           verbose=verbose)
+    try:
+        if local:
+            self.local_database.delete_record(record=record, name=name, style=style,
+                                              verbose=verbose)
+        if remote:
+            self.remote_database.delete_record(record=record, name=name, style=style,
+                                               verbose=verbose)
+    finally:
+        if record is not None:
+            records_changed(self, style=record.style, name=record.name)
+        else:
+            records_changed(self, style=style, name=name)
+
+def records_changed(self,
+                    style: Optional[str] = None,
+                    name: Optional[str] = None):
+    """
+    Removes the records, query results and citation indexes affected by
+    changing records from the record pool, query cache and citation_indexes.
+
+    Parameters
+    ----------
+    style : str, optional
+        The style of the changed records.  If not given, all styles are
+        affected.
+    name : str, optional
+        The name of the changed record.  If not given, all records of the
+        style are affected.
+    """
+    self.record_pool.discard(style=style, name=name)
+    if style is None or style == 'Citation':
+        self.citation_indexes.clear()
+    if self.query_cache is not None:
+        self.query_cache.invalidate(style)
+
+def write_records(database: yabadaba.database.Database,
+                  style: str,
+                  records: list,
+                  overwrite: bool = False) -> dict:
+    """
+    Saves multiple records of one style to a database.  Local-style databases
+    use a batch write that updates the metadata cache once, while the records
+    are added or updated one at a time for other database styles.
+
+    Parameters
+    ----------
+    database : yabadaba.database.Database
+        The database to save the records to.
+    style : str
+        The style of the records.
+    records : list of Record subclasses
+        The records to save.
+    overwrite : bool, optional
+        If True, existing records with matching names are updated.  If False
+        (default), existing records are skipped.
+
+    Returns
+    -------
+    dict
+        The names of the 'added', 'updated' and 'skipped' records.
+    """
+    if database.style == 'local':
+        return write_local_records(database, style, records, overwrite=overwrite)
+
+    report = {'added': [], 'updated': [], 'skipped': []}
+    for record in records:
+        try:
+            database.add_record(record=record)
+            report['added'].append(record.name)
+        except:
+            if overwrite:
+                database.update_record(record=record)
+                report['updated'].append(record.name)
+            else:
+                report['skipped'].append(record.name)
+    return report
+
+def content_hash(model: DM) -> str:
+    """
+    Computes a hash of a record model's content that can be used to check if
+    two copies of a record are the same.
+
+    Parameters
+    ----------
+    model : DataModelDict.DataModelDict
+        The record's model contents.
+
+    Returns
+    -------
+    str
+        The sha256 hex digest of the model's compact JSON representation.
+    """
+    return hashlib.sha256(model.json().encode('UTF-8')).hexdigest()
+
+def local_content_hashes(database: yabadaba.database.Database,
+                         style: str,
+                         names: list) -> dict:
+    """
+    Computes content hashes for named records in a database.  For local-style
+    databases the record files are parsed directly without building the
+    Record objects.
+    """
+    hashes = {}
+    if len(names) == 0:
+        return hashes
+    if database.style == 'local':
+        for name in names:
+            fname = Path(database.host, style, f'{name}.{database.format}')
+            hashes[name] = content_hash(DM(fname))
+    else:
+        for record in database.get_records(style, name=names):
+            hashes[record.name] = content_hash(record.model)
+    return hashes
+
+def sync_records(database: yabadaba.database.Database,
+                 style: str,
+                 pages: Iterable,
+                 /,
+                 name: Union[str, list, None] = None,
+                 prune: bool = False,
+                 **kwargs) -> dict:
+    """
+    Incrementally syncs a database with retrieved remote records by
+    comparing content hashes.  Only new and changed records are written.
+
+    Parameters
+    ----------
+    database : yabadaba.database.Database
+        The database to sync the records to.
+    style : str
+        The record style.
+    pages : iterable
+        The retrieved remote records as an iterable of lists of records.  The
+        changed records of each page are written before the next page is
+        retrieved.
+    name : str or list, optional
+        The name(s) of records that the remote records were limited by.
+    prune : bool, optional
+        If True, then matching local records that are not in records are
+        deleted.  Default value is False.
+    **kwargs : any, optional
+        The record-style keyword arguments that the remote records were
+        limited by.
+
+    Returns
+    -------
+    dict
+        The numbers of 'added', 'updated', 'unchanged' and 'deleted' records.
+        If prune is False, 'deleted' counts the local records that are missing
+        from the remote.
+    """
+    # Find the matching local records and their content hashes
+    with span('hash local', style=style):
+        l_df = database.get_records_df(style, name=name, **kwargs)
+        localnames = l_df.name.tolist() if len(l_df) > 0 else []
+        hashes = local_content_hashes(database, style, localnames)
+
+    # Only write the new and changed records
+    report = {'added': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+    remotenames = set()
+    for records in pages:
+        changed = []
+        for record in records:
+            remotenames.add(record.name)
+            if (record.name not in hashes
+                or hashes[record.name] != content_hash(record.model)):
+                changed.append(record)
+            else:
+                report['unchanged'] += 1
+        with span('write local', style=style, count=len(changed)):
+            written = write_records(database, style, changed, overwrite=True)
+        report['added'] += len(written['added'])
+        report['updated'] += len(written['updated'])
+
+    # Handle local records that are no longer in the remote
+    for localname in localnames:
+        if localname not in remotenames:
+            if prune:
+                database.delete_record(style=style, name=localname)
+            report['deleted'] += 1
+
+    return report
@@ -9,10 +9,22 @@ import requests
 
 # Local imports
 from ..tools import aslist
+from .RelatedModels import RelatedModels
 
 @property
 def related_models(self) -> dict:
-    """dict : The list of all related models by interactions"""
+    """
+    dict : The list of all related models by interactions.  The dict is
+    cached, so changes made directly to it are kept until the related models
+    are next loaded, added to or sorted.
+    """
+    return related_sets(self).asdict()
+
+def related_sets(self) -> RelatedModels:
+    """
+    Returns the RelatedModels object that stores the related models, loading
+    the related-interactions.json file if it has not been loaded.
+    """
     try:
         return self.__related_models
     except:
@@ -48,7 +60,7 @@ def load_related_models(self,
         localfile = Path(self.local_database.host, 'related-interactions.json')
         if localfile.is_file():
             with open(localfile) as f:
-                self.__related_models = json.load(f)
+                self.__related_models = RelatedModels(json.load(f))
             if verbose:
                 print('related models loaded from the local location')
             return
@@ -57,7 +69,7 @@ def load_related_models(self,
         url = 'https://www.ctcms.nist.gov/potentials/site/related-interactions.json'
         r = requests.get(url)
         r.raise_for_status()
-        self.__related_models = json.loads(r.text)
+        self.__related_models = RelatedModels(json.loads(r.text))
         if verbose:
             print('related models downloaded from the web')
         return
@@ -78,31 +90,7 @@ def get_related_models(self, potid: str) -> dict:
     dict
         The list of all matching related models by interactions
     """
-    related_models = self.related_models
-
-    related = {}
-    
-    # Loop over all interactions
-    for interaction in related_models:
-        
-        # Loop over all sets of related models for the interaction
-        for potidset in related_models[interaction]:
-            
-            # If potid in the set, list all related pot ids for that interaction
-            if potid in potidset:
-                if interaction not in related:
-                    related[interaction] = []
-                    for potid2 in potidset:
-                        if potid != potid2:
-                            related[interaction].append(potid2)
-                
-                else:
-                    raise ValueError(f'{potid} in multiple sets for {interaction}')
-    
-    if len(related) == 0:
-        raise ValueError(f'{potid} not found in related models')
-
-    return related
+    return related_sets(self).related(potid)
 
 def save_related_models(self,
                         local: bool = True,
@@ -124,7 +112,7 @@ def save_related_models(self,
     if local is True:
         filename = Path(self.local_database.host, 'related-interactions.json')
         with open(filename, 'w') as f:
-            json.dump(self.related_models, fp=f)
+            json.dump(related_sets(self).asdict(), fp=f)
     
     # Save to altpath
     if altpath is not None:
@@ -135,7 +123,7 @@ def save_related_models(self,
 
         filename = Path(altpath, 'related-interactions.json')
         with open(filename, 'w') as f:
-            json.dump(self.related_models, fp=f)
+            json.dump(related_sets(self).asdict(), fp=f)
 
 def add_related_models(self,
                        potid: str,
@@ -175,8 +163,8 @@ def add_related_models(self,
         if len(related_ids) != len(interactions):
             raise ValueError('Different number of related_ids and interactions given')
 
-    # Get/load the related_models dict
-    related_models = self.related_models
+    # Get/load the related_models
+    related_models = related_sets(self)
 
     # Loop over all interactions
     for interaction, relid in zip(interactions, related_ids):
@@ -187,106 +175,13 @@ def add_related_models(self,
             assert len(terms) == 2
             interaction = '-'.join(sorted(terms))
 
-        # Check if interaction exists
-        if interaction not in related_models:
-            
-            # Add set to new interaction
-            if relid is None:
-                related_models[interaction] = [[potid]]
-            else:
-                related_models[interaction] = [[potid, relid]]
-            if verbose:
-                print(f'Set added to new interaction {interaction}')
-        
-        else:
-
-            # Pull out models for the interaction
-            int_models = related_models[interaction]
-            
-            # Search for ids in the sets
-            potsetindex = None
-            relsetindex = None
-            
-            for i, potidset in enumerate(int_models):
-
-                # Search for set containing potid
-                if potid in potidset:
-                    if potsetindex is None:
-                        potsetindex = i
-                    else:
-                        raise ValueError(f'{potid} found in multiple sets for {interaction}')
-                
-                # Search for set containing relid
-                if relid in potidset:
-                    if relsetindex is None:
-                        relsetindex = i
-                    else:
-                        raise ValueError(f'{relid} found in multiple sets for {interaction}')
-
-            # Add new set
-            if potsetindex is None and relsetindex is None:
-                if relid is None:
-                    int_models.append([potid])
-                else:
-                    int_models.append([potid, relid])
-                if verbose:
-                    print(f'New set added to {interaction}')
-            
-            # Add potid to an existing set
-            elif potsetindex is None:
-                int_models[relsetindex].append(potid)
-                if verbose:
-                    print(f'potid added to existing set for {interaction}')
-
-            # Add relid to an existing set
-            elif relsetindex is None:
-                if relid is not None:
-                    int_models[potsetindex].append(relid)
-                    if verbose:
-                        print(f'related id added to existing set containing potid for {interaction}')
-                else:
-                    if verbose:
-                        print(f'potid already in set for {interaction}')
-            
-            # Join sets if indices are different
-            elif potsetindex != relsetindex:
-                if potsetindex > relsetindex:
-                    potset = int_models.pop(potsetindex)
-                    relset = int_models.pop(relsetindex)
-                else:
-                    relset = int_models.pop(relsetindex)
-                    potset = int_models.pop(potsetindex)
-                int_models.append(potset + relset)
-                if verbose:
-                    print(f'existing sets now joined for {interaction}')
-            else:
-
-                if verbose:
-                    print(f'potid and related id already in the same set for {interaction}')
+        message = related_models.add(interaction, potid, relid)
+        if verbose:
+            print(f'{message} for {interaction}')
 
 def sort_related_models(self):
     """
     Sorts the related model dictionary by interactions and the contained sets
     by potential entry ids.
     """
-    related_models = self.related_models
-
-    sorted_related_models = {}
-
-    # Iterate over sorted interactions
-    for interaction in sorted(related_models.keys()):
-        sets = related_models[interaction]
-
-        # Sort each set
-        for i in range(len(sets)):
-            sets[i] = sorted(sets[i])
-
-        # Sort the sets by the first pot id in each
-        def sortkey(l):
-            return l[0]
-        sets = sorted(sets, key=sortkey)
-
-        sorted_related_models[interaction] = sets
-
-    # Replace related_models with the sorted version
-    self.__related_models = sorted_related_models
\ No newline at end of file
+    related_sets(self).sort()
@@ -0,0 +1,76 @@
+# coding: utf-8
+# Standard Python libraries
+import html as htmllib
+from pathlib import Path
+from typing import Optional, Union
+
+# Local imports
+from ..tools.instrumentation import span, traced
+from ._concurrent import map_concurrent
+from ._local_cache import atomic_write
+
+@traced('Database.render_html')
+def render_html(self,
+                records: list,
+                dest: Union[str, Path],
+                max_workers: Optional[int] = None,
+                index: bool = True,
+                verbose: bool = False) -> list:
+    """
+    Renders the HTML representations of records into a static output tree
+    where each record is saved as dest/<style>/<name>.html.  The compiled
+    xsl transformers are reused for all records of a style.
+
+    Parameters
+    ----------
+    records : list of Record subclasses
+        The records to render.  Can be of different styles.
+    dest : path-like object
+        The root directory of the output tree.
+    max_workers : int, optional
+        The number of threads to render records with.  If None (default) or
+        1, the records are rendered serially.
+    index : bool, optional
+        If True (default), an index.html page linking to the rendered records
+        is also written for each style.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+
+    Returns
+    -------
+    list of pathlib.Path
+        The paths to the rendered record pages, in the order of records.
+    """
+    dest = Path(dest)
+
+    # Create the style directories up front so workers only write files
+    styles = {}
+    for record in records:
+        styles.setdefault(record.style, []).append(record.name)
+    for style in styles:
+        Path(dest, style).mkdir(parents=True, exist_ok=True)
+
+    def render(record) -> Path:
+        fname = Path(dest, record.style, f'{record.name}.html')
+        with span('render record', style=record.style, name=record.name):
+            content = record.html()
+            atomic_write(fname, lambda f: f.write(content))
+        return fname
+
+    fnames = list(map_concurrent(render, records, max_workers))
+
+    # Write index pages listing the rendered records of each style
+    if index:
+        for style, names in styles.items():
+            links = '\n'.join(
+                f'<li><a href="{htmllib.escape(name, quote=True)}.html">{htmllib.escape(name)}</a></li>'
+                for name in sorted(names))
+            content = (f'<html>\n<head><title>{style}</title></head>\n<body>\n'
+                       f'<h1>{style}</h1>\n<ul>\n{links}\n</ul>\n</body>\n</html>\n')
+            atomic_write(Path(dest, style, 'index.html'), lambda f: f.write(content))
+
+    if verbose:
+        print(f'{len(fnames)} records rendered to {dest}')
+
+    return fnames
@@ -12,6 +12,11 @@ import pandas as pd
 # https://github.com/usnistgov/yabadaba
 from yabadaba.record import Record
 
+# Local imports
+from .QueryCache import cached_query
+from ..tools.instrumentation import traced
+
+@cached_query('Request')
 def get_requests(self, 
                  name: Union[str, list, None] = None,
                  date: Union[str, list, None] = None,
@@ -71,6 +76,7 @@ def get_requests(self,
         refresh_cache=refresh_cache, return_df=return_df, verbose=verbose,
         date=date, comment=comment, elements=elements, formula=formula)
 
+@cached_query('Request')
 def get_request(self, 
                 name: Union[str, list, None] = None,
                 date: Union[str, list, None] = None,
@@ -198,6 +204,7 @@ def retrieve_request(self,
         refresh_cache=refresh_cache, verbose=verbose,
         date=date, comment=comment, elements=elements, formula=formula)
 
+@traced('Database.download_requests')
 def download_requests(self, 
                       name: Union[str, list, None] = None,
                       date: Union[str, list, None] = None,
@@ -206,6 +213,9 @@ def download_requests(self,
                       formula: Union[str, list, None] = None,
                       overwrite: bool = False,
                       return_records: bool = False,
+                      incremental: bool = False,
+                      prune: bool = False,
+                      page_size: int = 100,
                       verbose: bool = False) -> Optional[np.ndarray]:
     """
     Downloads requests from the remote to the local.
@@ -229,12 +239,23 @@ def download_requests(self,
     return_records : bool, optional
         If True, the retrieved record objects are also returned.  Default
         value is False.
+    incremental : bool, optional
+        If True, only new and changed records, as identified by comparing
+        content hashes, are written to the local and changed records are
+        always updated.  Default value is False.
+    prune : bool, optional
+        If True and incremental is True, matching local records that are not
+        in the remote are deleted.  Default value is False.
+    page_size : int, optional
+        The records are retrieved from the remote and saved to the local in
+        pages of this many records.  Default value is 100.
     verbose : bool, optional
         If True, info messages will be printed during operations.  Default
         value is False.
     """
     return self.download_records(
         style='Request', name=name, overwrite=overwrite,
+        incremental=incremental, prune=prune, page_size=page_size,
         return_records=return_records, verbose=verbose,        
         date=date, comment=comment, elements=elements, formula=formula)
 
@@ -0,0 +1,150 @@
+# coding: utf-8
+# Standard Python libraries
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+from importlib import resources
+import json
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# Local imports
+from ..record._xsd import schema_errors
+from ..tools.instrumentation import span, traced
+from ._local_cache import atomic_write
+
+def _validate_chunk(xsd_filename: Tuple[str, str],
+                    items: list) -> list:
+    """
+    Worker function that validates a chunk of (key, xml content) items
+    against one schema and returns the (key, errors) of each.  The schema is
+    compiled once per worker process.
+    """
+    return [(key, schema_errors(xsd_filename, xml_content))
+            for key, xml_content in items]
+
+@traced('Database.validate_records', params=('style',))
+def validate_records(self,
+                     records: Optional[list] = None,
+                     style: Optional[str] = None,
+                     max_workers: Optional[int] = None,
+                     incremental: bool = False,
+                     cache_file: Union[str, Path, None] = None,
+                     verbose: bool = False,
+                     **kwargs) -> pd.DataFrame:
+    """
+    Validates records against the xml schemas of their styles.  Each schema
+    is compiled once per process, and the records can be validated by
+    multiple processes.
+
+    Parameters
+    ----------
+    records : list of Record subclasses, optional
+        The records to validate.  Can be of different styles.  If not
+        given, the records are found with get_records using style and
+        kwargs.
+    style : str, optional
+        The record style to get records for if records is not given.
+    max_workers : int, optional
+        The number of processes to validate with.  If None (default) or 1,
+        the records are validated in the calling process.
+    incremental : bool, optional
+        If True, records whose content and schema are unchanged since they
+        last passed validation are skipped.  Default value is False.
+    cache_file : path-like object, optional
+        A JSON file for keeping the hashes of records that passed validation
+        between sessions.  If not given, the hashes are only kept in
+        validation_cache.
+    verbose : bool, optional
+        If True, info messages will be printed during operations.  Default
+        value is False.
+    **kwargs : any, optional
+        Any extra keyword arguments for get_records.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The validation errors with columns style, name, line, column and
+        message.  Records with more than one error have multiple rows.  The
+        table is empty if all records are valid.
+    """
+    if records is None:
+        records = self.get_records(style, verbose=verbose, **kwargs)
+
+    # Load the hashes of previously validated records
+    cache = self.validation_cache
+    if cache_file is not None and Path(cache_file).is_file():
+        with open(cache_file, encoding='UTF-8') as f:
+            cache.update(json.load(f))
+
+    # Build the xml content of the records and skip unchanged valid records
+    schemahashes = {}
+    groups = {}
+    hashes = {}
+    styles = {}
+    numskipped = 0
+    with span('build xml', count=len(records)):
+        for record in records:
+            xsd_filename = record.xsd_filename
+            if xsd_filename not in schemahashes:
+                xsd = resources.files(xsd_filename[0]).joinpath(xsd_filename[1]).read_bytes()
+                schemahashes[xsd_filename] = hashlib.sha256(xsd).digest()
+
+            # The hash covers the schema and the record's compact JSON
+            key = f'{record.style}/{record.name}'
+            model = record.model
+            contenthash = hashlib.sha256(schemahashes[xsd_filename]
+                                         + model.json().encode('UTF-8')).hexdigest()
+            if incremental and cache.get(key, None) == contenthash:
+                numskipped += 1
+                continue
+            hashes[key] = contenthash
+            styles[key] = (record.style, record.name)
+            groups.setdefault(xsd_filename, []).append((key, model.xml().encode('UTF-8')))
+
+    # Split each schema's records into chunks and validate
+    tasks = []
+    for xsd_filename, items in groups.items():
+        if max_workers is None or max_workers <= 1:
+            numchunks = 1
+        else:
+            numchunks = min(len(items), max_workers * 4)
+        chunksize = -(-len(items) // numchunks)
+        for i in range(0, len(items), chunksize):
+            tasks.append((xsd_filename, items[i:i + chunksize]))
+
+    with span('validate', count=len(hashes)):
+        if max_workers is None or max_workers <= 1:
+            results = [_validate_chunk(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_validate_chunk, *zip(*tasks)))
+
+    # Collect errors and update the hashes of valid records
+    errors = []
+    invalid = set()
+    for result in results:
+        for key, keyerrors in result:
+            if len(keyerrors) == 0:
+                cache[key] = hashes[key]
+            else:
+                cache.pop(key, None)
+                invalid.add(key)
+                for line, column, message in keyerrors:
+                    errors.append({'style': styles[key][0], 'name': styles[key][1],
+                                   'line': line, 'column': column,
+                                   'message': message})
+    errors = pd.DataFrame(errors, columns=['style', 'name', 'line', 'column', 'message'])
+
+    if cache_file is not None:
+        atomic_write(cache_file, lambda f: json.dump(cache, f, indent=1, sort_keys=True))
+
+    if verbose:
+        print(f'{len(hashes)} records validated')
+        if numskipped > 0:
+            print(f'{numskipped} unchanged valid records skipped')
+        print(f'{len(invalid)} records failed validation')
+
+    return errors
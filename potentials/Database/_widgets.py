@@ -17,6 +17,7 @@ import pandas as pd
 
 # Local imports
 from .. import load_record
+from .PotentialIndex import PotentialIndex
 
 def widget_search_potentials(self,
                              potentials: Optional[npt.ArrayLike] = None,
@@ -44,26 +45,11 @@ def widget_search_potentials(self,
             potentials_df.append(potential.metadata())
         potentials_df = pd.DataFrame((potentials_df))
 
-    # Build list of all unique elements
-    unique_elements = set()
-    for elements in potentials_df[potentials_df.elements.notna()].elements.values:
-        unique_elements.update(elements)
-    for elements in potentials_df[potentials_df.fictionalelements.notna()].fictionalelements.values:
-        unique_elements.update(elements)
-    unique_elements = [''] + sorted(list(unique_elements))
-    
-    # Build list of all unique years
-    def getyears(series):
-        years = set()
-        for citation in series.citations:
-            if citation['year'] is not None:
-                years.add(citation['year'])
-        return years
-    unique_years = potentials_df.apply(getyears, axis=1)
-    unique_years = [''] + sorted(list(set().union(*unique_years)))
-
-    # Build list of all potential ids
-    potential_ids = potentials_df.id.tolist()
+    # Index the potentials by element, year and author
+    index = PotentialIndex(potentials, potentials_df)
+    unique_elements = [''] + index.elements
+    unique_years = [''] + index.years
+    potential_ids = index.ids
     
     # Create selection widgets
     element1_dropdown = widgets.Dropdown(options=unique_elements, description='Element1:')
@@ -81,7 +67,7 @@ def widget_search_potentials(self,
     # Initialize output for selected potential
     potential_output = widgets.Output()  
     with potential_output:
-        potentials[0].html(render=True)
+        display(HTML(index.html(potential_ids[0])))
     
     # Define function for updating list of potentials
     def update_potential_dropdown_options(change):
@@ -113,15 +99,10 @@ def widget_search_potentials(self,
             author = None
 
         # Parse potentials using author, year, elements
-        record =load_record('Potential')
-        matches = potentials_df[
-            record.pandasfilter(potentials_df, author=author, year=year)
-            & (record.pandasfilter(potentials_df, elements=elements) | 
-               record.pandasfilter(potentials_df, fictionalelements=elements))
-            ]
+        matches = index.search(elements=elements, year=year, author=author)
         
         # Update potential dropdown accordingly
-        potential_dropdown.options = matches.id.tolist()
+        potential_dropdown.options = matches
 
     # Tie elements, year and text widgets to above function
     element1_dropdown.observe(update_potential_dropdown_options, 'value')
@@ -134,9 +115,8 @@ def widget_search_potentials(self,
     def display_selected_potential(change):
         
         # Select potential based on dropdown value
-        try:
-            potential = potentials[potentials_df.id == potential_dropdown.value][0]
-        except IndexError:
+        html = index.html(potential_dropdown.value)
+        if html is None:
             with potential_output:
                 clear_output()
                 display(HTML('<b>No matching potentials found: try different selectors</b>'))
@@ -144,7 +124,7 @@ def widget_search_potentials(self,
             # Update potential output
             with potential_output:
                 clear_output()
-                potential.html(render=True)
+                display(HTML(html))
 
     # Tie potential widget to above function
     potential_dropdown.observe(display_selected_potential, 'value')
@@ -235,6 +235,11 @@ class Settings(yabadaba.Settings.Settings):
         """pathlib.Path : Path to the default KIM models file."""
         return Path(self.directory, 'kim_models.txt')
 
+    @property
+    def doi_cache_directory(self):
+        """pathlib.Path : Path to the default directory of cached CrossRef responses."""
+        return Path(self.directory, 'doi_cache')
+
     def set_kim_models(self,
                        kim_models: list,
                        kim_models_file: Optional[Path] = None):
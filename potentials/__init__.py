@@ -18,7 +18,7 @@ from . import record
 from .record import recordmanager, load_record
 
 # Import database methods
-from .Database import Database, load_database
+from .Database import Database, AsyncDatabase, load_database
 
 from . import buildrecord
 from .buildrecord import build_lammps_potential
@@ -27,5 +27,5 @@ from . import paramfile
 
 __all__ = ['__version__', 'tools', 'settings', 'paramfile', 'value',
            'record', 'load_record', 'recordmanager', 'buildrecord',
-           'Database', 'load_database',  'build_lammps_potential',]
+           'Database', 'AsyncDatabase', 'load_database',  'build_lammps_potential',]
 __all__.sort()
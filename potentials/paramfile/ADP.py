@@ -18,7 +18,8 @@ import matplotlib.pyplot as plt
 
 # Local imports
 from .EAMAlloy import EAMAlloy
-from ..tools import aslist, numderivative
+from ..tools import aslist, decimate, numderivative
+from .TablePool import TablePool
 class ADP(EAMAlloy):
     """
     Class for building and analyzing LAMMPS setfl adp parameter files 
@@ -36,7 +37,8 @@ class ADP(EAMAlloy):
                  deltar: Optional[float] = None,
                  numrho: Optional[int] = None,
                  cutoffrho: Optional[float] = None,
-                 deltarho: Optional[float] = None):
+                 deltarho: Optional[float] = None,
+                 dtype: npt.DTypeLike = 'float64'):
         """
         Class initializer. Element information can be set at this time.
         
@@ -84,6 +86,11 @@ class ADP(EAMAlloy):
         delta : float, optional
             The rho step size to use for the tabulation.  If not given, will
             be set as cutoffrho / (numrho - 1).
+        dtype : data-type, optional
+            The floating point dtype to store tabulated values as.  Default
+            value is 'float64'.  'float32' halves the memory of the tables
+            for analysis work.  Values are always returned and written as
+            float64.
         """
 
         # Initialize u terms
@@ -95,11 +102,15 @@ class ADP(EAMAlloy):
         self.__w_r = {}
         self.__w_r_kwargs = {}
         self.__w_r_table = {}
+
+        # Initialize shared storage of the tables
+        self.__tables = TablePool(dtype)
         
         super().__init__(f=f, header=header, symbol=symbol, number=number,
                          mass=mass, alat=alat, lattice=lattice,
                          numr=numr, cutoffr=cutoffr, deltar=deltar,
-                         numrho=numrho, cutoffrho=cutoffrho, deltarho=deltarho)
+                         numrho=numrho, cutoffrho=cutoffrho, deltarho=deltarho,
+                         dtype=dtype)
 
     @property
     def pair_style(self) -> str:
@@ -143,8 +154,8 @@ class ADP(EAMAlloy):
 
         if symbolstr in self.__u_r_table:
             if r is None:
-                # Directly return table
-                return self.__u_r_table[symbolstr]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__u_r_table[symbolstr], dtype=float)
 
             else:
                 # Build spline of table
@@ -220,7 +231,7 @@ class ADP(EAMAlloy):
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__u_r_table[symbolstr] = np.asarray(table)
+                self.__tables.store(self.__u_r_table, symbolstr, table)
                 if symbolstr in self.__u_r:
                     del self.__u_r[symbolstr]
                     del self.__u_r_kwargs[symbolstr]
@@ -233,14 +244,14 @@ class ADP(EAMAlloy):
                 self.__u_r[symbolstr] = CubicSpline(r, table)
                 self.__u_r_kwargs[symbolstr] = {}
                 if symbolstr in self.__u_r_table:
-                    del self.__u_r_table[symbolstr]
+                    self.__tables.discard(self.__u_r_table, symbolstr)
 
         else:
             # Set function and parameters
             self.__u_r[symbolstr] = fxn
             self.__u_r_kwargs[symbolstr] = kwargs
             if symbolstr in self.__u_r_table:
-                del self.__u_r_table[symbolstr]
+                self.__tables.discard(self.__u_r_table, symbolstr)
 
     def w_r(self,
             symbol: Optional[str] = None,
@@ -279,8 +290,8 @@ class ADP(EAMAlloy):
 
         if symbolstr in self.__w_r_table:
             if r is None:
-                # Directly return table
-                return self.__w_r_table[symbolstr]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__w_r_table[symbolstr], dtype=float)
 
             else:
                 # Build spline of table
@@ -356,7 +367,7 @@ class ADP(EAMAlloy):
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__w_r_table[symbolstr] = np.asarray(table)
+                self.__tables.store(self.__w_r_table, symbolstr, table)
                 if symbolstr in self.__w_r:
                     del self.__w_r[symbolstr]
                     del self.__w_r_kwargs[symbolstr]
@@ -369,14 +380,14 @@ class ADP(EAMAlloy):
                 self.__w_r[symbolstr] = CubicSpline(r, table)
                 self.__w_r_kwargs[symbolstr] = {}
                 if symbolstr in self.__w_r_table:
-                    del self.__w_r_table[symbolstr]
+                    self.__tables.discard(self.__w_r_table, symbolstr)
 
         else:
             # Set function and parameters
             self.__w_r[symbolstr] = fxn
             self.__w_r_kwargs[symbolstr] = kwargs
             if symbolstr in self.__w_r_table:
-                del self.__w_r_table[symbolstr]
+                self.__tables.discard(self.__w_r_table, symbolstr)
 
     def print_overview(self):
         """Prints an overview of set values"""
@@ -640,6 +651,7 @@ class ADP(EAMAlloy):
                  matplotlib_axes: Optional[plt.axes] = None,
                  xlim: Optional[Tuple[float, float]] = None,
                  ylim: Optional[Tuple[float, float]] = None,
+                 max_points: Optional[int] = 10000,
                  ) -> Optional[plt.figure]:
         """
         Generates a plot of u(r) vs. r.
@@ -668,6 +680,12 @@ class ADP(EAMAlloy):
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -691,13 +709,15 @@ class ADP(EAMAlloy):
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
             symbol = aslist(symbol)
             if len(symbol) == 1:
                 symbol += symbol
             u = self.u_r(symbol)
-            ax1.plot(*numderivative(r, u, n=n), label='-'.join(symbol))
+            ax1.plot(*decimate(*numderivative(r, u, n=n), max_points, xlim), label='-'.join(symbol))
         ax1.set_xlabel('r', size='x-large')
         
         if len(symbols) > 1:
@@ -711,8 +731,6 @@ class ADP(EAMAlloy):
             ylabel = f'∂$^{n}$(u(r)) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -728,6 +746,7 @@ class ADP(EAMAlloy):
                  matplotlib_axes: Optional[plt.axes] = None,
                  xlim: Optional[Tuple[float, float]] = None,
                  ylim: Optional[Tuple[float, float]] = None,
+                 max_points: Optional[int] = 10000,
                  ) -> Optional[plt.figure]:
         """
         Generates a plot of w(r) vs. r.
@@ -756,6 +775,12 @@ class ADP(EAMAlloy):
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -779,13 +804,15 @@ class ADP(EAMAlloy):
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
             symbol = aslist(symbol)
             if len(symbol) == 1:
                 symbol += symbol
             w = self.w_r(symbol)
-            ax1.plot(*numderivative(r, w, n=n), label='-'.join(symbol))
+            ax1.plot(*decimate(*numderivative(r, w, n=n), max_points, xlim), label='-'.join(symbol))
         ax1.set_xlabel('r', size='x-large')
         
         if len(symbols) > 1:
@@ -799,8 +826,6 @@ class ADP(EAMAlloy):
             ylabel = f'∂$^{n}$(w(r)) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -16,7 +16,8 @@ import numpy.typing as npt
 import matplotlib.pyplot as plt
 
 # Local imports
-from ..tools import numderivative
+from ..tools import decimate, numderivative
+from .SplineCache import SplineCache
 
 class EAM():
     """
@@ -35,7 +36,8 @@ class EAM():
                  deltar: Optional[float] = None,
                  numrho: Optional[int] = None,
                  cutoffrho: Optional[float] = None,
-                 deltarho: Optional[float] = None):
+                 deltarho: Optional[float] = None,
+                 dtype: npt.DTypeLike = 'float64'):
         """
         Class initializer. Element information can be set at this time.
         
@@ -86,6 +88,11 @@ class EAM():
         delta : float, optional
             The rho step size to use for the tabulation.  If not given, will
             be set as cutoffrho / (numrho - 1).
+        dtype : data-type, optional
+            The floating point dtype to store tabulated values as.  Default
+            value is 'float64'.  'float32' halves the memory of the tables
+            for analysis work.  Values are always returned and written as
+            float64.
         """
         if constants == 'lammps':
             self.__hartree = 27.2
@@ -101,6 +108,11 @@ class EAM():
             except:
                 raise ValueError('Invalid constants: must be "lammps", "precise" or two floats')
 
+        # Set the storage dtype of the tables
+        self.__dtype = np.dtype(dtype)
+        if self.__dtype.kind != 'f':
+            raise ValueError('dtype must be a floating point type')
+
         # Initialize F terms
         self.__F_rho = None
         self.__F_rho_kwargs = None
@@ -121,6 +133,9 @@ class EAM():
         self.__rphi_r = None
         self.__rphi_r_kwargs = None
         self.__rphi_r_table = None
+
+        # Initialize splines of the tables and functions
+        self.__splines = SplineCache()
         
         # Initialize symbol terms
         self.__number = None
@@ -162,6 +177,11 @@ class EAM():
         """The LAMMPS pair_style associated with the class"""
         return 'eam'
 
+    @property
+    def dtype(self) -> np.dtype:
+        """numpy.dtype : The dtype that tabulated values are stored as"""
+        return self.__dtype
+
     @property
     def hartree(self) -> float:
         """float: conversion constant from Hartree to eV"""
@@ -373,7 +393,9 @@ class EAM():
         self.__alat = alat
         self.__lattice = lattice
 
-    def F_rho(self, rho: Optional[npt.ArrayLike] = None) -> np.ndarray:
+    def F_rho(self,
+              rho: Optional[npt.ArrayLike] = None,
+              derivative: int = 0) -> np.ndarray:
         """
         Returns F(rho) values.
 
@@ -382,20 +404,40 @@ class EAM():
         rho : array-like, optional
             The value(s) of rho to evaluate F_rho at.  If not given, will
             use the rho values set.
+        derivative : int, optional
+            Indicates which derivative of F(rho) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set rho values.
 
         Returns
         -------
         numpy.ndarray
             The F(rho) values corresponding to the given/set rho values.
-        """        
+        """
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__F_rho
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline('F_rho', self.rho,
+                                            lambda: self.F_rho())
+            if rho is None:
+                rho = self.rho
+            v = fxn(rho, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            return v
+        
         if self.__F_rho_table is not None:
             if rho is None:
                 # Directly return table
-                return self.__F_rho_table
+                return np.asarray(self.__F_rho_table, dtype=float)
             
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.rho, self.__F_rho_table)
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline('F_rho', self.rho,
+                                            lambda: self.__F_rho_table)
                 v = fxn(rho)
                 v[np.abs(v) <= 1e-100] = 0.0
                 return v
@@ -440,6 +482,8 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        self.__splines.discard('F_rho')
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -450,7 +494,7 @@ class EAM():
                     raise ValueError('Number of table and rho values not the same')
 
                 # Save tabulated values
-                self.__F_rho_table = np.asarray(table)
+                self.__F_rho_table = np.asarray(table, dtype=self.dtype)
                 self.__F_rho = None
                 self.__F_rho_kwargs = None
 
@@ -470,7 +514,9 @@ class EAM():
             self.__F_rho_kwargs = kwargs
             self.__F_rho_table = None
 
-    def rho_r(self, r: Optional[npt.ArrayLike] = None) -> np.ndarray:
+    def rho_r(self,
+              r: Optional[npt.ArrayLike] = None,
+              derivative: int = 0) -> np.ndarray:
         """
         Returns rho(r) values.
 
@@ -479,20 +525,41 @@ class EAM():
         r : array-like, optional
             The value(s) of r to evaluate rho(r) at.  If not given, will
             use the r values set.
+        derivative : int, optional
+            Indicates which derivative of rho(r) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set r values.
         
         Returns
         -------
         numpy.ndarray
             The rho(r) values corresponding to the given/set r values.
-        """        
+        """
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__rho_r
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline('rho_r', self.r,
+                                            lambda: self.rho_r())
+            if r is None:
+                r = self.r
+            v = fxn(r, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            v[r > self.cutoffr] = 0.0
+            return v
+        
         if self.__rho_r_table is not None:
             if r is None:
                 # Directly return table
-                return self.__rho_r_table
+                return np.asarray(self.__rho_r_table, dtype=float)
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rho_r_table)
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline('rho_r', self.r,
+                                            lambda: self.__rho_r_table)
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -539,6 +606,7 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        self.__splines.discard('rho_r')
 
         # Handle tabulated values
         if table is not None:
@@ -550,7 +618,7 @@ class EAM():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rho_r_table = np.asarray(table)
+                self.__rho_r_table = np.asarray(table, dtype=self.dtype)
                 self.__rho_r = None
                 self.__rho_r_kwargs = None
             
@@ -588,7 +656,7 @@ class EAM():
         if self.__z_r_table is not None:
             if r is None:
                 # Directly return table
-                return self.__z_r_table
+                return np.asarray(self.__z_r_table, dtype=float)
             
             else:
                 # Build spline of table
@@ -655,6 +723,8 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        self.__splines.discard('rphi_r')
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -665,7 +735,7 @@ class EAM():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__z_r_table = np.asarray(table)
+                self.__z_r_table = np.asarray(table, dtype=self.dtype)
                 self.__z_r = None
                 self.__z_r_kwargs = None
             
@@ -692,7 +762,9 @@ class EAM():
         self.__phi_r_kwargs = None
         self.__phi_r_table = None
 
-    def rphi_r(self, r: Optional[npt.ArrayLike] = None) -> np.ndarray:
+    def rphi_r(self,
+               r: Optional[npt.ArrayLike] = None,
+               derivative: int = 0) -> np.ndarray:
         """
         Returns r*phi(r) values.
 
@@ -701,20 +773,41 @@ class EAM():
         r : array-like, optional
             The value(s) of r to evaluate r*phi(r) at.  If not given, will
             use the r values set.
+        derivative : int, optional
+            Indicates which derivative of r*phi(r) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set r values.
         
         Returns
         -------
         numpy.ndarray
             The r*phi(r) values corresponding to the given/set r values.
         """
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__rphi_r
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline('rphi_r', self.r,
+                                            lambda: self.rphi_r())
+            if r is None:
+                r = self.r
+            v = fxn(r, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            v[r > self.cutoffr] = 0.0
+            return v
+
         if self.__rphi_r_table is not None:
             if r is None:
                 # Directly return table
-                return self.__rphi_r_table
+                return np.asarray(self.__rphi_r_table, dtype=float)
             
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rphi_r_table)
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline('rphi_r', self.r,
+                                            lambda: self.__rphi_r_table)
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -775,6 +868,8 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        self.__splines.discard('rphi_r')
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -785,7 +880,7 @@ class EAM():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rphi_r_table = np.asarray(table)
+                self.__rphi_r_table = np.asarray(table, dtype=self.dtype)
                 self.__rphi_r = None
                 self.__rphi_r_kwargs = None
             
@@ -830,7 +925,7 @@ class EAM():
         if self.__phi_r_table is not None:
             if r is None:
                 # Directly return table
-                return self.__phi_r_table
+                return np.asarray(self.__phi_r_table, dtype=float)
             
             else:
                 # Build spline of table
@@ -902,6 +997,8 @@ class EAM():
             Parameter kwargs to pass to fxn when called.  This allows for
             a general fxn to be used with symbol-specific parameters passed in.
         """
+        self.__splines.discard('rphi_r')
+
         # Set function for tabulated values
         if table is not None:
             if fxn is not None or len(kwargs) > 0:
@@ -912,7 +1009,7 @@ class EAM():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__phi_r_table = np.asarray(table)
+                self.__phi_r_table = np.asarray(table, dtype=self.dtype)
                 self.__phi_r = None
                 self.__phi_r_kwargs = None
             
@@ -1125,6 +1222,7 @@ class EAM():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of F(rho) vs. rho.
@@ -1133,8 +1231,8 @@ class EAM():
         ----------
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1148,6 +1246,12 @@ class EAM():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1164,8 +1268,10 @@ class EAM():
             ax1 = matplotlib_axes
         
         ρ = self.rho
-        F = self.F_rho()
-        ax1.plot(*numderivative(ρ, F, n=n))
+        if xlim is None:
+            xlim = (0, ρ[-1])
+        F = self.F_rho(derivative=n)
+        ax1.plot(*decimate(ρ, F, max_points, xlim))
         ax1.set_xlabel('ρ', size='x-large')
         
         if n == 0:
@@ -1176,8 +1282,6 @@ class EAM():
             ylabel = f'∂$^{n}$F(ρ) / ∂$ρ^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, ρ[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1192,6 +1296,7 @@ class EAM():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of rho(r) vs. r.
@@ -1200,8 +1305,8 @@ class EAM():
         ----------
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1215,6 +1320,12 @@ class EAM():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1231,8 +1342,10 @@ class EAM():
             ax1 = matplotlib_axes
         
         r = self.r
-        ρ = self.rho_r()
-        ax1.plot(*numderivative(r, ρ, n=n))
+        if xlim is None:
+            xlim = (0, r[-1])
+        ρ = self.rho_r(derivative=n)
+        ax1.plot(*decimate(r, ρ, max_points, xlim))
         ax1.set_xlabel('r', size='x-large')
         
         if n == 0:
@@ -1243,8 +1356,6 @@ class EAM():
             ylabel = f'∂$^{n}$ρ(r) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1259,6 +1370,7 @@ class EAM():
                     matplotlib_axes: Optional[plt.axes] = None,
                     xlim: Optional[Tuple[float, float]] = None,
                     ylim: Optional[Tuple[float, float]] = None,
+                    max_points: Optional[int] = 10000,
                     ) -> Optional[plt.figure]:
         """
         Generates a plot of r*phi(r) vs. r.
@@ -1267,8 +1379,8 @@ class EAM():
         ----------
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1282,6 +1394,12 @@ class EAM():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1298,8 +1416,10 @@ class EAM():
             ax1 = matplotlib_axes
         
         r = self.r
-        rϕ = self.rphi_r()
-        ax1.plot(*numderivative(r, rϕ, n=n))
+        if xlim is None:
+            xlim = (0, r[-1])
+        rϕ = self.rphi_r(derivative=n)
+        ax1.plot(*decimate(r, rϕ, max_points, xlim))
         ax1.set_xlabel('r', size='x-large')
         
         if n == 0:
@@ -1310,8 +1430,6 @@ class EAM():
             ylabel = f'∂$^{n}$(r*ϕ(r)) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1326,6 +1444,7 @@ class EAM():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of phi(r) vs. r.
@@ -1349,6 +1468,12 @@ class EAM():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1365,8 +1490,10 @@ class EAM():
             ax1 = matplotlib_axes
         
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
         ϕ = self.phi_r()
-        ax1.plot(*numderivative(r, ϕ, n=n))
+        ax1.plot(*decimate(*numderivative(r, ϕ, n=n), max_points, xlim))
         ax1.set_xlabel('r', size='x-large')
         
         if n == 0:
@@ -1377,8 +1504,6 @@ class EAM():
             ylabel = f'∂$^{n}$ϕ(r) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1393,6 +1518,7 @@ class EAM():
                  matplotlib_axes: Optional[plt.axes] = None,
                  xlim: Optional[Tuple[float, float]] = None,
                  ylim: Optional[Tuple[float, float]] = None,
+                 max_points: Optional[int] = 10000,
                  ) -> Optional[plt.figure]:
         """
         Generates a plot of z(r) vs. r.
@@ -1416,6 +1542,12 @@ class EAM():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1432,8 +1564,10 @@ class EAM():
             ax1 = matplotlib_axes
         
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
         z = self.z_r()
-        ax1.plot(*numderivative(r, z, n=n))
+        ax1.plot(*decimate(*numderivative(r, z, n=n), max_points, xlim))
         ax1.set_xlabel('r', size='x-large')
         
         if n == 0:
@@ -1444,8 +1578,6 @@ class EAM():
             ylabel = f'∂$^{n}$z(r) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -17,7 +17,9 @@ import numpy.typing as npt
 import matplotlib.pyplot as plt
 
 # Local imports
-from ..tools import aslist, numderivative
+from ..tools import aslist, decimate, numderivative
+from .SplineCache import SplineCache
+from .TablePool import TablePool
 class EAMAlloy():
     """
     Class for building and analyzing LAMMPS setfl eam/alloy parameter files 
@@ -35,7 +37,8 @@ class EAMAlloy():
                  deltar: Optional[float] = None,
                  numrho: Optional[int] = None,
                  cutoffrho: Optional[float] = None,
-                 deltarho: Optional[float] = None):
+                 deltarho: Optional[float] = None,
+                 dtype: npt.DTypeLike = 'float64'):
         """
         Class initializer. Element information can be set at this time.
         
@@ -83,8 +86,18 @@ class EAMAlloy():
         delta : float, optional
             The rho step size to use for the tabulation.  If not given, will
             be set as cutoffrho / (numrho - 1).
+        dtype : data-type, optional
+            The floating point dtype to store tabulated values as.  Default
+            value is 'float64'.  'float32' halves the memory of the tables
+            for analysis work.  Values are always returned and written as
+            float64.
         """
 
+        # Set the storage dtype of the tables
+        self.__dtype = np.dtype(dtype)
+        if self.__dtype.kind != 'f':
+            raise ValueError('dtype must be a floating point type')
+
         # Initialize F terms
         self.__F_rho = {}
         self.__F_rho_kwargs = {}
@@ -102,6 +115,10 @@ class EAMAlloy():
         self.__rphi_r = {}
         self.__rphi_r_kwargs = {}
         self.__rphi_r_table = {}
+
+        # Initialize shared storage and splines of the tables
+        self.__tables = TablePool(self.dtype)
+        self.__splines = SplineCache()
         
         # Initialize symbol terms
         self.__symbol = []
@@ -145,6 +162,11 @@ class EAMAlloy():
         """The LAMMPS pair_style associated with the class"""
         return 'eam/alloy'
 
+    @property
+    def dtype(self) -> np.dtype:
+        """numpy.dtype : The dtype that tabulated values are stored as"""
+        return self.__dtype
+
     @property
     def header(self) -> str:
         return self.__header
@@ -392,7 +414,8 @@ class EAMAlloy():
 
     def F_rho(self,
               symbol: Optional[str] = None,
-              rho: Optional[npt.ArrayLike] = None) -> np.ndarray:
+              rho: Optional[npt.ArrayLike] = None,
+              derivative: int = 0) -> np.ndarray:
         """
         Returns F(rho) values for a given symbol model.
 
@@ -404,6 +427,10 @@ class EAMAlloy():
         rho : array-like, optional
             The value(s) of rho to evaluate F_rho at.  If not given, will
             use the rho values set.
+        derivative : int, optional
+            Indicates which derivative of F(rho) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set rho values.
         
         Returns
         -------
@@ -417,14 +444,30 @@ class EAMAlloy():
             else:
                 raise ValueError('Multiple symbols set: specify which one')
         
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__F_rho.get(symbol, None)
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline(('F_rho', symbol), self.rho,
+                                            lambda: self.F_rho(symbol))
+            if rho is None:
+                rho = self.rho
+            v = fxn(rho, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            return v
+
         if symbol in self.__F_rho_table:
             if rho is None:
-                # Directly return table
-                return self.__F_rho_table[symbol]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__F_rho_table[symbol], dtype=float)
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.rho, self.__F_rho_table[symbol])
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline(('F_rho', symbol), self.rho,
+                                            lambda: self.__F_rho_table[symbol])
                 v = fxn(rho)
                 v[np.abs(v) <= 1e-100] = 0.0
                 return v
@@ -474,6 +517,7 @@ class EAMAlloy():
         # Check that symbol has been set beforehand
         if symbol not in self.symbols:
             raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
+        self.__splines.discard(('F_rho', symbol))
 
         # Handle tabulated values
         if table is not None:
@@ -485,7 +529,7 @@ class EAMAlloy():
                     raise ValueError('Number of table and rho values not the same')
                 
                 # Save tabulated values
-                self.__F_rho_table[symbol] = np.asarray(table)
+                self.__tables.store(self.__F_rho_table, symbol, table)
                 if symbol in self.__F_rho:
                     del self.__F_rho[symbol]
                     del self.__F_rho_kwargs[symbol]
@@ -498,18 +542,19 @@ class EAMAlloy():
                 self.__F_rho[symbol] = CubicSpline(rho, table)
                 self.__F_rho_kwargs[symbol] = {}
                 if symbol in self.__F_rho_table:
-                    del self.__F_rho_table[symbol]
+                    self.__tables.discard(self.__F_rho_table, symbol)
 
         else:
             # Set function and parameters
             self.__F_rho[symbol] = fxn
             self.__F_rho_kwargs[symbol] = kwargs
             if symbol in self.__F_rho_table:
-                del self.__F_rho_table[symbol]
+                self.__tables.discard(self.__F_rho_table, symbol)
 
     def rho_r(self,
               symbol: Optional[str] = None,
-              r: Optional[npt.ArrayLike] = None) -> np.ndarray:
+              r: Optional[npt.ArrayLike] = None,
+              derivative: int = 0) -> np.ndarray:
         """
         Returns rho(r) values for a given symbol model.
 
@@ -521,6 +566,10 @@ class EAMAlloy():
         r : array-like, optional
             The value(s) of r to evaluate rho(r) at.  If not given, will
             use the r values set.
+        derivative : int, optional
+            Indicates which derivative of rho(r) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set r values.
         
         Returns
         -------
@@ -534,14 +583,31 @@ class EAMAlloy():
             else:
                 raise ValueError('Multiple symbols set: specify which one')
         
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__rho_r.get(symbol, None)
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline(('rho_r', symbol), self.r,
+                                            lambda: self.rho_r(symbol))
+            if r is None:
+                r = self.r
+            v = fxn(r, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            v[r > self.cutoffr] = 0.0
+            return v
+
         if symbol in self.__rho_r_table:
             if r is None:
-                # Directly return table
-                return self.__rho_r_table[symbol]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__rho_r_table[symbol], dtype=float)
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rho_r_table[symbol])
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline(('rho_r', symbol), self.r,
+                                            lambda: self.__rho_r_table[symbol])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -593,6 +659,7 @@ class EAMAlloy():
         # Check that symbol has been set beforehand
         if symbol not in self.symbols:
             raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
+        self.__splines.discard(('rho_r', symbol))
 
         # Handle tabulated values
         if table is not None:
@@ -604,7 +671,7 @@ class EAMAlloy():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rho_r_table[symbol] = np.asarray(table)
+                self.__tables.store(self.__rho_r_table, symbol, table)
                 if symbol in self.__rho_r:
                     del self.__rho_r[symbol]
                     del self.__rho_r_kwargs[symbol]
@@ -617,18 +684,19 @@ class EAMAlloy():
                 self.__rho_r[symbol] = CubicSpline(r, table)
                 self.__rho_r_kwargs[symbol] = {}
                 if symbol in self.__rho_r_table:
-                    del self.__rho_r_table[symbol]
+                    self.__tables.discard(self.__rho_r_table, symbol)
 
         else:
             # Set function and parameters
             self.__rho_r[symbol] = fxn
             self.__rho_r_kwargs[symbol] = kwargs
             if symbol in self.__rho_r_table:
-                del self.__rho_r_table[symbol]
+                self.__tables.discard(self.__rho_r_table, symbol)
 
     def rphi_r(self,
                symbol: Optional[str] = None,
-               r: Optional[npt.ArrayLike] = None) -> np.ndarray:
+               r: Optional[npt.ArrayLike] = None,
+               derivative: int = 0) -> np.ndarray:
         """
         Returns r*phi(r) values for a pair interaction.
 
@@ -641,6 +709,10 @@ class EAMAlloy():
         r : array-like, optional
             The value(s) of r to evaluate r*phi(r) at.  If not given, will
             use the r values set.
+        derivative : int, optional
+            Indicates which derivative of r*phi(r) to return.  Default value
+            is 0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set r values.
         
         Returns
         -------
@@ -661,14 +733,31 @@ class EAMAlloy():
             raise ValueError('Invalid number of symbols: must be 1 or 2')
         symbolstr = '-'.join(sorted(symbols))
 
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__rphi_r.get(symbolstr, None)
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline(('rphi_r', symbolstr), self.r,
+                                            lambda: self.rphi_r(symbols))
+            if r is None:
+                r = self.r
+            v = fxn(r, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            v[r > self.cutoffr] = 0.0
+            return v
+
         if symbolstr in self.__rphi_r_table:
             if r is None:
-                # Directly return table
-                return self.__rphi_r_table[symbolstr]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__rphi_r_table[symbolstr], dtype=float)
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rphi_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline(('rphi_r', symbolstr), self.r,
+                                            lambda: self.__rphi_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -737,6 +826,7 @@ class EAMAlloy():
             if symbol not in self.__symbol:
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
+        self.__splines.discard(('rphi_r', symbolstr))
 
         # Handle tabulated values
         if table is not None:
@@ -748,7 +838,7 @@ class EAMAlloy():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rphi_r_table[symbolstr] = np.asarray(table)
+                self.__tables.store(self.__rphi_r_table, symbolstr, table)
                 if symbolstr in self.__rphi_r:
                     del self.__rphi_r[symbolstr]
                     del self.__rphi_r_kwargs[symbolstr]
@@ -761,21 +851,21 @@ class EAMAlloy():
                 self.__rphi_r[symbolstr] = CubicSpline(r, table)
                 self.__rphi_r_kwargs[symbolstr] = {}
                 if symbolstr in self.__rphi_r_table:
-                    del self.__rphi_r_table[symbolstr]
+                    self.__tables.discard(self.__rphi_r_table, symbolstr)
 
         else:
             # Set function and parameters
             self.__rphi_r[symbolstr] = fxn
             self.__rphi_r_kwargs[symbolstr] = kwargs
             if symbolstr in self.__rphi_r_table:
-                del self.__rphi_r_table[symbolstr]
+                self.__tables.discard(self.__rphi_r_table, symbolstr)
 
         # Remove fxn from phi_r if it exists
         if symbolstr in self.__phi_r:
             del self.__phi_r[symbolstr]
             del self.__phi_r_kwargs[symbolstr]
         if symbolstr in self.__phi_r_table:
-            del self.__phi_r_table[symbolstr]
+            self.__tables.discard(self.__phi_r_table, symbolstr)
 
     def phi_r(self,
               symbol: Optional[str] = None,
@@ -814,8 +904,8 @@ class EAMAlloy():
   
         if symbolstr in self.__phi_r_table:
             if r is None:
-                # Directly return table
-                return self.__phi_r_table[symbolstr]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__phi_r_table[symbolstr], dtype=float)
 
             else:
                 # Build spline of table
@@ -890,6 +980,7 @@ class EAMAlloy():
             if symbol not in self.__symbol:
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
+        self.__splines.discard(('rphi_r', symbolstr))
 
         # Handle tabulated values
         if table is not None:
@@ -901,7 +992,7 @@ class EAMAlloy():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__phi_r_table[symbolstr] = np.asarray(table)
+                self.__tables.store(self.__phi_r_table, symbolstr, table)
                 if symbolstr in self.__phi_r:
                     del self.__phi_r[symbolstr]
                     del self.__phi_r_kwargs[symbolstr]
@@ -914,21 +1005,21 @@ class EAMAlloy():
                 self.__phi_r[symbolstr] = CubicSpline(r, table)
                 self.__phi_r_kwargs[symbolstr] = {}
                 if symbolstr in self.__phi_r_table:
-                    del self.__phi_r_table[symbolstr]
+                    self.__tables.discard(self.__phi_r_table, symbolstr)
 
         else:
             # Set function and parameters
             self.__phi_r[symbolstr] = fxn
             self.__phi_r_kwargs[symbolstr] = kwargs
             if symbolstr in self.__phi_r_table:
-                del self.__phi_r_table[symbolstr]
+                self.__tables.discard(self.__phi_r_table, symbolstr)
 
         # Remove fxn from rphi_r if it exists
         if symbolstr in self.__rphi_r:
             del self.__rphi_r[symbolstr]
             del self.__rphi_r_kwargs[symbolstr]
         if symbolstr in self.__rphi_r_table:
-            del self.__rphi_r_table[symbolstr]
+            self.__tables.discard(self.__rphi_r_table, symbolstr)
 
     def print_overview(self):
         """Prints an overview of set values"""
@@ -1176,6 +1267,7 @@ class EAMAlloy():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of F(rho) vs. rho.
@@ -1187,8 +1279,8 @@ class EAMAlloy():
             F(rho) functions will be plotted.
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1202,6 +1294,12 @@ class EAMAlloy():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1222,10 +1320,12 @@ class EAMAlloy():
         else:
             symbols = aslist(symbols)
         ρ = self.rho
+        if xlim is None:
+            xlim = (0, ρ[-1])
 
         for symbol in symbols:
-            F = self.F_rho(symbol)
-            ax1.plot(*numderivative(ρ, F, n=n), label=symbol)
+            F = self.F_rho(symbol, derivative=n)
+            ax1.plot(*decimate(ρ, F, max_points, xlim), label=symbol)
         
         if len(symbols) > 1:
             ax1.legend()
@@ -1240,8 +1340,6 @@ class EAMAlloy():
             ylabel = f'∂$^{n}$F(ρ) / ∂$ρ^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, ρ[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1257,6 +1355,7 @@ class EAMAlloy():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of rho(r) vs. r.
@@ -1268,8 +1367,8 @@ class EAMAlloy():
             rho(r) functions will be plotted.
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1283,6 +1382,12 @@ class EAMAlloy():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1303,10 +1408,12 @@ class EAMAlloy():
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
-            ρ = self.rho_r(symbol)
-            ax1.plot(*numderivative(r, ρ, n=n), label=symbol)
+            ρ = self.rho_r(symbol, derivative=n)
+            ax1.plot(*decimate(r, ρ, max_points, xlim), label=symbol)
 
         if len(symbols) > 1:
             ax1.legend()
@@ -1321,8 +1428,6 @@ class EAMAlloy():
             ylabel = f'∂$^{n}$ρ(r) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1338,6 +1443,7 @@ class EAMAlloy():
                     matplotlib_axes: Optional[plt.axes] = None,
                     xlim: Optional[Tuple[float, float]] = None,
                     ylim: Optional[Tuple[float, float]] = None,
+                    max_points: Optional[int] = 10000,
                     ) -> Optional[plt.figure]:
         """
         Generates a plot of r*phi(r) vs. r.
@@ -1351,8 +1457,8 @@ class EAMAlloy():
             r*phi(r) functions will be plotted.
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1366,6 +1472,12 @@ class EAMAlloy():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1389,13 +1501,15 @@ class EAMAlloy():
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
             symbol = aslist(symbol)
             if len(symbol) == 1:
                 symbol += symbol
-            rϕ = self.rphi_r(symbol)
-            ax1.plot(*numderivative(r, rϕ, n=n), label='-'.join(symbol))
+            rϕ = self.rphi_r(symbol, derivative=n)
+            ax1.plot(*decimate(r, rϕ, max_points, xlim), label='-'.join(symbol))
         ax1.set_xlabel('r', size='x-large')
         
         if len(symbols) > 1:
@@ -1409,8 +1523,6 @@ class EAMAlloy():
             ylabel = f'∂$^{n}$(r*ϕ(r)) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1426,6 +1538,7 @@ class EAMAlloy():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of rho(r) vs. r.
@@ -1454,6 +1567,12 @@ class EAMAlloy():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1477,13 +1596,15 @@ class EAMAlloy():
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
             symbol = aslist(symbol)
             if len(symbol) == 1:
                 symbol += symbol
             rϕ = self.phi_r(symbol)
-            ax1.plot(*numderivative(r, rϕ, n=n), label='-'.join(symbol))
+            ax1.plot(*decimate(*numderivative(r, rϕ, n=n), max_points, xlim), label='-'.join(symbol))
         ax1.set_xlabel('r', size='x-large')
         
         if len(symbols) > 1:
@@ -1499,8 +1620,6 @@ class EAMAlloy():
             ylabel = f'∂$^{n}$ϕ(r) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -17,7 +17,9 @@ import numpy.typing as npt
 import matplotlib.pyplot as plt
 
 # Local imports
-from ..tools import aslist, numderivative
+from ..tools import aslist, decimate, numderivative
+from .SplineCache import SplineCache
+from .TablePool import TablePool
 
 class EAMFS():
     """
@@ -37,7 +39,8 @@ class EAMFS():
                  deltar: Optional[float] = None,
                  numrho: Optional[int] = None,
                  cutoffrho: Optional[float] = None,
-                 deltarho: Optional[float] = None):
+                 deltarho: Optional[float] = None,
+                 dtype: npt.DTypeLike = 'float64'):
         """
         Class initializer. Element information can be set at this time.
         
@@ -85,8 +88,18 @@ class EAMFS():
         delta : float, optional
             The rho step size to use for the tabulation.  If not given, will
             be set as cutoffrho / (numrho - 1).
+        dtype : data-type, optional
+            The floating point dtype to store tabulated values as.  Default
+            value is 'float64'.  'float32' halves the memory of the tables
+            for analysis work.  Values are always returned and written as
+            float64.
         """
 
+        # Set the storage dtype of the tables
+        self.__dtype = np.dtype(dtype)
+        if self.__dtype.kind != 'f':
+            raise ValueError('dtype must be a floating point type')
+
         # Initialize F terms
         self.__F_rho = {}
         self.__F_rho_kwargs = {}
@@ -104,6 +117,10 @@ class EAMFS():
         self.__rphi_r = {}
         self.__rphi_r_kwargs = {}
         self.__rphi_r_table = {}
+
+        # Initialize shared storage and splines of the tables
+        self.__tables = TablePool(self.dtype)
+        self.__splines = SplineCache()
         
         # Initialize symbol terms
         self.__symbol = []
@@ -147,6 +164,11 @@ class EAMFS():
         """The LAMMPS pair_style associated with the class"""
         return 'eam/fs'
 
+    @property
+    def dtype(self) -> np.dtype:
+        """numpy.dtype : The dtype that tabulated values are stored as"""
+        return self.__dtype
+
     @property
     def header(self) -> str:
         return self.__header
@@ -395,7 +417,8 @@ class EAMFS():
 
     def F_rho(self,
               symbol: Optional[str] = None,
-              rho: Optional[npt.ArrayLike] = None) -> np.ndarray:
+              rho: Optional[npt.ArrayLike] = None,
+              derivative: int = 0) -> np.ndarray:
         """
         Returns F(rho) values for a given symbol model.
 
@@ -407,6 +430,10 @@ class EAMFS():
         rho : array-like, optional
             The value(s) of rho to evaluate F_rho at.  If not given, will
             use the rho values set.
+        derivative : int, optional
+            Indicates which derivative of F(rho) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set rho values.
         
         Returns
         -------
@@ -420,14 +447,30 @@ class EAMFS():
             else:
                 raise ValueError('Multiple symbols set: specify which one')
         
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__F_rho.get(symbol, None)
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline(('F_rho', symbol), self.rho,
+                                            lambda: self.F_rho(symbol))
+            if rho is None:
+                rho = self.rho
+            v = fxn(rho, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            return v
+
         if symbol in self.__F_rho_table:
             if rho is None:
-                # Directly return table
-                return self.__F_rho_table[symbol]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__F_rho_table[symbol], dtype=float)
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.rho, self.__F_rho_table[symbol])
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline(('F_rho', symbol), self.rho,
+                                            lambda: self.__F_rho_table[symbol])
                 v = fxn(rho)
                 v[np.abs(v) <= 1e-100] = 0.0
                 return v
@@ -478,6 +521,7 @@ class EAMFS():
         # Check that symbol has been set beforehand
         if symbol not in self.symbols:
             raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
+        self.__splines.discard(('F_rho', symbol))
 
         # Handle tabulated values
         if table is not None:
@@ -489,7 +533,7 @@ class EAMFS():
                     raise ValueError('Number of table and rho values not the same')
                 
                 # Save tabulated values
-                self.__F_rho_table[symbol] = np.asarray(table)
+                self.__tables.store(self.__F_rho_table, symbol, table)
                 if symbol in self.__F_rho:
                     del self.__F_rho[symbol]
                     del self.__F_rho_kwargs[symbol]
@@ -502,18 +546,19 @@ class EAMFS():
                 self.__F_rho[symbol] = CubicSpline(rho, table)
                 self.__F_rho_kwargs[symbol] = {}
                 if symbol in self.__F_rho_table:
-                    del self.__F_rho_table[symbol]
+                    self.__tables.discard(self.__F_rho_table, symbol)
 
         else:
             # Set function and parameters
             self.__F_rho[symbol] = fxn
             self.__F_rho_kwargs[symbol] = kwargs
             if symbol in self.__F_rho_table:
-                del self.__F_rho_table[symbol]
+                self.__tables.discard(self.__F_rho_table, symbol)
 
     def rho_r(self,
               symbol: Union[str, list, None] = None,
-              r: Optional[npt.ArrayLike] = None) -> np.ndarray:
+              r: Optional[npt.ArrayLike] = None,
+              derivative: int = 0) -> np.ndarray:
         """
         Returns rho(r) values for an atom of symbol[1] at an atom of
         symbol[0].
@@ -527,6 +572,10 @@ class EAMFS():
         r : array-like, optional
             The value(s) of r to evaluate rho(r) at.  If not given, will
             use the r values set.
+        derivative : int, optional
+            Indicates which derivative of rho(r) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set r values.
         
         Returns
         -------
@@ -547,14 +596,31 @@ class EAMFS():
             raise ValueError('Invalid number of symbols: must be 1 or 2')
         symbolstr = '-'.join(symbols)
 
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__rho_r.get(symbolstr, None)
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline(('rho_r', symbolstr), self.r,
+                                            lambda: self.rho_r(symbols))
+            if r is None:
+                r = self.r
+            v = fxn(r, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            v[r > self.cutoffr] = 0.0
+            return v
+
         if symbolstr in self.__rho_r_table:
             if r is None:
-                # Directly return table
-                return self.__rho_r_table[symbolstr]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__rho_r_table[symbolstr], dtype=float)
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rho_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline(('rho_r', symbolstr), self.r,
+                                            lambda: self.__rho_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -617,6 +683,7 @@ class EAMFS():
             if symbol not in self.symbols:
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(symbols)
+        self.__splines.discard(('rho_r', symbolstr))
 
         # Handle tabulated values
         if table is not None:
@@ -628,7 +695,7 @@ class EAMFS():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rho_r_table[symbolstr] = np.asarray(table)
+                self.__tables.store(self.__rho_r_table, symbolstr, table)
                 if symbolstr in self.__rho_r:
                     del self.__rho_r[symbolstr]
                     del self.__rho_r_kwargs[symbolstr]
@@ -641,18 +708,19 @@ class EAMFS():
                 self.__rho_r[symbolstr] = CubicSpline(r, table)
                 self.__rho_r_kwargs[symbolstr] = {}
                 if symbolstr in self.__rho_r_table:
-                    del self.__rho_r_table[symbolstr]
+                    self.__tables.discard(self.__rho_r_table, symbolstr)
 
         else:
             # Set function and parameters
             self.__rho_r[symbolstr] = fxn
             self.__rho_r_kwargs[symbolstr] = kwargs
             if symbolstr in self.__rho_r_table:
-                del self.__rho_r_table[symbolstr]
+                self.__tables.discard(self.__rho_r_table, symbolstr)
 
     def rphi_r(self,
                symbol: Union[str, list, None] = None,
-               r: Optional[npt.ArrayLike] = None) -> np.ndarray:
+               r: Optional[npt.ArrayLike] = None,
+               derivative: int = 0) -> np.ndarray:
         """
         Returns r*phi(r) values for a pair interaction.
 
@@ -665,6 +733,10 @@ class EAMFS():
         r : array-like, optional
             The value(s) of r to evaluate r*phi(r) at.  If not given, will
             use the r values set.
+        derivative : int, optional
+            Indicates which derivative of r*phi(r) to return.  Default value is
+            0 (no derivative).  Derivatives are evaluated from the cubic
+            spline of the values tabulated at the set r values.
         
         Returns
         -------
@@ -685,14 +757,31 @@ class EAMFS():
             raise ValueError('Invalid number of symbols: must be 1 or 2')
         symbolstr = '-'.join(sorted(symbols))
 
+        if derivative != 0:
+            if derivative < 0:
+                raise ValueError('derivative must be >= 0')
+            
+            # Use the function's own spline or a cached spline of the table
+            fxn = self.__rphi_r.get(symbolstr, None)
+            if not isinstance(fxn, CubicSpline):
+                fxn = self.__splines.spline(('rphi_r', symbolstr), self.r,
+                                            lambda: self.rphi_r(symbols))
+            if r is None:
+                r = self.r
+            v = fxn(r, derivative)
+            v[np.abs(v) <= 1e-100] = 0.0
+            v[r > self.cutoffr] = 0.0
+            return v
+
         if symbolstr in self.__rphi_r_table:
             if r is None:
-                # Directly return table
-                return self.__rphi_r_table[symbolstr]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__rphi_r_table[symbolstr], dtype=float)
 
             else:
-                # Build spline of table
-                fxn = CubicSpline(self.r, self.__rphi_r_table[symbolstr])
+                # Evaluate cached spline of table
+                fxn = self.__splines.spline(('rphi_r', symbolstr), self.r,
+                                            lambda: self.__rphi_r_table[symbolstr])
                 v = fxn(r)
                 v[np.abs(v) <= 1e-100] = 0.0
                 v[r > self.cutoffr] = 0.0
@@ -761,6 +850,7 @@ class EAMFS():
             if symbol not in self.__symbol:
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
+        self.__splines.discard(('rphi_r', symbolstr))
 
         # Handle tabulated values
         if table is not None:
@@ -772,7 +862,7 @@ class EAMFS():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__rphi_r_table[symbolstr] = np.asarray(table)
+                self.__tables.store(self.__rphi_r_table, symbolstr, table)
                 if symbolstr in self.__rphi_r:
                     del self.__rphi_r[symbolstr]
                     del self.__rphi_r_kwargs[symbolstr]
@@ -785,21 +875,21 @@ class EAMFS():
                 self.__rphi_r[symbolstr] = CubicSpline(r, table)
                 self.__rphi_r_kwargs[symbolstr] = {}
                 if symbolstr in self.__rphi_r_table:
-                    del self.__rphi_r_table[symbolstr]
+                    self.__tables.discard(self.__rphi_r_table, symbolstr)
 
         else:
             # Set function and parameters
             self.__rphi_r[symbolstr] = fxn
             self.__rphi_r_kwargs[symbolstr] = kwargs
             if symbolstr in self.__rphi_r_table:
-                del self.__rphi_r_table[symbolstr]
+                self.__tables.discard(self.__rphi_r_table, symbolstr)
 
         # Remove fxn from phi_r if it exists
         if symbolstr in self.__phi_r:
             del self.__phi_r[symbolstr]
             del self.__phi_r_kwargs[symbolstr]
         if symbolstr in self.__phi_r_table:
-            del self.__phi_r_table[symbolstr]
+            self.__tables.discard(self.__phi_r_table, symbolstr)
 
     def phi_r(self,
               symbol: Union[str, list, None] = None,
@@ -838,8 +928,8 @@ class EAMFS():
   
         if symbolstr in self.__phi_r_table:
             if r is None:
-                # Directly return table
-                return self.__phi_r_table[symbolstr]
+                # Return a copy as the stored tables are shared and read-only
+                return np.array(self.__phi_r_table[symbolstr], dtype=float)
 
             else:
                 # Build spline of table
@@ -914,6 +1004,7 @@ class EAMFS():
             if symbol not in self.__symbol:
                 raise KeyError(f'No info set for {symbol}: use set_symbol_info()')
         symbolstr = '-'.join(sorted(symbols))
+        self.__splines.discard(('rphi_r', symbolstr))
 
         # Handle tabulated values
         if table is not None:
@@ -925,7 +1016,7 @@ class EAMFS():
                     raise ValueError('Number of table and r values not the same')
                 
                 # Save tabulated values
-                self.__phi_r_table[symbolstr] = np.asarray(table)
+                self.__tables.store(self.__phi_r_table, symbolstr, table)
                 if symbolstr in self.__phi_r:
                     del self.__phi_r[symbolstr]
                     del self.__phi_r_kwargs[symbolstr]
@@ -938,21 +1029,21 @@ class EAMFS():
                 self.__phi_r[symbolstr] = CubicSpline(r, table)
                 self.__phi_r_kwargs[symbolstr] = {}
                 if symbolstr in self.__phi_r_table:
-                    del self.__phi_r_table[symbolstr]
+                    self.__tables.discard(self.__phi_r_table, symbolstr)
 
         else:
             # Set function and parameters
             self.__phi_r[symbolstr] = fxn
             self.__phi_r_kwargs[symbolstr] = kwargs
             if symbolstr in self.__phi_r_table:
-                del self.__phi_r_table[symbolstr]
+                self.__tables.discard(self.__phi_r_table, symbolstr)
 
         # Remove fxn from rphi_r if it exists
         if symbolstr in self.__rphi_r:
             del self.__rphi_r[symbolstr]
             del self.__rphi_r_kwargs[symbolstr]
         if symbolstr in self.__rphi_r_table:
-            del self.__rphi_r_table[symbolstr]
+            self.__tables.discard(self.__rphi_r_table, symbolstr)
 
     def print_overview(self):
         """Prints an overview of set values"""
@@ -1207,6 +1298,7 @@ class EAMFS():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of F(rho) vs. rho.
@@ -1218,8 +1310,8 @@ class EAMFS():
             F(rho) functions will be plotted.
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1233,6 +1325,12 @@ class EAMFS():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1253,10 +1351,12 @@ class EAMFS():
         else:
             symbols = aslist(symbols)
         ρ = self.rho
+        if xlim is None:
+            xlim = (0, ρ[-1])
 
         for symbol in symbols:
-            F = self.F_rho(symbol)
-            ax1.plot(*numderivative(ρ, F, n=n), label=symbol)
+            F = self.F_rho(symbol, derivative=n)
+            ax1.plot(*decimate(ρ, F, max_points, xlim), label=symbol)
         
         if len(symbols) > 1:
             ax1.legend()
@@ -1271,8 +1371,6 @@ class EAMFS():
             ylabel = f'∂$^{n}$F(ρ) / ∂$ρ^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, ρ[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1288,6 +1386,7 @@ class EAMFS():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of rho(r) vs. r.
@@ -1301,8 +1400,8 @@ class EAMFS():
             rho(r) functions will be plotted.
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1316,6 +1415,12 @@ class EAMFS():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1339,13 +1444,15 @@ class EAMFS():
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
             symbol = aslist(symbol)
             if len(symbol) == 1:
                 symbol += symbol
-            ρ = self.rho_r(symbol)
-            ax1.plot(*numderivative(r, ρ, n=n), label='-'.join(symbol))
+            ρ = self.rho_r(symbol, derivative=n)
+            ax1.plot(*decimate(r, ρ, max_points, xlim), label='-'.join(symbol))
 
         if len(symbols) > 1:
             ax1.legend()
@@ -1360,8 +1467,6 @@ class EAMFS():
             ylabel = f'∂$^{n}$ρ(r) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1377,6 +1482,7 @@ class EAMFS():
                     matplotlib_axes: Optional[plt.axes] = None,
                     xlim: Optional[Tuple[float, float]] = None,
                     ylim: Optional[Tuple[float, float]] = None,
+                    max_points: Optional[int] = 10000,
                     ) -> Optional[plt.figure]:
         """
         Generates a plot of r*phi(r) vs. r.
@@ -1390,8 +1496,8 @@ class EAMFS():
             r*phi(r) functions will be plotted.
         n : int, optional
             Indicates which derivative of the function to plot.  Default
-            value is 0 (no derivative).  Derivatives are computed numerically
-            based on the tabulation values.
+            value is 0 (no derivative).  Derivatives are evaluated from the
+            cubic spline of the tabulated values.
         figsize : tuple, optional
             The figsize parameter of matplotlib.pyplot.figure to use in
             generating the figure.  Default value is (10, 6).  Ignored if
@@ -1405,6 +1511,12 @@ class EAMFS():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1428,13 +1540,15 @@ class EAMFS():
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
             symbol = aslist(symbol)
             if len(symbol) == 1:
                 symbol += symbol
-            rϕ = self.rphi_r(symbol)
-            ax1.plot(*numderivative(r, rϕ, n=n), label='-'.join(symbol))
+            rϕ = self.rphi_r(symbol, derivative=n)
+            ax1.plot(*decimate(r, rϕ, max_points, xlim), label='-'.join(symbol))
         ax1.set_xlabel('r', size='x-large')
         
         if len(symbols) > 1:
@@ -1448,8 +1562,6 @@ class EAMFS():
             ylabel = f'∂$^{n}$(r*ϕ(r)) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
@@ -1465,6 +1577,7 @@ class EAMFS():
                    matplotlib_axes: Optional[plt.axes] = None,
                    xlim: Optional[Tuple[float, float]] = None,
                    ylim: Optional[Tuple[float, float]] = None,
+                   max_points: Optional[int] = 10000,
                    ) -> Optional[plt.figure]:
         """
         Generates a plot of rho(r) vs. r.
@@ -1493,6 +1606,12 @@ class EAMFS():
         ylim : tuple, optional
             The range of values to plot along the y axis.  If not given will
             use the default pyplot settings.
+        max_points : int, optional
+            The maximum number of points to plot for each curve.  Large
+            tables are limited to the points within xlim and decimated to
+            the minimum and maximum values in evenly sized bins after any
+            derivatives are taken.  Default value is 10000.  If None, all
+            points are plotted.
 
         Returns
         -------
@@ -1516,13 +1635,15 @@ class EAMFS():
         else:
             symbols = aslist(symbols)
         r = self.r
+        if xlim is None:
+            xlim = (0, r[-1])
 
         for symbol in symbols:
             symbol = aslist(symbol)
             if len(symbol) == 1:
                 symbol += symbol
             rϕ = self.phi_r(symbol)
-            ax1.plot(*numderivative(r, rϕ, n=n), label='-'.join(symbol))
+            ax1.plot(*decimate(*numderivative(r, rϕ, n=n), max_points, xlim), label='-'.join(symbol))
         ax1.set_xlabel('r', size='x-large')
         
         if len(symbols) > 1:
@@ -1538,8 +1659,6 @@ class EAMFS():
             ylabel = f'∂$^{n}$ϕ(r) / ∂$r^{n}$'
         ax1.set_ylabel(ylabel, size='x-large')
         
-        if xlim is None:
-            xlim = (0, r[-1])
         ax1.set_xlim(xlim)
         
         if ylim is not None:
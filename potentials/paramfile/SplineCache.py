@@ -0,0 +1,72 @@
+# coding: utf-8
+# Standard libraries
+from typing import Callable, Hashable
+
+# https://scipy.org/
+from scipy.interpolate import CubicSpline
+
+# https://numpy.org/
+import numpy as np
+
+class SplineCache():
+    """
+    Keeps the cubic splines of tabulated functions so that they are built
+    once rather than every time the functions or their derivatives are
+    evaluated away from the tabulation grid.
+    """
+    def __init__(self):
+        """
+        Class initializer.
+        """
+        self.__splines = {}
+
+    def spline(self,
+               key: Hashable,
+               x: np.ndarray,
+               values: Callable[[], np.ndarray]) -> CubicSpline:
+        """
+        Returns the spline for a key, building it if it is not cached or the
+        grid has changed since it was built.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifies the tabulated function.
+        x : numpy.ndarray
+            The grid that the function is tabulated on.
+        values : function
+            Returns the tabulated function values on the grid.  Only called
+            if the spline needs to be built.
+
+        Returns
+        -------
+        scipy.interpolate.CubicSpline
+            The spline of the tabulated values.
+        """
+        grid = (len(x), x[0], x[-1])
+        try:
+            cachedgrid, spline = self.__splines[key]
+        except KeyError:
+            pass
+        else:
+            if cachedgrid == grid:
+                return spline
+
+        spline = CubicSpline(x, values())
+        self.__splines[key] = (grid, spline)
+        return spline
+
+    def discard(self, key: Hashable):
+        """
+        Removes the spline for a key if it is cached.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifies the tabulated function.
+        """
+        self.__splines.pop(key, None)
+
+    def clear(self):
+        """Removes all cached splines."""
+        self.__splines.clear()
@@ -0,0 +1,133 @@
+# coding: utf-8
+# Standard libraries
+import hashlib
+from typing import Hashable, Optional
+
+# https://numpy.org/
+import numpy as np
+import numpy.typing as npt
+
+class TablePool():
+    """
+    Stores tabulated function values once for each unique content so that
+    identical tables, such as the repeated cross-density tables of eam/fs
+    files, share one read-only array.  The arrays are reference counted and
+    dropped when no table refers to them.
+    """
+    def __init__(self, dtype: npt.DTypeLike = None):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        dtype : data-type, optional
+            The dtype to store tables as.  If None (default), tables keep the
+            dtype they are given with.
+        """
+        self.__dtype = None if dtype is None else np.dtype(dtype)
+        self.__tables = {}
+        self.__digests = {}
+
+    def __len__(self) -> int:
+        """int: The number of unique tables stored"""
+        return len(self.__tables)
+
+    @property
+    def dtype(self) -> Optional[np.dtype]:
+        """numpy.dtype or None: The dtype that tables are stored as"""
+        return self.__dtype
+
+    @property
+    def nbytes(self) -> int:
+        """int: The total bytes of the unique tables stored"""
+        return sum(entry[0].nbytes for entry in self.__tables.values())
+
+    @staticmethod
+    def digest(table: np.ndarray) -> tuple:
+        """
+        Returns a key that identifies the dtype, shape and values of a table.
+        """
+        values = np.ascontiguousarray(table).tobytes()
+        return (table.dtype.str, table.shape, hashlib.blake2b(values).digest())
+
+    def intern(self, table: npt.ArrayLike) -> np.ndarray:
+        """
+        Returns the stored array with the same content as table, after
+        conversion to the pool's dtype, storing a read-only copy of table if
+        there is none.  Each call adds a reference that should be released
+        once the returned array is no longer used.
+
+        Parameters
+        ----------
+        table : array-like
+            The tabulated values.
+
+        Returns
+        -------
+        numpy.ndarray
+            The read-only stored array.
+        """
+        table = np.asarray(table, dtype=self.dtype)
+        digest = self.digest(table)
+        try:
+            entry = self.__tables[digest]
+        except KeyError:
+            stored = np.array(table)
+            stored.flags.writeable = False
+            entry = self.__tables[digest] = [stored, 0]
+            self.__digests[id(stored)] = digest
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, table: np.ndarray):
+        """
+        Removes a reference to a stored array, dropping the array if it has
+        no references left.
+
+        Parameters
+        ----------
+        table : numpy.ndarray
+            An array returned by intern.
+        """
+        digest = self.__digests[id(table)]
+        entry = self.__tables[digest]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self.__tables[digest]
+            del self.__digests[id(table)]
+
+    def store(self,
+              tables: dict,
+              key: Hashable,
+              table: npt.ArrayLike):
+        """
+        Interns table and sets it in tables, releasing any table it replaces.
+
+        Parameters
+        ----------
+        tables : dict
+            The tables of a function.
+        key : hashable
+            The key in tables to set.
+        table : array-like
+            The tabulated values.
+        """
+        table = self.intern(table)
+        self.discard(tables, key)
+        tables[key] = table
+
+    def discard(self,
+                tables: dict,
+                key: Hashable):
+        """
+        Removes a key from tables, if it is there, and releases its table.
+
+        Parameters
+        ----------
+        tables : dict
+            The tables of a function.
+        key : hashable
+            The key in tables to remove.
+        """
+        if key in tables:
+            self.release(tables.pop(key))
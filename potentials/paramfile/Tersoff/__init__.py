@@ -8,6 +8,7 @@ class Tersoff():
 
     # Class imports
     from ._abop import abop
+    from ._load import load
 
     def __init__(self, symbols, pair_style='tersoff'):
         """
@@ -213,32 +214,25 @@ class Tersoff():
             if len(hlines[i].strip()) > 0 and hlines[i].strip()[0] != '#':
                 hlines[i] = '#' + hlines[i]
         
-        lines = ['' for i in range(len(self.params)+1)]
-
-        # Loop over all keys
-        first = True
-        for key in self.params.keys():
-            l = 3
+        # Convert each column to str and pad to the column's width
+        columns = []
+        for i, key in enumerate(self.params.keys()):
             
             # Add comment hashtag to first header key
-            if first:
+            if i == 0:
                 v = '#' + key
-                first = False
             else:
                 v = key
             
-            vals = [v]
-            if len(v) > l:
-                l = len(v)
-            
-            for i in self.params.index:
-                v = str(self.params.loc[i, key])
-                vals.append(v)
-                if len(v) > l:
-                    l = len(v)
+            vals = np.concatenate([[v], self.params[key].to_numpy().astype(str)])
+            width = max(3, np.char.str_len(vals).max())
+            columns.append(np.char.add(np.char.ljust(vals, width), ' '))
 
-            for i in range(len(lines)):
-                lines[i] += f'{vals[i]:{l}} '
+        # Join the padded columns of each line
+        lines = columns[0]
+        for column in columns[1:]:
+            lines = np.char.add(lines, column)
+        lines = lines.tolist()
 
         # Compile all parameter lines together
         paramstr = '\n'.join(hlines + lines)
@@ -1,5 +1,5 @@
 from io import StringIO
-from math import sqrt, exp
+from math import exp
 
 import numpy as np
 import pandas as pd
@@ -43,42 +43,66 @@ def abop(cls, fname, pair_style=None):
     obj = cls(symbols, pair_style=pair_style)
     tersoff = obj.params
 
-    # Loop over each abop_params row
-    for index in abop_params.index:
-        abopi = abop_params.loc[index]
-        el1 = abopi.el1
-        el2 = abopi.el2
-
-        twobody = abop_to_tersoff_2body(abopi, pair_style=pair_style)
-        match2body = (tersoff.e2 == tersoff.e3) & ( ( (tersoff.e1 == el1) & (tersoff.e2 == el2) ) | ( (tersoff.e1 == el2) & (tersoff.e2 == el1) ) )
-        for key in twobody:
-            tersoff.loc[match2body, key] = twobody[key]
-
-        threebody = abop_to_tersoff_3body(abopi, pair_style=pair_style)
-        match3body = ( (tersoff.e1 == el1) & (tersoff.e3 == el2) ) | ( (tersoff.e1 == el2) & (tersoff.e3 == el1) )
-        for key in threebody:
-            tersoff.loc[match3body, key] = threebody[key]
+    # Convert all abop rows at once
+    twobody = abop_to_tersoff_2body(abop_params, pair_style=pair_style)
+    threebody = abop_to_tersoff_3body(abop_params, pair_style=pair_style)
+
+    # Map each unordered element pair to its last abop row
+    pairrows = pd.Series(np.arange(len(abop_params)),
+                         index=pair_keys(abop_params.el1, abop_params.el2))
+    pairrows = pairrows[~pairrows.index.duplicated(keep='last')]
+
+    # 2-body terms apply to e1-e2 pairs where e2 == e3
+    rows2body = pair_keys(tersoff.e1, tersoff.e2).map(pairrows)
+    match2body = (rows2body.notna() & (tersoff.e2 == tersoff.e3)).values
+    rows2body = rows2body.values[match2body].astype(int)
+    for key in twobody:
+        tersoff.loc[match2body, key] = np.asarray(twobody[key])[rows2body]
+
+    # 3-body terms apply to e1-e3 pairs
+    rows3body = pair_keys(tersoff.e1, tersoff.e3).map(pairrows)
+    match3body = rows3body.notna().values
+    rows3body = rows3body.values[match3body].astype(int)
+    for key in threebody:
+        tersoff.loc[match3body, key] = np.asarray(threebody[key])[rows3body]
 
     # Fill in element numbers for ZBL
     if pair_style == 'tersoff/zbl':
-        for index in tersoff.index:
-            tersoff.loc[index, 'Z_i'] = atomic_number(tersoff.loc[index, 'e1'])
-            tersoff.loc[index, 'Z_j'] = atomic_number(tersoff.loc[index, 'e2'])
-
-    # Loop over 3-body modification parameters
-    for index in mod_params.index:
-        mod = mod_params.loc[index]
-        key, e1, e2, e3, val = mod.tolist()
-        matchmod = ( (tersoff.e1 == e1) & (tersoff.e2 == e2) & (tersoff.e3 == e3) )
-        if key == 'α':
-            tersoff.loc[matchmod, 'lambda3'] = val
-        elif key == 'ω':
-            tersoff.loc[matchmod, 'gamma'] *= val
+        numbers = {symbol: atomic_number(symbol) for symbol in symbols}
+        tersoff['Z_i'] = tersoff.e1.map(numbers).astype(tersoff.Z_i.dtype)
+        tersoff['Z_j'] = tersoff.e2.map(numbers).astype(tersoff.Z_j.dtype)
+
+    # Apply 3-body modification parameters in order
+    if len(mod_params) > 0:
+        rows = {triple: i for i, triple in enumerate(zip(tersoff.e1, tersoff.e2, tersoff.e3))}
+        lambda3 = tersoff.lambda3.values.copy()
+        gamma = tersoff.gamma.values.copy()
+        for key, e1, e2, e3, val in mod_params.itertuples(index=False):
+            row = rows.get((e1, e2, e3), None)
+            if row is None:
+                continue
+            if key == 'α':
+                lambda3[row] = val
+            elif key == 'ω':
+                gamma[row] *= val
+        tersoff['lambda3'] = lambda3
+        tersoff['gamma'] = gamma
 
     return obj
 
+def pair_keys(el1: pd.Series, el2: pd.Series) -> pd.Series:
+    """Builds keys for unordered element pairs"""
+    el1 = el1.astype(str)
+    el2 = el2.astype(str)
+    first = el1.where(el1 <= el2, el2)
+    second = el2.where(el1 <= el2, el1)
+    return first + ' ' + second
+
+# math.exp applied elementwise, which can differ from np.exp in the last digit
+vexp = np.vectorize(exp, otypes=[float])
+
 def abop_to_tersoff_2body(abop, pair_style='tersoff'):
-    """Transform the 2-body abop params to LAMMPS format"""
+    """Transform the 2-body abop params, for one or all rows, to LAMMPS format"""
 
     # Extract ABOP parameters
     β = abop.β
@@ -88,15 +112,15 @@ def abop_to_tersoff_2body(abop, pair_style='tersoff'):
     
     # Convert to Tersoff paramters
     tersoff = {}
-    tersoff['lambda2'] = λ2 = β * sqrt(2 / S)
-    tersoff['B'] = S * D0 / (S - 1) * exp(λ2 * r0)
-    tersoff['lambda1'] = λ1 = β * sqrt(2 * S)
-    tersoff['A'] = D0 / (S - 1) * exp(λ1 * r0)
+    tersoff['lambda2'] = λ2 = β * np.sqrt(2 / S)
+    tersoff['B'] = S * D0 / (S - 1) * vexp(λ2 * r0)
+    tersoff['lambda1'] = λ1 = β * np.sqrt(2 * S)
+    tersoff['A'] = D0 / (S - 1) * vexp(λ1 * r0)
 
     return tersoff
 
 def abop_to_tersoff_3body(abop, pair_style='tersoff'):
-    """Transform the 3-body abop params to LAMMPS format"""
+    """Transform the 3-body abop params, for one or all rows, to LAMMPS format"""
     # Map abop to tersoff
     tersoff = {}
     tersoff['gamma'] = abop.γ * abop.ω
@@ -0,0 +1,132 @@
+import io
+from pathlib import Path
+import re
+from typing import Optional, Union
+
+import numpy as np
+
+# The number of columns in each pair_style's parameter entries
+numcolumns = {
+    'tersoff': 17,
+    'tersoff/mod': 20,
+    'tersoff/mod/c': 21,
+    'tersoff/zbl': 21,
+}
+
+@classmethod
+def load(cls,
+         f: Union[str, Path, io.IOBase],
+         pair_style: Optional[str] = None):
+    """
+    Reads in a LAMMPS tersoff, tersoff/mod, tersoff/mod/c or tersoff/zbl
+    parameter file.  As with LAMMPS, everything after a # on a line is a
+    comment and the entries are read as a stream of words so that an entry
+    can be split across lines.
+
+    Parameters
+    ----------
+    f : path-like object or file-like object
+        The parameter file to read in, either as a file path or as an open
+        file-like object.
+    pair_style : str, optional
+        The specific LAMMPS tersoff pair_style of the file.  If None (default)
+        then the pair_style is inferred from the number of columns.  Files
+        with 21 columns need a header line of column names, like those
+        written by save, for the pair_style to be inferred.
+
+    Returns
+    -------
+    Tersoff
+        The Tersoff object with params set from the file.
+    """
+    if hasattr(f, 'read'):
+        content = f.read()
+    else:
+        with open(f) as fp:
+            content = fp.read()
+
+    # Split content into comments and the stream of words
+    comments = re.findall(r'#([^\n]*)', content)
+    words = np.array(re.sub(r'#[^\n]*', '', content).split())
+    if len(words) == 0:
+        raise ValueError('no parameter entries found')
+
+    if pair_style is None:
+        pair_style = identify_pair_style(cls, words, comments)
+    elif pair_style not in numcolumns:
+        raise ValueError(f'invalid/unsupported pair_style {pair_style}')
+
+    # Split the words into entries
+    ncols = numcolumns[pair_style]
+    if len(words) % ncols != 0:
+        raise ValueError(f'number of values is not a multiple of the {ncols} columns of {pair_style}')
+    table = words.reshape(-1, ncols)
+
+    # Identify the symbols in order of appearance and check all entries are given
+    elements = table[:, :3]
+    symbols, first = np.unique(elements[:, 0], return_index=True)
+    symbols = symbols[np.argsort(first)].tolist()
+    nsymbols = len(symbols)
+    if len(table) != nsymbols ** 3:
+        raise ValueError(f'{len(table)} entries found but {nsymbols ** 3} expected for {nsymbols} symbols')
+    rank = {symbol: i for i, symbol in enumerate(symbols)}
+    allsymbols, inverse = np.unique(elements, return_inverse=True)
+    for symbol in allsymbols:
+        if symbol not in rank:
+            raise ValueError(f'symbol {symbol} found in e2 or e3 but not in e1')
+    positions = np.array([rank[symbol] for symbol in allsymbols])[inverse.reshape(elements.shape)]
+    order = positions @ np.array([nsymbols ** 2, nsymbols, 1])
+    if len(np.unique(order)) != len(order):
+        raise ValueError('duplicate element entries found')
+
+    # Put entries in the same order as init_params and convert values
+    obj = cls(symbols, pair_style=pair_style)
+    table = table[np.argsort(order)]
+    try:
+        values = table[:, 3:].astype(float)
+    except ValueError as e:
+        raise ValueError(f'invalid parameter value: {e}') from e
+    for i, key in enumerate(obj.params.keys()[3:]):
+        column = values[:, i]
+
+        # Keep integer columns as integers if the values allow
+        if obj.params[key].dtype.kind == 'i' and np.all(column == np.round(column)):
+            column = column.astype(obj.params[key].dtype)
+        obj.params[key] = column
+
+    return obj
+
+def identify_pair_style(cls, words: np.ndarray, comments: list) -> str:
+    """
+    Infers the pair_style of a parameter file from its column names header
+    or the number of columns.
+    """
+    # Check for a column names header
+    styles = list(numcolumns)
+    for comment in comments:
+        names = comment.split()
+        for pair_style in styles:
+            if names == list(cls(['X'], pair_style=pair_style).params.keys()):
+                return pair_style
+
+    # Find column counts that fit an entry for each of N**3 element combinations
+    matches = []
+    for pair_style in styles:
+        ncols = numcolumns[pair_style]
+        if len(words) % ncols != 0:
+            continue
+        nrows = len(words) // ncols
+        nsymbols = round(nrows ** (1 / 3))
+        if nsymbols ** 3 != nrows:
+            continue
+        table = words.reshape(nrows, ncols)
+        if len(np.unique(table[:, 0])) != nsymbols:
+            continue
+        if ncols not in [numcolumns[match] for match in matches]:
+            matches.append(pair_style)
+
+    if len(matches) == 0:
+        raise ValueError('number of values does not match any tersoff pair_style')
+    if len(matches) > 1 or numcolumns[matches[0]] == 21:
+        raise ValueError('pair_style could not be inferred: give pair_style')
+    return matches[0]
@@ -163,7 +163,7 @@ def eam_alloy_to_eam_fs(alloy: EAMAlloy) -> EAMFS:
         alloy = EAMAlloy(alloy)
     
     # Initialize fs object
-    fs = EAMFS()
+    fs = EAMFS(dtype=alloy.dtype)
     
     # Copy over header
     fs.header = alloy.header
@@ -217,7 +217,7 @@ def eam_alloy_to_adp(alloy: EAMAlloy) -> ADP:
         alloy = EAMAlloy(alloy)
     
     # Initialize fs object
-    adp = ADP()
+    adp = ADP(dtype=alloy.dtype)
     
     # Copy over header
     adp.header = alloy.header
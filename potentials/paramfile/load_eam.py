@@ -3,11 +3,15 @@
 import io
 from typing import Optional, Union
 
+# https://numpy.org/
+import numpy.typing as npt
+
 # Local imports
 from . import EAM, EAMAlloy, EAMFS, ADP
 
 def load_eam(f: Union[str, io.IOBase],
-             style: Optional[str] = None) -> Union[EAM, EAMAlloy, EAMFS, ADP]:
+             style: Optional[str] = None,
+             dtype: npt.DTypeLike = 'float64') -> Union[EAM, EAMAlloy, EAMFS, ADP]:
     """
     Loads a LAMMPS-compatible EAM parameter file.
     
@@ -22,6 +26,9 @@ def load_eam(f: Union[str, io.IOBase],
         LAMMPS eam/alloy pair_style.  'eam/fs' or 'fs' will load setfl files for
         the eam/fs pair_style.  'ap' will load setfl files for the adp pair_style.
         If not given, will attempt to load the file using the different styles.
+    dtype : data-type, optional
+        The floating point dtype to store tabulated values as.  Default value
+        is 'float64'.
         
     Returns
     -------
@@ -31,13 +38,13 @@ def load_eam(f: Union[str, io.IOBase],
     
     # Shortcut to classes for known styles
     if style == 'eam':
-        return EAM(f)
+        return EAM(f, dtype=dtype)
     elif style == 'eam/alloy' or style == 'alloy':
-        return EAMAlloy(f)
+        return EAMAlloy(f, dtype=dtype)
     elif style == 'eam/fs' or style == 'fs':
-        return EAMFS(f)
+        return EAMFS(f, dtype=dtype)
     elif style == 'adp':
-        return ADP(f)
+        return ADP(f, dtype=dtype)
     elif style is not None:
         raise ValueError('Unknown style')
     
@@ -51,7 +58,7 @@ def load_eam(f: Union[str, io.IOBase],
     def test_style(f, cls):
         """Try loading as cls, reset f position if it fails"""
         try:
-            obj = cls(f)
+            obj = cls(f, dtype=dtype)
         except:
             f.seek(0)
         else:
@@ -10,6 +10,7 @@ from yabadaba.record import Record
 from yabadaba.tools import iaslist
 
 # Local imports
+from .BaseRecord import BaseRecord
 from . import Potential
 
 __all__ = ['Action']
@@ -78,7 +79,7 @@ class PotInfo(Record):
                    elements=potential.elements,
                    othername=potential.othername)
 
-class Action(Record):
+class Action(BaseRecord):
     """
     Class for representing Action records that document changes to the
     Interatomic Potentials Repository.
@@ -6,10 +6,11 @@ from typing import Tuple, Union
 # https://requests.readthedocs.io/en/master/
 import requests
 
-# https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
+# Local imports
+from .BaseRecord import BaseRecord
+from ..tools.instrumentation import span, traced
 
-class Artifact(Record):
+class Artifact(BaseRecord):
     """
     Class for describing artifacts (files accessible online). Note that this is
     meant as a component class for other record objects.
@@ -50,6 +51,7 @@ class Artifact(Record):
         self._add_value('longstr', 'label', modelpath='web-link.label')
         self._add_value('longstr', 'filename', modelpath='web-link.link-text')
 
+    @traced('Artifact.download', params=('targetdir',))
     def download(self,
                  targetdir: Union[str, Path],
                  overwrite: bool = False,
@@ -79,7 +81,9 @@ class Artifact(Record):
         if overwrite or not targetname.exists():
             
             # Get the URL
-            r = requests.get(self.url)
+            with span('request', url=self.url) as phase:
+                r = requests.get(self.url)
+                phase.set(status=r.status_code, size=len(r.content))
             
             # Print message if URL does not exist
             if r.status_code == 404:
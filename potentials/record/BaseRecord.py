@@ -0,0 +1,12 @@
+# coding: utf-8
+# https://github.com/usnistgov/yabadaba
+from yabadaba.record import Record
+
+class BaseRecord(Record):
+    """
+    Base parent class for the record styles that are transformed to html
+    and validated using the cached compiled xsl and xsd files.
+    """
+    # Transform and validate using the cached compiled xsl and xsd
+    from ._html import html
+    from ._xsd import valid_xml
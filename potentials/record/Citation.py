@@ -12,10 +12,10 @@ from DataModelDict import DataModelDict as DM
 # https://bibtexparser.readthedocs.io/en/master/
 import bibtexparser
 
-# https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
+# Local imports
+from .BaseRecord import BaseRecord
 
-class Author(Record):
+class Author(BaseRecord):
     """
     Class for describing cited authors
     """
@@ -55,7 +55,7 @@ class Author(Record):
         self._add_value('longstr', 'surname')
         self._add_value('str', 'suffix')
 
-class Citation(Record):
+class Citation(BaseRecord):
     """
     Class for representing Citation metadata records.
     """
@@ -91,8 +91,9 @@ class Citation(Record):
         Note that the order values are defined matters
         when build_model is called!!!
         """
-        # init bibdict
+        # init bibdict and the fields that bibtex was last built or set for
         self.__bibdict = None
+        self.__bibfields = None
         
         self._add_value('str', 'doctype', modelpath='document-type',
                         allowedvalues=['book', 'journal', 'report', 'thesis',
@@ -108,7 +109,7 @@ class Citation(Record):
         self._add_value('citepage', 'pages')
         self._add_value('str', 'doi', modelpath='DOI')
         self._add_value('str', 'url')
-        self._add_value('longstr', 'bibtex')
+        self._add_value('bibtex', 'bibtex')
 
     @property
     def defaultname(self) -> Optional[str]:
@@ -121,7 +122,8 @@ class Citation(Record):
 
     @property
     def bibdict(self) -> Optional[dict]:
-        """dict: dict representation of the bibtex, if parsed"""
+        """dict: dict representation of the bibtex, if parsed or built"""
+        self.update_bibtex()
         return self.__bibdict
 
     @property
@@ -197,8 +199,6 @@ class Citation(Record):
         bibdict = bib_database.entries[0]
 
         # Save values from bibdict to object attributes
-        self.bibtex = bibtex
-        self.__bibdict = bibdict
         self.doctype = self.doctype_from_entrytype(bibdict['ENTRYTYPE'])
         self.title = bibdict.get('title', None)
         self.publication = bibdict.get('journal', None)
@@ -241,24 +241,49 @@ class Citation(Record):
                 
                 self.add_author(givenname=initials, surname=sur, suffix=suffix)
 
+        # Keep the parsed bibtex until the fields are changed
+        self.bibtex = bibtex
+        self.__bibdict = bibdict
+
     def load_model(self,
                    model: str | io.IOBase | DM,
                    name: str | None = None):
         
         super().load_model(model, name)
-        self.build_bibtex()
-    
+
+        # bibtex is rebuilt from the loaded fields when first accessed
+        self.__bibfields = None
+
+    def __bibtex_fields(self) -> tuple:
+        """tuple: The values of all fields that the bibtex is built from"""
+        return (self.doctype, self.title, self.publication, self.year,
+                self.month, self.volume, self.issue, self.pages, self.doi,
+                tuple((author.surname, author.givenname, author.suffix)
+                      for author in self.authors))
+
+    def _pin_bibtex(self):
+        """Marks the current bibtex as up to date with the current fields"""
+        self.__bibfields = self.__bibtex_fields()
+
+    def update_bibtex(self):
+        """
+        Builds bibtex and bibdict if any of the fields they are built from
+        changed since they were last built, parsed or set.
+        """
+        if self.__bibfields != self.__bibtex_fields():
+            self.build_bibtex()
+
     def build_bibtex(self):
         """str : bibtex of citation"""
         
         # Initialize/clear bibdict
-        self.__bibdict = {}
+        bibdict = self.__bibdict = {}
 
         # Set ID
-        self.bibdict['ID'] = self.year_authors
+        bibdict['ID'] = self.year_authors
 
         # Set entrytype
-        self.bibdict['ENTRYTYPE'] = self.entrytype_from_doctype(self.doctype)
+        bibdict['ENTRYTYPE'] = self.entrytype_from_doctype(self.doctype)
 
         # Build bibdict fields
         if len(self.authors) > 0:
@@ -268,27 +293,27 @@ class Citation(Record):
                     authorfields.append(f'{author.surname}, {author.givenname}')
                 else:
                     authorfields.append(f'{author.surname}, {author.suffix}, {author.givenname}')
-            self.bibdict['author'] = ' and '.join(authorfields)
+            bibdict['author'] = ' and '.join(authorfields)
         if self.title is not None:
-            self.bibdict['title'] = self.title
+            bibdict['title'] = self.title
         if self.publication is not None:
-            self.bibdict['journal'] = self.publication
+            bibdict['journal'] = self.publication
         if self.year is not None:
-            self.bibdict['year'] = str(self.year)
+            bibdict['year'] = str(self.year)
         if self.volume is not None:
-            self.bibdict['volume'] = self.volume
+            bibdict['volume'] = self.volume
         if self.issue is not None:
-            self.bibdict['number'] = self.issue
+            bibdict['number'] = self.issue
         if self.pages is not None:
-            self.bibdict['pages'] = self.pages
+            bibdict['pages'] = self.pages
         if self.month is not None:
-            self.bibdict['month'] = self.get_value('month').fullname
+            bibdict['month'] = self.get_value('month').fullname
         if self.doi is not None:
-            self.bibdict['doi'] = self.doi
+            bibdict['doi'] = self.doi
        
         # Convert bibdict to bibtex
         bib_database = bibtexparser.bibdatabase.BibDatabase()
-        bib_database.entries = [self.bibdict]
+        bib_database.entries = [bibdict]
         self.bibtex = bibtexparser.dumps(bib_database)
 
     def build_model(self):
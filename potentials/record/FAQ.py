@@ -2,12 +2,12 @@
 # Standard Python libraries
 from typing import Tuple
 
-# https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
+# Local imports
+from .BaseRecord import BaseRecord
 
 __all__ = ['FAQ']
 
-class FAQ(Record):
+class FAQ(BaseRecord):
     """
     Class for representing FAQ records that document the FAQs for the NIST
     Interatomic Potentials Repository.
@@ -7,15 +7,13 @@ from typing import Tuple, Union
 # https://github.com/usnistgov/DataModelDict
 from DataModelDict import DataModelDict as DM
 
-# https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
-
 # Local imports
+from .BaseRecord import BaseRecord
 from .Artifact import Artifact
 from .Parameter import Parameter
 from .Link import Link
 
-class Implementation(Record):
+class Implementation(BaseRecord):
     """
     Class for representing Implementation metadata records. . Note that this is
     meant as a component class for other record objects.
@@ -2,10 +2,10 @@
 # Standard Python libraries
 from typing import Tuple
 
-# https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
+# Local imports
+from .BaseRecord import BaseRecord
 
-class Link(Record):
+class Link(BaseRecord):
     """
     Class for describing website link
     """
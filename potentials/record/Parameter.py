@@ -3,10 +3,10 @@
 import io
 from typing import Tuple
 
-# https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
+# Local imports
+from .BaseRecord import BaseRecord
 
-class Parameter(Record):
+class Parameter(BaseRecord):
     """
     Class for describing parameter values. Note that this is
     meant as a component class for other record objects.
@@ -9,14 +9,14 @@ import datetime
 from DataModelDict import DataModelDict as DM
 
 # https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
 from yabadaba import load_value, load_query
 
 # Local imports
+from .BaseRecord import BaseRecord
 from .Citation import Citation
 from .Implementation import Implementation
 
-class Potential(Record):
+class Potential(BaseRecord):
 
     def __init__(self,
                  model: str | io.IOBase | DM | None = None,
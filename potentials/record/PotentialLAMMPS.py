@@ -14,7 +14,6 @@ import numpy.typing as npt
 from DataModelDict import DataModelDict as DM
 
 # https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
 from yabadaba import load_value, load_query
 from yabadaba.tools import dict_insert
 
@@ -23,8 +22,9 @@ from ..tools import aslist, atomic_mass
 from .Artifact import Artifact
 from .AtomInfo import AtomInfo
 from .CommandLine import CommandLine, PairCoeffLine
+from .BaseRecord import BaseRecord
 
-class PotentialLAMMPS(Record):
+class PotentialLAMMPS(BaseRecord):
     """
     Class for building LAMMPS input lines from a potential-LAMMPS data model.
     """
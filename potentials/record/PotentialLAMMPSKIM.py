@@ -13,14 +13,14 @@ import numpy as np
 import numpy.typing as npt
 
 # https://github.com/usnistgov/yabadaba
-from yabadaba.record import Record
 from yabadaba import load_query
 
 # local imports
 from ..tools import aslist, atomic_mass
 from .PotentialInfo import PotentialInfo
+from .BaseRecord import BaseRecord
 
-class PotentialLAMMPSKIM(Record):
+class PotentialLAMMPSKIM(BaseRecord):
     """
     Class for building LAMMPS input lines from a potential-LAMMPS-KIM data model.
     """
@@ -9,6 +9,9 @@ from DataModelDict import DataModelDict as DM
 # https://github.com/usnistgov/yabadaba
 from yabadaba.record import Record
 
+# Local imports
+from .BaseRecord import BaseRecord
+
 class ElementSystem(Record):
     """
     Component class for representing an elemental system being requested.
@@ -38,7 +41,7 @@ class ElementSystem(Record):
         self._add_value('str', 'formula', modelpath='chemical-formula')
         self._add_value('strlist', 'elements', modelpath='element')
 
-class Request(Record):
+class Request(BaseRecord):
     """
     Class for representing Request records that are associated with user
     requests to the NIST Interatomic Potentials Repository for new potentials.
@@ -0,0 +1,65 @@
+# coding: utf-8
+# Standard Python libraries
+from importlib import resources
+import threading
+from typing import Optional, Tuple
+
+# https://lxml.de/
+import lxml.etree as ET
+
+# https://ipython.org/
+from IPython.display import display, HTML
+
+# Compiled transformers are not shared between threads, so each thread keeps
+# its own cache
+_local = threading.local()
+
+def load_transform(xsl_filename: Tuple[str, str]) -> ET.XSLT:
+    """
+    Returns the compiled xsl transformer for a record style's xsl file.  The
+    file is read and compiled once per thread.
+
+    Parameters
+    ----------
+    xsl_filename : tuple
+        The module path and file name of the xsl file.
+    """
+    try:
+        transforms = _local.transforms
+    except AttributeError:
+        transforms = _local.transforms = {}
+    try:
+        return transforms[xsl_filename]
+    except KeyError:
+        xsl = ET.fromstring(resources.files(xsl_filename[0]).joinpath(xsl_filename[1]).read_bytes())
+        transform = transforms[xsl_filename] = ET.XSLT(xsl)
+        return transform
+
+def html(self,
+         render: bool = False) -> Optional[str]:
+    """
+    Returns an HTML representation of the object.  The compiled xsl
+    transformer of the record style is cached.
+
+    Parameters
+    ----------
+    render : bool, optional
+        If True, then IPython is used to render the HTML.  If False
+        (default), then the HTML code is returned as a str.
+
+    Returns
+    -------
+    str
+        The HTML code contents.  Returned if render=False.
+    """
+    # Build xml content
+    xml = ET.fromstring(self.model.xml().encode('UTF-8'))
+
+    # Transform to html
+    transform = load_transform(self.xsl_filename)
+    html_content = ET.tostring(transform(xml)).decode('UTF-8')
+
+    if render:
+        display(HTML(html_content))
+    else:
+        return html_content
@@ -0,0 +1,84 @@
+# coding: utf-8
+# Standard Python libraries
+from importlib import resources
+import threading
+from typing import Optional, Tuple
+
+# https://lxml.de/
+import lxml.etree as ET
+
+# Compiled schemas are not shared between threads, so each thread keeps its
+# own cache
+_local = threading.local()
+
+def load_schema(xsd_filename: Tuple[str, str]) -> ET.XMLSchema:
+    """
+    Returns the compiled xml schema for a record style's xsd file.  The file
+    is read and compiled once per thread.
+
+    Parameters
+    ----------
+    xsd_filename : tuple
+        The module path and file name of the xsd file.
+    """
+    try:
+        schemas = _local.schemas
+    except AttributeError:
+        schemas = _local.schemas = {}
+    try:
+        return schemas[xsd_filename]
+    except KeyError:
+        xsd = ET.fromstring(resources.files(xsd_filename[0]).joinpath(xsd_filename[1]).read_bytes())
+        schema = schemas[xsd_filename] = ET.XMLSchema(xsd)
+        return schema
+
+def schema_errors(xsd_filename: Tuple[str, str],
+                  xml_content: bytes) -> list:
+    """
+    Validates XML content against a schema.
+
+    Parameters
+    ----------
+    xsd_filename : tuple
+        The module path and file name of the xsd file.
+    xml_content : bytes
+        The XML content to validate.
+
+    Returns
+    -------
+    list of tuple
+        The (line, column, message) of each validation error.  Empty if the
+        content is valid.
+    """
+    schema = load_schema(xsd_filename)
+    try:
+        xml = ET.fromstring(xml_content)
+    except ET.XMLSyntaxError as e:
+        return [(e.lineno, e.offset, str(e))]
+    if schema.validate(xml):
+        return []
+    return [(error.line, error.column, error.message) for error in schema.error_log]
+
+def valid_xml(self,
+              xml_content: Optional[str] = None) -> bool:
+    """
+    Tests if XML content is valid with schema.  The compiled schema of the
+    record style is cached.
+
+    Parameters
+    ----------
+    xml_content : str, optional
+        XML content to test against the record's schema.
+        If not given, will generate the xml using build_model.
+
+    Returns
+    -------
+    bool
+        Indicating if XML is valid.
+    """
+    # Build xml content
+    if xml_content is None:
+        xml_content = self.model.xml()
+
+    xml = ET.fromstring(xml_content.encode('UTF-8'))
+    return load_schema(self.xsd_filename).validate(xml)
@@ -5,8 +5,12 @@ from .atomic_info import *
 from .atomic_info import __all__ as atomic_info_all
 from .parse_authors import parse_authors
 from .numderivative import numderivative
+from .decimate import decimate
+from . import instrumentation
+from .instrumentation import Tracer, enable_tracing, disable_tracing, tracing
 
 __all__ = ['aslist', 'iaslist', 'screen_input', 'uber_open_rmode', 'parse_authors',
-           'numderivative']
+           'numderivative', 'decimate', 'instrumentation', 'Tracer', 'enable_tracing',
+           'disable_tracing', 'tracing']
 __all__.extend(atomic_info_all)
 __all__.sort()
\ No newline at end of file
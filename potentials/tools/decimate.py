@@ -0,0 +1,73 @@
+# coding: utf-8
+# Standard Python libraries
+from typing import Optional, Tuple
+
+# https://numpy.org/
+import numpy as np
+import numpy.typing as npt
+
+def decimate(x: npt.ArrayLike,
+             y: npt.ArrayLike,
+             max_points: Optional[int] = None,
+             xlim: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a curve to at most max_points points for plotting.  The points
+    are split into equal sized bins and the minimum and maximum y points of
+    each bin are kept along with the end points.  This keeps the peaks, wells
+    and discontinuities of the curve visible at plot resolution.  NaN values
+    are only kept for bins that have no other values.
+
+    Parameters
+    ----------
+    x : array-like
+        Coordinates of the curve.
+    y : array-like
+        Curve values at the x coordinates.
+    max_points : int, optional
+        The maximum number of points to keep.  Must be at least 4.  If None
+        (default) or not less than the number of points, then x and y are
+        returned as given.
+    xlim : tuple, optional
+        The range of x values to be plotted.  If given, the points outside of
+        the range are removed before decimating, except for the nearest point
+        on each side so that the curve extends to the edges of the plot.
+
+    Returns
+    -------
+    newx : np.NDArray
+        The kept coordinates, in their original order.
+    newy : np.NDArray
+        The curve values at newx.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if xlim is not None:
+        inside = (x >= min(xlim)) & (x <= max(xlim))
+        keep = inside.copy()
+        keep[1:] |= inside[:-1]
+        keep[:-1] |= inside[1:]
+        x = x[keep]
+        y = y[keep]
+    if max_points is None or len(y) <= max_points:
+        return x, y
+    if max_points < 4:
+        raise ValueError('max_points must be >= 4')
+
+    # Split into bins, padding the last with the final value
+    numpoints = len(y)
+    binsize = -(-numpoints // ((max_points - 2) // 2))
+    numbins = -(-numpoints // binsize)
+    binned = np.pad(y, (0, numbins * binsize - numpoints), mode='edge').reshape(numbins, binsize)
+
+    # Ignore NaN values, such as phi(r) at r = 0, in bins with other values
+    nanbins = np.isnan(binned).all(axis=1)
+    binned[nanbins] = 0.0
+
+    # Keep the end points and the min and max of each bin
+    starts = np.arange(numbins) * binsize
+    index = np.concatenate([[0, numpoints - 1],
+                            starts + np.nanargmin(binned, axis=1),
+                            starts + np.nanargmax(binned, axis=1)])
+    index = np.unique(np.minimum(index, numpoints - 1))
+
+    return x[index], y[index]
@@ -0,0 +1,407 @@
+# coding: utf-8
+# Standard Python libraries
+from contextlib import contextmanager
+from functools import wraps
+import inspect
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, Union
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+__all__ = ['Span', 'Tracer', 'span', 'traced', 'propagate', 'get_tracer',
+           'enable_tracing', 'disable_tracing', 'tracing']
+
+# The active Tracer.  Instrumented code only checks this when tracing is off.
+_tracer = None
+
+class Span():
+    """
+    A timed, named operation.  Spans started while another span of the same
+    thread is open are nested inside it.
+    """
+    __slots__ = ('tracer', 'name', 'attrs', 'parent', 'depth', 'thread',
+                 'start', 'end')
+
+    def __init__(self,
+                 tracer: 'Tracer',
+                 name: str,
+                 attrs: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.parent = None
+        self.depth = 0
+        self.thread = None
+        self.start = None
+        self.end = None
+
+    def __enter__(self) -> 'Span':
+        self.tracer._open(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.attrs['error'] = f'{exc_type.__name__}: {exc_value}'
+        self.tracer._close(self)
+
+    def __repr__(self) -> str:
+        return f'Span({self.name!r}, duration={self.duration})'
+
+    @property
+    def duration(self) -> Optional[float]:
+        """float or None: The span's duration in seconds, if finished"""
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+    def set(self, **attrs):
+        """Adds attributes to the span, such as counts found during it"""
+        self.attrs.update(attrs)
+
+    def asdict(self) -> dict:
+        """Returns the span's fields as a dict"""
+        return {'name': self.name,
+                'parent': None if self.parent is None else self.parent.name,
+                'depth': self.depth, 'thread': self.thread,
+                'start': self.start, 'duration': self.duration,
+                'attrs': dict(self.attrs)}
+
+class _NullSpan():
+    """Shared do-nothing span returned when tracing is disabled"""
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+_nullspan = _NullSpan()
+
+class Tracer():
+    """
+    Collects the spans of instrumented operations and passes span events to
+    callbacks.
+    """
+    def __init__(self,
+                 callbacks: Optional[list] = None,
+                 logger: Union[logging.Logger, str, None] = None,
+                 level: int = logging.DEBUG):
+        """
+        Class initializer.
+
+        Parameters
+        ----------
+        callbacks : list, optional
+            Functions called as callback(event, span) when spans start and
+            finish, with event being 'start' or 'end'.
+        logger : logging.Logger or str, optional
+            If given, each finished span is logged to this logger (or the
+            logger of this name) indented by its nesting depth.
+        level : int, optional
+            The logging level to use.  Default value is logging.DEBUG.
+        """
+        self.__callbacks = []
+        self.__spans = []
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__origin = time.perf_counter()
+        for callback in callbacks if callbacks is not None else []:
+            self.add_callback(callback)
+        if logger is not None:
+            self.add_callback(logging_callback(logger, level))
+
+    @property
+    def spans(self) -> list:
+        """list of Span: The finished spans in the order that they finished"""
+        with self.__lock:
+            return list(self.__spans)
+
+    def add_callback(self, callback: Callable):
+        """
+        Adds a function to call as callback(event, span) when spans start and
+        finish, with event being 'start' or 'end'.
+        """
+        self.__callbacks.append(callback)
+
+    def clear(self):
+        """Removes all finished spans"""
+        with self.__lock:
+            self.__spans.clear()
+
+    def current(self) -> Optional[Span]:
+        """Returns the innermost open span of the calling thread, if any"""
+        stack = getattr(self.__local, 'stack', None)
+        if stack:
+            return stack[-1]
+        return None
+
+    def span(self, name: str, /, **attrs) -> Span:
+        """
+        Returns a new span to use as a context manager.
+
+        Parameters
+        ----------
+        name : str
+            The name of the operation.
+        **attrs : any, optional
+            Attributes describing the operation, which must be JSON
+            serializable for exporting.
+        """
+        return Span(self, name, attrs)
+
+    def _open(self, span: Span):
+        stack = getattr(self.__local, 'stack', None)
+        if stack is None:
+            stack = self.__local.stack = []
+        if stack:
+            span.parent = stack[-1]
+        else:
+            span.parent = getattr(self.__local, 'parent', None)
+        if span.parent is not None:
+            span.depth = span.parent.depth + 1
+        span.thread = threading.get_ident()
+        stack.append(span)
+        for callback in self.__callbacks:
+            callback('start', span)
+        span.start = time.perf_counter()
+
+    def _close(self, span: Span):
+        span.end = time.perf_counter()
+        stack = self.__local.stack
+        if span in stack:
+            stack.remove(span)
+        with self.__lock:
+            self.__spans.append(span)
+        for callback in self.__callbacks:
+            callback('end', span)
+
+    @contextmanager
+    def _adopt(self, parent: Optional[Span]) -> Iterator:
+        """Makes parent the parent of root spans opened by the calling thread"""
+        previous = getattr(self.__local, 'parent', None)
+        self.__local.parent = parent
+        try:
+            yield
+        finally:
+            self.__local.parent = previous
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Returns a table of the number of calls and the total, mean and
+        maximum durations in seconds of each span name, sorted by total.
+        """
+        spans = self.spans
+        df = pd.DataFrame({'name': [s.name for s in spans],
+                           'duration': [s.duration for s in spans]})
+        df = df.groupby('name')['duration'].agg(['count', 'sum', 'mean', 'max'])
+        df = df.rename(columns={'sum': 'total'}).sort_values('total', ascending=False)
+        return df.reset_index()
+
+    def trace(self) -> dict:
+        """
+        Returns the finished spans in the Chrome trace event format, which
+        can be viewed with chrome://tracing or https://ui.perfetto.dev.
+        """
+        events = []
+        for span in self.spans:
+            events.append({
+                'name': span.name, 'cat': 'potentials', 'ph': 'X',
+                'ts': (span.start - self.__origin) * 1e6,
+                'dur': span.duration * 1e6, 'pid': 0, 'tid': span.thread,
+                'args': {k: jsonable(v) for k, v in span.attrs.items()}})
+        events.sort(key=lambda event: event['ts'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_trace(self, fname: Union[str, Path]):
+        """
+        Saves the finished spans to a JSON file in the Chrome trace event
+        format.
+
+        Parameters
+        ----------
+        fname : path-like object
+            The file to save to.
+        """
+        with open(fname, 'w', encoding='UTF-8') as f:
+            json.dump(self.trace(), f, indent=1)
+
+def jsonable(value: Any) -> Any:
+    """Converts span attribute values that are not JSON types to str"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [jsonable(v) for v in value]
+    return str(value)
+
+def logging_callback(logger: Union[logging.Logger, str],
+                     level: int = logging.DEBUG) -> Callable:
+    """
+    Builds a Tracer callback that logs finished spans.
+
+    Parameters
+    ----------
+    logger : logging.Logger or str
+        The logger, or name of the logger, to use.
+    level : int, optional
+        The logging level to use.  Default value is logging.DEBUG.
+    """
+    if isinstance(logger, str):
+        logger = logging.getLogger(logger)
+
+    def callback(event: str, span: Span):
+        if event == 'end' and logger.isEnabledFor(level):
+            attrs = ' '.join(f'{k}={v}' for k, v in span.attrs.items())
+            logger.log(level, '%s%s %.3f ms %s', '  ' * span.depth, span.name,
+                       span.duration * 1000, attrs)
+    return callback
+
+def span(name: str, /, **attrs) -> Union[Span, _NullSpan]:
+    """
+    Returns a span of the active Tracer to use as a context manager, or a
+    shared do-nothing span if tracing is disabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the operation.
+    **attrs : any, optional
+        Attributes describing the operation.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _nullspan
+    return tracer.span(name, **attrs)
+
+def traced(name: str,
+           params: tuple = ()) -> Callable:
+    """
+    Decorator that runs a function inside a span when tracing is enabled.
+
+    Parameters
+    ----------
+    name : str
+        The span name.
+    params : tuple, optional
+        Names of the function's parameters to record as span attributes.
+    """
+    def decorator(fxn: Callable) -> Callable:
+        signature = inspect.signature(fxn)
+
+        @wraps(fxn)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return fxn(*args, **kwargs)
+
+            attrs = {}
+            if len(params) > 0:
+                arguments = signature.bind(*args, **kwargs).arguments
+                arguments.update(arguments.pop('kwargs', {}))
+                for param in params:
+                    if arguments.get(param, None) is not None:
+                        attrs[param] = arguments[param]
+            with tracer.span(name, **attrs):
+                return fxn(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+def propagate(fxn: Callable) -> Callable:
+    """
+    Wraps a function that will be called in other threads, such as by a
+    thread pool, so that its spans are nested inside the span that is open in
+    the calling thread.  Returns fxn unchanged if tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return fxn
+    parent = tracer.current()
+
+    @wraps(fxn)
+    def wrapper(*args, **kwargs):
+        with tracer._adopt(parent):
+            return fxn(*args, **kwargs)
+    return wrapper
+
+def get_tracer() -> Optional[Tracer]:
+    """Returns the active Tracer, or None if tracing is disabled"""
+    return _tracer
+
+def enable_tracing(tracer: Optional[Tracer] = None,
+                   **kwargs) -> Tracer:
+    """
+    Enables tracing of the instrumented operations.
+
+    Parameters
+    ----------
+    tracer : Tracer, optional
+        The Tracer to collect the spans with.  If not given, a new Tracer is
+        created.
+    **kwargs : any, optional
+        Parameters for creating the new Tracer.
+
+    Returns
+    -------
+    Tracer
+        The active Tracer.
+    """
+    global _tracer
+    if tracer is None:
+        tracer = Tracer(**kwargs)
+    elif len(kwargs) > 0:
+        raise ValueError('kwargs cannot be given with tracer')
+    _tracer = tracer
+    return tracer
+
+def disable_tracing() -> Optional[Tracer]:
+    """
+    Disables tracing.
+
+    Returns
+    -------
+    Tracer or None
+        The previously active Tracer.
+    """
+    global _tracer
+    tracer = _tracer
+    _tracer = None
+    return tracer
+
+@contextmanager
+def tracing(fname: Union[str, Path, None] = None,
+            **kwargs) -> Iterator[Tracer]:
+    """
+    Context manager that enables tracing for the enclosed code, then
+    restores the previous tracing state.
+
+    Parameters
+    ----------
+    fname : path-like object, optional
+        If given, the collected spans are saved to this JSON trace file when
+        the context exits.
+    **kwargs : any, optional
+        Parameters for creating the Tracer, i.e. callbacks, logger and level.
+
+    Yields
+    ------
+    Tracer
+        The active Tracer.
+    """
+    global _tracer
+    previous = _tracer
+    tracer = enable_tracing(**kwargs)
+    try:
+        yield tracer
+    finally:
+        _tracer = previous
+        if fname is not None:
+            tracer.save_trace(fname)
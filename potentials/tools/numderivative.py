@@ -10,7 +10,9 @@ def numderivative(x: npt.ArrayLike,
                   y: npt.ArrayLike,
                   n: int = 1) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Computes the numerical derivative for a tabulated function.
+    Computes the numerical derivative for a tabulated function using nth
+    order forward finite differences.  For the derivatives of the paramfile
+    functions on their own grids, use their derivative parameters instead.
     
     Parameters
     ----------
@@ -30,21 +32,18 @@ def numderivative(x: npt.ArrayLike,
     newy : np.NDArray
         N-n values for the nth derivative of y.
     """
+    if n < 0:
+        raise ValueError('n must be >=0')
+    
     x = np.asarray(x)
     y = np.asarray(y)
-    
     if n == 0:
         # Return data as given
         return x, y
     
-    elif n > 0:
-        # Compute the numerical derivative
-        deltax = x[1] - x[0]
-        newx = x[:-1] + deltax / 2
-        newy = (y[1:] - y[:-1]) / deltax
-        
-        # Iterate until n=0
-        return numderivative(newx, newy, n=n-1)
+    # Compute all n orders of finite differences at once
+    deltax = x[1] - x[0]
+    newx = x[:-n] + n * deltax / 2
+    newy = np.diff(y, n=n) / deltax ** n
     
-    else:
-        raise ValueError('n must be >=0')
\ No newline at end of file
+    return newx, newy
@@ -0,0 +1,25 @@
+from yabadaba.value.LongStrValue import LongStrValue
+
+class BibtexValue(LongStrValue):
+    """
+    Long string value for a Citation's bibtex.  The content is generated by
+    the record from its other fields when it is read after they changed.
+    """
+
+    @property
+    def style(self) -> str:
+        """str: The value style"""
+        return 'bibtex'
+
+    @property
+    def value(self):
+        """str or None: The bibtex, rebuilt if the record's fields changed"""
+        self.record.update_bibtex()
+        return LongStrValue.value.fget(self)
+
+    @value.setter
+    def value(self, val):
+        LongStrValue.value.fset(self, val)
+
+        # Explicitly set bibtex is kept until the record's fields change
+        self.record._pin_bibtex()
@@ -1,3 +1,4 @@
 from yabadaba import valuemanager
 
-valuemanager.import_style('citepage', '.CitePageValue', __name__)
\ No newline at end of file
+valuemanager.import_style('citepage', '.CitePageValue', __name__)
+valuemanager.import_style('bibtex', '.BibtexValue', __name__)
\ No newline at end of file
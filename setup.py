@@ -38,7 +38,7 @@ setup(
     url = 'https://github.com/usnistgov/potentials',
     author = 'Lucas Hale',
     author_email = 'lucas.hale@nist.gov',
-    packages = find_packages(),
+    packages = find_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires = [
         'xmltodict',
         'DataModelDict',
@@ -0,0 +1,49 @@
+import numpy as np
+
+from potentials.paramfile import EAMAlloy
+
+def eam_alloy(numr=2001):
+    eam = EAMAlloy(header='test potential', symbol='Al', number=13,
+                   mass=26.98, alat=4.05, lattice='fcc',
+                   numr=numr, cutoffr=6.0, numrho=numr, cutoffrho=50.0)
+    eam.set_F_rho('Al', table=-np.sqrt(eam.rho + 1.0))
+    eam.set_rho_r('Al', table=np.exp(-eam.r))
+    eam.set_rphi_r(['Al', 'Al'], table=eam.r * np.exp(-2 * eam.r))
+    return eam
+
+def test_spline_derivatives():
+
+    eam = eam_alloy()
+    r = eam.r
+
+    # Derivatives of the tabulated values follow the analytic derivatives
+    assert np.allclose(eam.rho_r('Al', derivative=1), -np.exp(-r), rtol=1e-6, atol=1e-9)
+    assert np.allclose(eam.rho_r('Al', derivative=2), np.exp(-r), rtol=1e-4, atol=1e-6)
+    drphi = (1 - 2 * r) * np.exp(-2 * r)
+    assert np.allclose(eam.rphi_r(['Al', 'Al'], derivative=1), drphi, rtol=1e-6, atol=1e-9)
+    assert np.allclose(eam.F_rho('Al', derivative=1), -0.5 / np.sqrt(eam.rho + 1.0),
+                       rtol=1e-5)
+
+    # Evaluated away from the grid
+    r = np.linspace(0.5, 5.5, 7) + eam.deltar / 3
+    assert np.allclose(eam.rho_r('Al', r=r), np.exp(-r))
+    assert np.allclose(eam.rho_r('Al', r=r, derivative=1), -np.exp(-r))
+
+def test_spline_cache():
+
+    eam = eam_alloy(numr=101)
+    r = np.linspace(0.5, 5.5, 7) + eam.deltar / 3
+    assert np.allclose(eam.rho_r('Al', r=r), np.exp(-r), rtol=1e-3)
+
+    # New tables replace the cached splines
+    eam.set_rho_r('Al', table=2 * np.exp(-eam.r))
+    assert np.allclose(eam.rho_r('Al', r=r), 2 * np.exp(-r), rtol=1e-3)
+    assert np.allclose(eam.rho_r('Al', r=r, derivative=1), -2 * np.exp(-r), rtol=1e-2)
+
+    # Splines of functions are rebuilt for a new grid
+    eam.set_rho_r('Al', fxn=lambda r: np.exp(-r))
+    assert len(eam.rho_r('Al', derivative=1)) == 101
+    eam.set_r(num=201, cutoff=6.0)
+    derivative = eam.rho_r('Al', derivative=1)
+    assert len(derivative) == 201
+    assert np.allclose(derivative, -np.exp(-eam.r), rtol=1e-3, atol=1e-6)
@@ -0,0 +1,131 @@
+import io
+
+import numpy as np
+import pytest
+
+from potentials.paramfile import (EAM, EAMAlloy, EAMFS, ADP, eam_alloy_to_eam_fs,
+                                  load_eam)
+from potentials.paramfile.TablePool import TablePool
+
+def eam_alloy(symbols=('Al', 'Ni', 'Cu')):
+    eam = EAMAlloy(header='test potential', symbol=list(symbols),
+                   number=list(range(1, len(symbols) + 1)),
+                   mass=[1.0] * len(symbols), alat=[4.0] * len(symbols),
+                   lattice=['fcc'] * len(symbols),
+                   numr=101, cutoffr=6.0, numrho=101, cutoffrho=50.0)
+    r = eam.r
+    rho = eam.rho
+    for i, symbol in enumerate(symbols):
+        scale = 1.0 + 0.1 * i
+        eam.set_F_rho(symbol, table=-scale * np.sqrt(rho))
+        eam.set_rho_r(symbol, table=scale * np.exp(-r))
+        for symbol2 in symbols[:i + 1]:
+            eam.set_rphi_r([symbol, symbol2],
+                           table=r * (np.exp(-2 * (r - 2.5)) - 2 * np.exp(-(r - 2.5))))
+    return eam
+
+def test_table_pool():
+
+    pool = TablePool()
+    tables = {}
+    pool.store(tables, 'a', [1.0, 2.0])
+    pool.store(tables, 'b', np.array([1.0, 2.0]))
+    assert len(pool) == 1
+    assert tables['a'] is tables['b']
+    assert not tables['a'].flags.writeable
+    assert pool.nbytes == 16
+
+    # Replacing a shared table keeps the other reference
+    pool.store(tables, 'a', [3.0, 4.0])
+    assert len(pool) == 2
+    assert np.array_equal(tables['b'], [1.0, 2.0])
+
+    # Tables are dropped with their last reference
+    pool.discard(tables, 'b')
+    assert len(pool) == 1
+    pool.discard(tables, 'b')
+    pool.discard(tables, 'a')
+    assert len(pool) == 0
+    assert tables == {}
+
+    # Tables are converted to the pool's dtype
+    pool = TablePool('float32')
+    assert pool.intern([1.0, 2.0]).dtype == np.float32
+    assert pool.intern(np.array([1.0, 2.0], dtype=np.float32)) is pool.intern([1, 2])
+    assert len(pool) == 1
+
+def test_eamfs_shared_tables():
+
+    fs = eam_alloy_to_eam_fs(eam_alloy())
+    text = fs.build()
+    fs2 = EAMFS(io.StringIO(text))
+    symbols = fs2.symbols
+
+    # 3 F(rho), 9 rho(r) and 6 r*phi(r) tables share 3 + 3 + 1 arrays
+    assert len(fs2._EAMFS__tables) == 7
+
+    # All expanded tables are still written
+    assert fs2.build() == text
+    for s1 in symbols:
+        for s2 in symbols:
+            assert np.array_equal(fs2.rho_r([s1, s2]), fs.rho_r([s1, s2]))
+            assert np.array_equal(fs2.rphi_r([s1, s2]), fs.rphi_r([s1, s2]))
+
+    # Getters return writable copies that do not change the shared tables
+    rho_r = fs2.rho_r(['Al', 'Ni'])
+    assert rho_r.flags.writeable
+    rho_r[:] = 0.0
+    assert np.array_equal(fs2.rho_r(['Al', 'Ni']), fs.rho_r(['Al', 'Ni']))
+
+    # Setting one table leaves the tables it was shared with unchanged
+    fs2.set_rho_r(['Al', 'Al'], table=np.zeros_like(fs2.r))
+    assert np.array_equal(fs2.rho_r(['Al', 'Al']), np.zeros_like(fs2.r))
+    assert np.array_equal(fs2.rho_r(['Al', 'Ni']), fs.rho_r(['Al', 'Ni']))
+    assert len(fs2._EAMFS__tables) == 8
+
+def test_eamfs_float32():
+
+    fs = eam_alloy_to_eam_fs(eam_alloy())
+    text = fs.build()
+    fs32 = EAMFS(io.StringIO(text), dtype='float32')
+    assert fs32.dtype == np.float32
+    assert fs32._EAMFS__tables.nbytes * 2 == EAMFS(io.StringIO(text))._EAMFS__tables.nbytes
+
+    # All getters and derivatives return float64 close to the float64 values
+    r = fs.r[1:-1] + fs.deltar / 3
+    for s1 in fs.symbols:
+        assert fs32.F_rho(s1).dtype == np.float64
+        assert fs32.F_rho(s1, rho=fs.rho[1:]).dtype == np.float64
+        assert fs32.F_rho(s1, derivative=1).dtype == np.float64
+        assert np.allclose(fs32.F_rho(s1), fs.F_rho(s1), rtol=1e-6)
+        for s2 in fs.symbols:
+            for getter in ['rho_r', 'rphi_r']:
+                v32 = getattr(fs32, getter)
+                v64 = getattr(fs, getter)
+                for kwargs in [{}, {'r': r}, {'derivative': 1}, {'r': r, 'derivative': 2}]:
+                    value = v32([s1, s2], **kwargs)
+                    assert value.dtype == np.float64
+
+                    # Rounding errors grow with each derivative
+                    tol = 1e-6 * 100 ** kwargs.get('derivative', 0)
+                    assert np.allclose(value, v64([s1, s2], **kwargs), rtol=tol, atol=tol)
+            assert fs32.phi_r([s1, s2], r=r).dtype == np.float64
+
+    # Files are still written in float64 precision from the stored values
+    assert EAMFS(io.StringIO(fs32.build()), dtype='float32').build() == fs32.build()
+
+def test_dtype():
+
+    text = eam_alloy_to_eam_fs(eam_alloy()).build()
+    fs = load_eam(io.StringIO(text), dtype='float32')
+    assert isinstance(fs, EAMFS)
+    assert fs.dtype == np.float32
+    assert load_eam(io.StringIO(text), style='fs', dtype='float32').dtype == np.float32
+    assert load_eam(io.StringIO(text)).dtype == np.float64
+
+    # Non-float dtypes are rejected
+    for cls in [EAM, EAMAlloy, EAMFS, ADP]:
+        with pytest.raises(ValueError):
+            cls(dtype='int32')
+        with pytest.raises(ValueError):
+            cls(dtype=object)
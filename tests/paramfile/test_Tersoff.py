@@ -0,0 +1,102 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from potentials.paramfile import Tersoff
+
+def tersoff(pair_style, symbols=('Si', 'C')):
+    tersoff = Tersoff(list(symbols), pair_style=pair_style)
+    params = tersoff.params
+    for i, key in enumerate(params.keys()[3:]):
+        if params[key].dtype.kind == 'f':
+            params[key] = np.linspace(0.1, 10.0 * (i + 1), len(params))
+        else:
+            params[key] = np.arange(len(params)) + i
+    return tersoff
+
+si_entry = ('Si Si Si 3.0 1.0 1.3258 4.8381 2.0417 0.0000 22.956 '
+            '0.33675 1.3258 95.373 3.0 0.2 3.2394 3264.7')
+
+@pytest.mark.parametrize('pair_style', ['tersoff', 'tersoff/mod',
+                                        'tersoff/mod/c', 'tersoff/zbl'])
+def test_load_round_trip(tmp_path, pair_style):
+
+    expected = tersoff(pair_style)
+    fname = Path(tmp_path, 'test.tersoff')
+    expected.save(fname, headers='test potential')
+
+    loaded = Tersoff.load(fname)
+    assert loaded.pair_style == pair_style
+    assert loaded.symbols == expected.symbols
+    pd.testing.assert_frame_equal(loaded.params, expected.params)
+
+def test_load_comments_and_continuation():
+
+    content = '\n'.join([
+        '# Tersoff parameters for Si',
+        '',
+        ' '.join(si_entry.split()[:9]) + '   # entry continues on the next line',
+        '    ' + ' '.join(si_entry.split()[9:]),
+        '# end of file'])
+    loaded = Tersoff.load(io.StringIO(content))
+    assert loaded.pair_style == 'tersoff'
+    assert loaded.symbols == ['Si']
+    assert loaded.params.m[0] == 3
+    assert loaded.params.A[0] == 3264.7
+
+def test_load_ambiguous_columns():
+
+    # tersoff/mod/c and tersoff/zbl both have 21 columns
+    text = tersoff('tersoff/zbl').text()
+    content = '\n'.join(text.splitlines()[1:])
+    with pytest.raises(ValueError, match='could not be inferred'):
+        Tersoff.load(io.StringIO(content))
+
+    loaded = Tersoff.load(io.StringIO(content), pair_style='tersoff/zbl')
+    assert loaded.pair_style == 'tersoff/zbl'
+    assert loaded.params.Z_j.tolist() == list(range(15, 23))
+
+def test_load_missing_and_duplicate_entries():
+
+    lines = tersoff('tersoff').text().splitlines()
+
+    # Missing C C Si entry
+    with pytest.raises(ValueError, match='7 entries found but 8 expected'):
+        Tersoff.load(io.StringIO('\n'.join(lines[:-2] + lines[-1:])), pair_style='tersoff')
+
+    # Si Si Si entry given twice in place of C C Si
+    with pytest.raises(ValueError, match='duplicate'):
+        Tersoff.load(io.StringIO('\n'.join(lines[:-2] + lines[1:2] + lines[-1:])),
+                     pair_style='tersoff')
+
+# Output of the previous text implementation for the parameters set in test_text
+expected_text = '\n'.join([
+    '#Tersoff test potential',
+    '# second header line',
+    '#e1 e2  e3  m   gamma lambda3 c   d   costheta0 n   beta lambda2 B   Rcut D   lambda1 A      Z_i Z_j ZBLcut ZBLexpscale ',
+    'Si  Si  Si  3   0.5   0.0     0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     1830.8 14  14  0.95   0.0         ',
+    'Si  Si  C   3   0.6   1.5     0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     2019.8 14  14  0.95   0.0         ',
+    'Si  C   Si  1   0.7   0.0     0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     2019.8 14  6   0.95   0.0         ',
+    'Si  C   C   1   0.8   2.25    0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     1393.6 14  6   0.95   0.0         ',
+    'C   Si  Si  3   0.9   0.0     0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     1830.8 6   14  0.95   0.0         ',
+    'C   Si  C   3   1.0   1.5     0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     2019.8 6   14  0.95   0.0         ',
+    'C   C   Si  1   1.1   0.0     0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     2019.8 6   6   0.95   0.0         ',
+    'C   C   C   1   1.2   2.25    0.0 0.0 0.0       1.0 1.0  0.0     0.0 0.0  0.0 0.0     1393.6 6   6   0.95   0.0         '])
+
+def test_text():
+
+    tersoff = Tersoff(['Si', 'C'], pair_style='tersoff/zbl')
+    params = tersoff.params
+    params['m'] = [3, 3, 1, 1, 3, 3, 1, 1]
+    params['gamma'] = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2]
+    params['lambda3'] = [0.0, 1.5, 0.0, 2.25, 0.0, 1.5, 0.0, 2.25]
+    params['A'] = [1830.8, 2019.8, 2019.8, 1393.6, 1830.8, 2019.8, 2019.8, 1393.6]
+    params['Z_i'] = [14, 14, 14, 14, 6, 6, 6, 6]
+    params['Z_j'] = [14, 14, 6, 6, 14, 14, 6, 6]
+    params['ZBLcut'] = 0.95
+
+    assert tersoff.text(headers='Tersoff test potential\n# second header line') == expected_text
+    assert str(tersoff) == '\n'.join(expected_text.splitlines()[2:])
@@ -1,12 +1,61 @@
 from pathlib import Path
 import potentials
 from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import shutil
+import threading
+import time
+from urllib.parse import unquote
 
 import pytest
 
 from common_values import testdb_host, test_with_remote
 
 
+class CrossRefStandIn():
+    """Local stand-in for the CrossRef content negotiation endpoint"""
+    def __init__(self, bibtex):
+        self.bibtex = bibtex
+        self.requests = []
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                doi = unquote(self.path[1:])
+                standin.requests.append(doi)
+                if doi in standin.bibtex:
+                    content = standin.bibtex[doi].encode('UTF-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/x-bibtex')
+                    self.send_header('Content-Length', str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                else:
+                    self.send_error(404)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def crossref():
+    bibtex = {}
+    for i in range(6):
+        bibtex[f'10.99999/standin.{i}'] = (
+            f'@article{{Standin_{i},\n author = {{Barnham, Peter T.}},\n'
+            f' doi = {{10.99999/standin.{i}}},\n journal = {{Who Wants to Know}},\n'
+            f' title = {{Pumpkin number {i}}},\n year = {{{1650 + i}}}\n}}\n')
+    standin = CrossRefStandIn(bibtex)
+    yield standin
+    standin.close()
+
 class TestCitation():
 
     potdb = potentials.Database(localpath=testdb_host, remote=test_with_remote)
@@ -171,6 +220,130 @@ class TestCitation():
 
         assert record.authors[0].build_model().json() == jsonstr
 
+    def test_lazy_bibtex(self):
+        """Test that bibtex is built when accessed and rebuilt after changes"""
+        fname = next(testdb_host.glob('Citation/*.json'))
+        record = potentials.load_record('Citation', model=fname)
+        eager = potentials.load_record('Citation', model=fname)
+        eager.build_bibtex()
+        assert record.bibtex == eager.bibtex
+        assert record.bibdict == eager.bibdict
+
+        # Field changes
+        record.title = 'A new title'
+        assert 'title = {A new title}' in record.bibtex
+        assert record.bibdict['title'] == 'A new title'
+
+        # Author changes
+        record.authors[0].surname = 'Newname'
+        assert 'Newname' in record.bibtex
+        record.add_author(givenname='P.T.', surname='Barnham')
+        assert 'Barnham, P.T.' in record.bibdict['author']
+
+        # Parsed bibtex is kept until a field changes
+        bibtex = '@article{key,\n author = {Barnham, Peter T.},\n title = {Pumpkins},\n year = {1650}\n}\n'
+        record = potentials.load_record('Citation')
+        record.load_bibtex(bibtex)
+        assert record.bibtex == bibtex
+        record.year = 1651
+        assert record.bibtex != bibtex
+        assert 'year = {1651}' in record.bibtex
+
+    def test_fetch_citations(self, crossref, tmp_path):
+        """Test fetching citations from the database and CrossRef"""
+        potdb = self.potdb
+        indb = [record.doi for record in potdb.get_citations() if record.doi is not None]
+        dois = [indb[0], '10.99999/standin.0', indb[1].upper(),
+                '10.99999/standin.1', '10.99999/standin.2', '10.99999/standin.0']
+
+        records = potdb.fetch_citations(dois, max_workers=3, rate_limit=None,
+                                        cache_dir=tmp_path, crossref_url=crossref.url)
+        assert [record.doi.lower() for record in records] == [doi.lower() for doi in dois]
+        assert records[3].title == 'Pumpkin number 1'
+        assert records[1] is records[5]
+        assert sorted(crossref.requests) == dois[1:2] + dois[3:5]
+        assert len(list(tmp_path.glob('*.bib'))) == 3
+
+        # Responses are reused from the DOI cache
+        crossref.requests.clear()
+        records = potdb.fetch_citations(dois, cache_dir=tmp_path,
+                                        crossref_url=crossref.url)
+        assert records[4].year == 1652
+        record = potdb.fetch_citation('10.99999/standin.1', cache_dir=tmp_path,
+                                      crossref_url=crossref.url)
+        assert record.title == 'Pumpkin number 1'
+        assert len(crossref.requests) == 0
+
+        # Rate limited requests
+        records = potdb.fetch_citations(['10.99999/standin.3', '10.99999/standin.4',
+                                         '10.99999/standin.5'],
+                                        local=False, remote=False, max_workers=3,
+                                        rate_limit=20.0, cache_dir=tmp_path,
+                                        crossref_url=crossref.url)
+        assert len(crossref.requests) == 3
+
+    def test_citation_index(self, tmp_path):
+        """Test resolving citations with the citation index"""
+        shutil.copytree(Path(testdb_host, 'Citation'), Path(tmp_path, 'Citation'))
+        potdb = potentials.Database(localpath=tmp_path, remote=False)
+
+        index = potdb.citation_index()
+        assert len(index) == 3
+        assert potdb.citation_index() is index
+        assert index.find('10.1080/14786430903260727'.upper()).name == '10.1080_14786430903260727'
+        assert index.find('1776--last-name-f-m').year == 1776
+        assert index.find('10.0000/missing') is None
+        assert potdb.fetch_citation('1776--last-name-f-m').year == 1776
+
+        # Saving and deleting through the Database refreshes the index
+        record = potentials.load_record('Citation', doctype='unspecified',
+                                        title='test record for the index',
+                                        year=1012, doi='10.0000/Index.Test')
+        potdb.save_citation(record)
+        assert potdb.fetch_citation('10.0000/index.test').title == 'test record for the index'
+        potdb.delete_citation(citation=record)
+        assert potdb.citation_index().find('10.0000/index.test') is None
+
+        # Files added to the local library by other means refresh the index
+        index = potdb.citation_index()
+        time.sleep(0.01)
+        record.build_model()
+        Path(tmp_path, 'Citation', f'{record.name}.json').write_text(record.model.json(),
+                                                                     encoding='UTF-8')
+        assert potdb.citation_index() is not index
+        assert potdb.citation_index().find('10.0000/index.test') is not None
+
+        # Index misses are searched for in the remote by DOI, then by name
+        queries = []
+        def get_citation(local, remote, prompt, verbose, **kwargs):
+            assert (local, remote, prompt) == (False, True, False)
+            queries.append(kwargs)
+            if 'name' in kwargs:
+                return record
+            raise ValueError('no match')
+        potdb.get_citation = get_citation
+        assert potdb.fetch_citation('10.0000/index.test', remote=True) is not None
+        assert queries == []
+        assert potdb.fetch_citation('10.0000/Remote', remote=True) is record
+        assert queries == [{'doi': '10.0000/Remote'}, {'name': '10.0000/Remote'}]
+
+        # fetch_citations searches the remote for all misses in two queries
+        index = potdb.citation_index()
+        queries.clear()
+        def get_citations(local, remote, verbose, **kwargs):
+            assert (local, remote) == (False, True)
+            queries.append(kwargs)
+            key = 'doi' if 'doi' in kwargs else 'name'
+            return [index.find(value) for value in kwargs[key] if index.find(value) is not None]
+        potdb.get_citations = get_citations
+        dois = ['10.1080/14786430903260727', '1776--last-name-f-m',
+                '10.1080/14786430903260727'.upper(), '1776--last-name-f-m']
+        records = potdb.fetch_citations(dois, local=False, remote=True)
+        assert records[0] is records[2]
+        assert records[1].year == 1776
+        assert queries == [{'doi': ['10.1080/14786430903260727', '1776--last-name-f-m']},
+                           {'name': ['1776--last-name-f-m']}]
+
     def test_get_singular(self):
         potdb = self.potdb
 
@@ -0,0 +1,408 @@
+import asyncio
+import json
+from pathlib import Path
+import shutil
+
+import pandas as pd
+
+import potentials
+
+import pytest
+
+from common_values import testdb_host
+
+
+@pytest.fixture
+def potdb(tmp_path):
+    """Database using a disposable copy of the test database as the local"""
+    localpath = Path(tmp_path, 'testdb')
+    shutil.copytree(testdb_host, localpath)
+    return potentials.Database(localpath=localpath, remote=False)
+
+
+@pytest.fixture
+def mirrordb(tmp_path):
+    """Database with an empty local and the test database as the remote"""
+    localpath = Path(tmp_path, 'mirror')
+    localpath.mkdir()
+    return potentials.Database(localpath=localpath, remote_style='local',
+                               remote_host=testdb_host)
+
+
+class TestDatabase():
+
+    def test_lazy_get_records(self, potdb):
+        """Test retrieving LazyRecord proxies"""
+        records, df = potdb.get_records('Citation', return_df=True)
+        lazyrecords, lazydf = potdb.get_records('Citation', return_df=True, lazy=True)
+
+        assert len(lazyrecords) == len(records)
+        assert lazydf.name.tolist() == df.name.tolist()
+
+        # Metadata and name access does not load the record
+        lazy = lazyrecords[0]
+        assert lazy.name == records[0].name
+        assert lazy.metadata()['title'] == records[0].title
+        assert not lazy.loaded
+        assert len(potdb.record_pool) == 0
+
+        # Other attributes load the full record
+        assert lazy.model.json() == records[0].model.json()
+        assert lazy.loaded
+        assert len(potdb.record_pool) == 1
+
+        # New proxies reuse pooled records
+        lazyrecords = potdb.get_records('Citation', lazy=True)
+        assert lazyrecords[0].record is lazy.record
+
+    def test_record_pool(self, potdb):
+        """Test that the record pool is limited and kept consistent"""
+        potdb.record_pool.maxsize = 2
+        for lazy in potdb.get_records('Potential', lazy=True):
+            lazy.record
+        assert len(potdb.record_pool) == 2
+
+        record = potdb.get_records('Potential', lazy=True)[-1].record
+        potdb.save_record(record, overwrite=True)
+        assert len(potdb.record_pool) == 1
+
+    def test_parallel_cache(self, potdb):
+        """Test that the parallel metadata cache matches a serial build"""
+        potdb.get_records('Potential', refresh_cache=True)
+        records, df = potdb.get_records('Potential', return_df=True)
+        pcache = potdb.update_local_cache('Potential', refresh=True, max_workers=2)
+        assert pcache.name.tolist() == df.name.tolist()
+
+        precords, pdf = potdb.get_records('Potential', return_df=True,
+                                          refresh_cache=True, max_workers=2)
+        assert pdf.equals(df)
+        assert [r.name for r in precords] == [r.name for r in records]
+
+    def test_download_all(self, mirrordb, capsys):
+        """Test that the concurrent stages download all record styles"""
+        mirrordb.download_all(downloadfiles=False, verbose=True)
+        out = capsys.readouterr().out
+        assert 'Stage timing breakdown' in out
+
+        styles = ['Citation', 'Potential', 'potential_LAMMPS', 'potential_LAMMPS_KIM']
+        for style in styles:
+            l_df = mirrordb.get_records(style, remote=False, return_df=True)[1]
+            r_df = mirrordb.get_records(style, local=False, return_df=True)[1]
+            assert len(l_df) > 0
+            assert l_df.name.tolist() == r_df.name.tolist()
+
+        # The messages of each stage are printed together in stage order
+        lines = out.splitlines()
+        starts = [lines.index(f'{style}:') for style in styles]
+        assert starts == sorted(starts)
+        for style, start in zip(styles, starts):
+            assert lines[start + 1].startswith('Found')
+            assert lines[start + 1].endswith(f' {style} records in remote library')
+
+    def test_download_all_errors(self, mirrordb):
+        """Test that the failures of all concurrent stages are reported"""
+        def fail(**kwargs):
+            raise ValueError('no remote')
+        mirrordb.download_citations = fail
+        with pytest.raises(ValueError, match='no remote'):
+            mirrordb.download_all(downloadfiles=False)
+
+        mirrordb.download_potentials = fail
+        with pytest.raises(RuntimeError, match='Citation .* Potential '):
+            mirrordb.download_all(downloadfiles=False)
+
+    def test_incremental_download(self, mirrordb, capsys):
+        """Test that incremental downloads only write changed records"""
+        mirrordb.download_citations(incremental=True)
+        capsys.readouterr()
+
+        # Nothing to do on a repeated sync
+        mirrordb.download_citations(incremental=True, verbose=True)
+        out = capsys.readouterr().out
+        assert '0 new records added' in out
+        assert '0 changed records updated' in out
+        assert '3 unchanged records skipped' in out
+
+        # Modified and extra local records are detected
+        citation = mirrordb.get_citations(remote=False)[0]
+        model = citation.build_model()
+        model['citation']['title'] = 'Modified title'
+        mirrordb.save_record(style='Citation', name=citation.name,
+                             model=model, overwrite=True)
+        citation = mirrordb.get_citations(remote=False)[1]
+        mirrordb.save_record(style='Citation', name='extra',
+                             model=citation.model, overwrite=True)
+        mirrordb.download_citations(incremental=True, prune=True, verbose=True)
+        out = capsys.readouterr().out
+        assert '1 changed records updated' in out
+        assert '1 records missing from remote deleted' in out
+
+        l_recs = mirrordb.get_citations(remote=False)
+        r_recs = mirrordb.get_citations(local=False)
+        assert [r.model.json() for r in l_recs] == [r.model.json() for r in r_recs]
+
+    def test_save_records(self, potdb, tmp_path):
+        """Test batch saving records with a single cache update"""
+        records = potdb.get_records('Citation')
+        db = potentials.Database(localpath=Path(tmp_path, 'new'), remote=False)
+        report = db.save_records(records)
+        assert len(report['added']) == len(records)
+        assert sorted(Path(tmp_path, 'new').glob('**/*.tmp')) == []
+
+        cache = pd.read_csv(Path(tmp_path, 'new', 'Citation.csv'))
+        assert cache.name.tolist() == [r.name for r in records]
+
+        # Existing records are skipped or updated with fresh metadata
+        report = db.save_records(records)
+        assert len(report['skipped']) == len(records)
+
+        model = records[0].build_model()
+        model['citation']['title'] = 'Modified title'
+        record = potentials.load_record('Citation', model=model,
+                                        name=records[0].name)
+        report = db.save_records([record], overwrite=True)
+        assert report['updated'] == [record.name]
+        assert db.get_citation(name=record.name).title == 'Modified title'
+        df = db.get_citations(return_df=True)[1]
+        assert df.title.tolist()[0] == 'Modified title'
+
+    def test_related_models(self, potdb):
+        """Test adding, joining, looking up and saving related models"""
+        Path(potdb.local_database.host, 'related-interactions.json').write_text('{}')
+        potdb.add_related_models('pot1', ['Al', 'Al-Ni'], ['pot2', None])
+        potdb.add_related_models('pot3', 'Al', 'pot4')
+        potdb.add_related_models('pot5', 'Ni-Al')
+        potdb.add_related_models('pot5', 'Al-Ni', 'pot1')
+        assert potdb.related_models['Al'] == [['pot1', 'pot2'], ['pot3', 'pot4']]
+
+        # The dict is cached until the related models change
+        related_models = potdb.related_models
+        assert potdb.related_models is related_models
+
+        # Joined sets are listed last
+        potdb.add_related_models('pot0', 'Al')
+        potdb.add_related_models('pot4', 'Al', 'pot2')
+        assert potdb.related_models['Al'] == [['pot0'], ['pot3', 'pot4', 'pot1', 'pot2']]
+        assert potdb.related_models is not related_models
+        assert potdb.get_related_models('pot3') == {'Al': ['pot4', 'pot1', 'pot2']}
+        assert potdb.get_related_models('pot1') == {'Al': ['pot3', 'pot4', 'pot2'],
+                                                    'Al-Ni': ['pot5']}
+
+        # The set containing potid is listed first even if it is smaller
+        potdb.add_related_models('pot0', 'Al', 'pot1')
+        assert potdb.related_models['Al'] == [['pot0', 'pot3', 'pot4', 'pot1', 'pot2']]
+        with pytest.raises(ValueError):
+            potdb.get_related_models('pot6')
+
+        # Saved and reloaded in the JSON layout
+        potdb.add_related_models('pot6', 'Ag')
+        potdb.sort_related_models()
+        potdb.save_related_models()
+        potdb.load_related_models()
+        assert isinstance(potdb.related_models, dict)
+        assert list(potdb.related_models) == ['Ag', 'Al', 'Al-Ni']
+        assert potdb.related_models == {
+            'Ag': [['pot6']],
+            'Al': [['pot0', 'pot1', 'pot2', 'pot3', 'pot4']],
+            'Al-Ni': [['pot1', 'pot5']]}
+
+    def test_async_database(self, mirrordb):
+        """Test that AsyncDatabase calls run concurrently with the same results"""
+        async def query(adb):
+            return await asyncio.gather(
+                adb.get_citations(return_df=True),
+                adb.get_potentials(local=False),
+                adb.get_records('FAQ', remote=False))
+
+        adb = potentials.AsyncDatabase(mirrordb, max_connections=2)
+        (citations, df), potentials_, faqs = asyncio.run(query(adb))
+        adb.close()
+
+        assert df.equals(mirrordb.get_citations(return_df=True)[1])
+        assert [p.name for p in potentials_] == [p.name for p in mirrordb.get_potentials()]
+        assert len(faqs) == 0
+        assert adb.uses_network('download_citations', {})
+        assert not adb.uses_network('get_citations', {'remote': False})
+
+    def test_async_database_arguments(self, mirrordb):
+        """Test that AsyncDatabase classifies bound calls and never prompts"""
+        adb = potentials.AsyncDatabase(mirrordb, max_connections=1)
+        calls = []
+        uses_network = adb.uses_network
+        def spy(name, kwargs):
+            calls.append(uses_network(name, kwargs))
+            return calls[-1]
+        adb.uses_network = spy
+
+        async def query():
+            # local and remote given positionally
+            await adb.get_records('FAQ', None, True, False)
+            await adb.get_records('FAQ', None, False, True)
+            with pytest.raises(ValueError):
+                await adb.get_citation(prompt=True)
+            return await adb.get_citation(local=False)
+
+        with pytest.raises(ValueError, match='Multiple matching records'):
+            asyncio.run(query())
+        adb.close()
+        assert calls == [False, True, True]
+
+    def test_iter_records(self, mirrordb):
+        """Test streaming remote records in pages"""
+        names = [r.name for r in mirrordb.get_citations(local=False)]
+        pages = list(mirrordb.iter_records('Citation', page_size=2, batches=True))
+        assert [len(page) for page in pages] == [2, 1]
+        assert [r.name for page in pages for r in page] == names
+
+        records = mirrordb.iter_records('Citation', page_size=1)
+        assert next(records).name == names[0]
+        records.close()
+
+        records = mirrordb.download_citations(page_size=2, return_records=True)
+        assert [r.name for r in records] == names
+        assert len(mirrordb.get_citations(remote=False)) == len(names)
+
+    def test_query_cache(self, potdb):
+        """Test caching query results and invalidating them on changes"""
+        assert potdb.query_cache is None
+        potdb.enable_query_cache(maxsize=2)
+        cache = potdb.query_cache
+
+        records = potdb.get_citations()
+        again = potdb.get_citations(verbose=True)
+        assert cache.misses == 1 and cache.hits == 1
+        assert [r.name for r in again] == [r.name for r in records]
+
+        # Equivalent parameter values share a result
+        name = records[0].name
+        potdb.get_citations(name=name)
+        potdb.get_citations(name=[name])
+        assert cache.hits == 2
+        potdb.get_records('Citation', return_df=True)
+        potdb.get_records('Citation', return_df=True, max_workers=2)
+        assert cache.hits == 3
+
+        # Saving a record invalidates results of its style only
+        potdb.get_potentials()
+        model = records[0].build_model()
+        model['citation']['title'] = 'Modified title'
+        record = potentials.load_record('Citation', model=model, name=name)
+        potdb.save_citation(record, overwrite=True)
+        assert len(cache) == 1
+        assert potdb.get_citation(name=name).title == 'Modified title'
+
+        # Least recently used results are dropped
+        potdb.get_citations()
+        potdb.get_actions()
+        assert len(cache) == 2
+
+        # Calls that may prompt for a selection are not cached
+        potdb.enable_query_cache()
+        potdb.get_citation(name=name, prompt=True)
+        numcached = len(potdb.query_cache)
+        potdb.get_citation(name=name, prompt=True)
+        assert len(potdb.query_cache) == numcached
+        assert potdb.get_citation(name=name, prompt=False).name == name
+        assert len(potdb.query_cache) == numcached + 1
+
+        potdb.disable_query_cache()
+        assert potdb.query_cache is None
+
+    def test_query_cache_ttl(self, potdb):
+        """Test that cached query results expire"""
+        now = [1000.0]
+        potdb.enable_query_cache(ttl=10, clock=lambda: now[0])
+        potdb.get_citations()
+        potdb.get_citations()
+        now[0] += 11
+        potdb.get_citations()
+        assert potdb.query_cache.hits == 1
+        assert potdb.query_cache.misses == 2
+
+    def test_tracing(self, mirrordb, tmp_path, caplog):
+        """Test timing spans of Database operations"""
+        from potentials.tools import instrumentation
+        assert instrumentation.span('unused') is instrumentation.span('other')
+
+        fname = Path(tmp_path, 'trace.json')
+        with caplog.at_level('DEBUG', logger='potentials.trace'):
+            with potentials.tools.tracing(fname, logger='potentials.trace') as tracer:
+                mirrordb.get_citations()
+                mirrordb.download_citations(page_size=2)
+        assert potentials.tools.instrumentation.get_tracer() is None
+
+        spans = {span.name: span for span in tracer.spans}
+        assert spans['Database.get_records'].attrs['style'] == 'Citation'
+        assert spans['remote query'].parent is spans['Database.get_records']
+        assert spans['remote query'].attrs['count'] == 3
+        assert spans['remote page'].parent is spans['Database.download_records']
+        assert spans['Database.download_records'].parent is spans['Database.download_citations']
+        assert all(span.duration >= 0 for span in tracer.spans)
+        assert 'Database.download_citations' in tracer.summary().name.tolist()
+
+        trace = json.loads(fname.read_text())
+        assert len(trace['traceEvents']) == len(tracer.spans)
+        assert '  remote query' in caplog.text
+
+    def test_potential_index(self, potdb):
+        """Test that indexed potential searches match pandasfilter"""
+        from potentials.Database.PotentialIndex import PotentialIndex
+        potentials_, df = potdb.get_potentials(return_df=True)
+        index = PotentialIndex(potentials_, df)
+        assert index.ids == df.id.tolist()
+
+        record = potentials.load_record('Potential')
+        searches = [{}] + [{'elements': e} for e in index.elements]
+        searches += [{'year': y} for y in index.years]
+        searches += [{'author': a} for a in index.surnames]
+        searches += [{'elements': index.elements[:2], 'year': index.years[0]}]
+        for search in searches:
+            elements = search.get('elements', None)
+            matches = df[
+                record.pandasfilter(df, author=search.get('author', None),
+                                    year=search.get('year', None))
+                & (record.pandasfilter(df, elements=elements)
+                   | record.pandasfilter(df, fictionalelements=elements))]
+            assert index.search(**search) == matches.id.tolist()
+
+        potid = index.ids[0]
+        assert index.record(potid) is potentials_[0]
+        assert index.html(potid) is index.html(potid)
+        assert index.html('missing') is None
+
+    def test_render_html(self, potdb, tmp_path):
+        """Test batch rendering of record html pages"""
+        records = list(potdb.get_citations()) + list(potdb.get_potentials())
+        dest = Path(tmp_path, 'html')
+        fnames = potdb.render_html(records, dest, max_workers=2)
+
+        assert len(fnames) == len(records)
+        for record, fname in zip(records, fnames):
+            assert fname == Path(dest, record.style, f'{record.name}.html')
+            assert fname.read_text(encoding='UTF-8') == record.html()
+        index = Path(dest, 'Citation', 'index.html').read_text(encoding='UTF-8')
+        assert f'{records[0].name}.html' in index
+
+    def test_validate_records(self, potdb, tmp_path, capsys):
+        """Test batch and incremental schema validation"""
+        records = list(potdb.get_actions()) + list(potdb.get_citations())
+        errors = potdb.validate_records(records)
+        assert errors.columns.tolist() == ['style', 'name', 'line', 'column', 'message']
+        invalid = [r.name for r in records if not r.valid_xml()]
+        assert sorted(set(errors.name)) == sorted(invalid)
+        assert len(potdb.validation_cache) == len(records) - len(invalid)
+
+        # Only changed and invalid records are checked again
+        cache_file = Path(tmp_path, 'validated.json')
+        assert len(potdb.validate_records(records, max_workers=2,
+                                          cache_file=cache_file)) == len(errors)
+        db = potentials.Database(localpath=potdb.local_database.host, remote=False)
+        model = records[-1].build_model()
+        model['citation']['title'] = 'Modified title'
+        records[-1] = potentials.load_record('Citation', model=model,
+                                             name=records[-1].name)
+        capsys.readouterr()
+        db.validate_records(records, incremental=True, cache_file=cache_file,
+                            verbose=True)
+        numskipped = len(records) - len(invalid) - 1
+        assert f'{numskipped} unchanged valid records skipped' in capsys.readouterr().out
@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import potentials
+
+import pytest
+
+from benchmarks.cdcs_standin import CDCSStandIn, mongo_match
+from benchmarks.synthetic import generate_repository
+
+
+@pytest.fixture(scope='module')
+def synthdb(tmp_path_factory):
+    """Small synthetic repository generated with a fixed seed"""
+    host = Path(tmp_path_factory.mktemp('synth'), 'synthdb')
+    generate_repository(host, numpotentials=4, numcitations=25, numkim=2,
+                        artifact_size=10, seed=1)
+    return host
+
+
+@pytest.fixture
+def cdcsdb(synthdb, tmp_path):
+    """Database with an empty local and a CDCS stand-in as the remote"""
+    with CDCSStandIn(synthdb) as server:
+        yield potentials.Database(localpath=Path(tmp_path, 'mirror'),
+                                  remote_host=server.url, remote_style='cdcs',
+                                  remote_terms={'username': ''})
+
+
+styles = ['Citation', 'Potential', 'potential_LAMMPS', 'potential_LAMMPS_KIM']
+
+
+class TestCDCSRemote():
+
+    def test_generate_repository(self, synthdb, tmp_path):
+        """Test the record counts and reproducibility of the generator"""
+        counts = {style: len(list(Path(synthdb, style).glob('*.json'))) for style in styles}
+        assert counts == {'Citation': 25, 'Potential': 4, 'potential_LAMMPS': 4,
+                          'potential_LAMMPS_KIM': 2}
+        assert len(list(Path(synthdb, 'potential_LAMMPS').glob('*/*'))) >= 4
+        fullids = Path(synthdb, 'kim_models.txt').read_text(encoding='UTF-8').split()
+        assert len(fullids) == 2
+
+        # The same seed generates the same records
+        host = Path(tmp_path, 'synthdb')
+        assert generate_repository(host, numpotentials=4, numcitations=25,
+                                   numkim=2, artifact_size=10, seed=1) == fullids
+        for style in styles:
+            for fname in Path(synthdb, style).glob('*.json'):
+                assert Path(host, style, fname.name).read_text() == fname.read_text()
+
+    def test_remote_queries(self, cdcsdb, synthdb):
+        """Test that the stand-in answers queries like the local library"""
+        localdb = potentials.Database(localpath=synthdb, remote=False)
+        for style in styles:
+            records = cdcsdb.get_records(style, local=False)
+            assert len(records) == len(localdb.get_records(style))
+
+        # Filtered queries are evaluated by the stand-in's mongo matcher
+        potential = localdb.get_potentials()[0]
+        element = potential.elements[0]
+        names = sorted(r.name for r in localdb.get_potentials(elements=element))
+        records = cdcsdb.get_potentials(local=False, elements=element)
+        assert sorted(r.name for r in records) == names
+        assert 0 < len(names) < 4
+
+        pair_style = localdb.get_lammps_potentials()[0].pair_style
+        names = sorted(r.name for r in localdb.get_lammps_potentials(pair_style=pair_style))
+        records = cdcsdb.get_lammps_potentials(local=False, pair_style=pair_style)
+        assert sorted(r.name for r in records) == names
+        assert len(names) > 0
+
+        record = cdcsdb.get_citation(name=localdb.get_citations()[3].name,
+                                     local=False)
+        assert record.doi == localdb.get_citations()[3].doi
+
+    def test_mongo_match(self):
+        """Test the stand-in's evaluation of mongo queries"""
+        content = {'a': {'b': [{'c': 1}, {'c': 'x2'}]}, 'd': 5}
+        assert mongo_match(content, {'a.b.c': 1})
+        assert mongo_match(content, {'a.b.c': '1'})
+        assert not mongo_match(content, {'a.b.c': 3})
+        assert mongo_match(content, {'a.b.c': {'$in': [3, 'x2']}})
+        assert mongo_match(content, {'a.b.c': {'$regex': '^x', '$options': 'i'}})
+        assert mongo_match(content, {'d': {'$gte': 5, '$lt': 6}})
+        assert not mongo_match(content, {'d': {'$gt': 5}})
+        assert mongo_match(content, {'e': {'$exists': False}})
+        assert not mongo_match(content, {'e': {'$exists': True}})
+        assert mongo_match(content, {'$or': [{'d': 4}, {'a.b.c': 1}]})
+        assert not mongo_match(content, {'$and': [{'d': 5}, {'a.b.c': 2}]})
+
+    def test_iter_records(self, cdcsdb, synthdb):
+        """Test streaming records from a CDCS remote in pages"""
+        names = sorted(path.stem for path in Path(synthdb, 'Citation').glob('*.json'))
+        pages = list(cdcsdb.iter_records('Citation', page_size=10, batches=True))
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert [r.name for page in pages for r in page] == names
+
+        # Pages of multiple server pages and without prefetching
+        pages = list(cdcsdb.iter_records('Citation', page_size=20, batches=True,
+                                         prefetch_pages=0))
+        assert [len(page) for page in pages] == [20, 5]
+        records = cdcsdb.iter_records('Citation', page_size=10)
+        assert [r.name for r in records] == names
+
+    def test_iter_records_error(self, cdcsdb):
+        """Test that a failed page request reaches the consumer"""
+        cdcs = cdcsdb.remote_database.cdcs
+        query = cdcs.query
+        def failing_query(page=1, **kwargs):
+            if page == 2:
+                raise ConnectionError('page 2 failed')
+            return query(page=page, **kwargs)
+        cdcs.query = failing_query
+
+        records = cdcsdb.iter_records('Citation', page_size=10)
+        names = [next(records).name for i in range(10)]
+        assert len(set(names)) == 10
+        with pytest.raises(ConnectionError, match='page 2 failed'):
+            next(records)
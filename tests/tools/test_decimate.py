@@ -0,0 +1,36 @@
+from potentials.tools import decimate
+
+import numpy as np
+
+def test_decimate():
+
+    x = np.linspace(0, 10, 100001)
+    y = np.sin(20 * x)
+    y[5000] = 50.0
+    newx, newy = decimate(x, y, 1000)
+
+    assert len(newx) <= 1000
+    assert np.all(np.diff(newx) > 0)
+    assert newx[0] == x[0] and newx[-1] == x[-1]
+    assert newy.max() == 50.0
+    assert np.isclose(newy.min(), -1.0)
+
+    # Short curves are returned as given
+    newx, newy = decimate(x[:10], y[:10], 1000)
+    assert len(newx) == 10
+
+    # Points outside xlim are removed before decimating
+    newx, newy = decimate(x, y, 1000, xlim=(2.0, 3.0))
+    assert len(newx) <= 1000
+    assert newx[0] < 2.0 and newx[1] >= 2.0
+    assert newx[-1] > 3.0 and newx[-2] <= 3.0
+    inside = (x >= 2.0) & (x <= 3.0)
+    assert len(newx) > 900
+    assert np.isclose(newy.max(), y[inside].max())
+
+    # NaN values do not hide the min and max of their bins
+    y[0] = np.nan
+    newx, newy = decimate(x, y, 1000)
+    assert np.nanmax(newy) == 50.0
+    assert np.isclose(np.nanmin(newy), -1.0)
+    assert np.isnan(newy[0])
@@ -0,0 +1,23 @@
+from potentials.tools import numderivative
+
+import numpy as np
+
+def recursive_numderivative(x, y, n=1):
+    # The previous implementation that differences once per call
+    if n == 0:
+        return x, y
+    deltax = x[1] - x[0]
+    newx = x[:-1] + deltax / 2
+    newy = (y[1:] - y[:-1]) / deltax
+    return recursive_numderivative(newx, newy, n=n-1)
+
+def test_numderivative():
+
+    x = np.linspace(0.0, 5.0, 501)
+    y = np.sin(x) * np.exp(-x / 3)
+    for n in range(5):
+        newx, newy = numderivative(x, y, n=n)
+        oldx, oldy = recursive_numderivative(x, y, n=n)
+        assert len(newx) == len(newy) == len(x) - n
+        assert np.allclose(newx, oldx, rtol=1e-12, atol=1e-12)
+        assert np.allclose(newy, oldy, rtol=1e-8, atol=1e-8)